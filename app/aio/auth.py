@@ -0,0 +1,17 @@
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.auth import check_active, oauth2_scheme, token_subject
+from app.cache import principal_cache
+from app.dependencies import get_async_db
+from app.models import User
+
+
+async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)) -> User:
+    return await load_user(db, token_subject(token))
+
+
+async def load_user(db: AsyncSession, user_id: str) -> User:
+    cached = principal_cache.user(user_id) if principal_cache else None
+    if cached is not None:
+        return await db.merge(cached, load=False)
+    return check_active(await db.get(User, user_id))
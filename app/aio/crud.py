@@ -0,0 +1,131 @@
+"""Async counterparts of ``app.crud`` for AsyncSession, sharing its statement builders."""
+from datetime import date, datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud import (
+    _assign_bulk_ids, _buffer_audit, _bulk_predictions, _bulk_upsert_assessments_stmt, bulk_upsert_predictions_stmt,
+    _prepare_bulk_rows, _rebuild_summary_stmts, _record_summary_stmt, _rolling_summaries_stmt, _scores,
+    _seed_summary_stmt, _summary_delta, _summary_lookup_stmt, _upsert_assessment_stmt, _upsert_prediction_stmt,
+    _usable, _window_stmt,
+)
+from app.cache import invalidate_dashboard, invalidate_user
+from app.models import User, DailySummaryRolling7D, AuditLog
+from app.schemas import DailyAssessmentIn
+
+
+async def _save(db: AsyncSession) -> None:
+    """Commit, or only flush when the caller runs inside ``dependencies.async_unit_of_work``."""
+    if db.info.get("unit_of_work"):
+        await db.flush()
+    else:
+        await db.commit()
+
+
+async def create_user(db: AsyncSession, email: str, password_hash: str, full_name: str) -> User:
+    user = User(email=email, password_hash=password_hash, full_name=full_name)
+    db.add(user)
+    await _save(db)
+    return user
+
+
+async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
+    return (await db.scalars(select(User).filter_by(email=email))).first()
+
+
+async def update_user(db: AsyncSession, user: User, full_name: Optional[str] = None) -> User:
+    if full_name:
+        user.full_name = full_name
+    invalidate_user(db.sync_session, user.id)
+    await _save(db)
+    return user
+
+
+async def set_password(db: AsyncSession, user: User, password_hash: str) -> User:
+    user.password_hash = password_hash
+    invalidate_user(db.sync_session, user.id)
+    await _save(db)
+    return user
+
+
+async def record_login(db: AsyncSession, user: User, password_hash: Optional[str] = None) -> User:
+    user.last_login = datetime.utcnow()
+    if password_hash:
+        user.password_hash = password_hash
+    invalidate_user(db.sync_session, user.id)
+    await _save(db)
+    return user
+
+
+async def log_action(db: AsyncSession, user_id: str, action: str, details: str = "") -> None:
+    if _buffer_audit(db, user_id, action, details):
+        return
+    db.add(AuditLog(user_id=user_id, action=action, details=details))
+    await _save(db)
+
+
+async def add_assessment_and_prediction(
+    db: AsyncSession,
+    user: User,
+    data: DailyAssessmentIn,
+    prediction_result: Optional[dict] = None,
+):
+    scores = _scores(data)
+    assessment, inserted, *old_scores = (await db.execute(_upsert_assessment_stmt(user.id, data))).one()
+    delta = _summary_delta(scores, inserted, old_scores)
+    if delta is None:
+        clear, fill = _rebuild_summary_stmts([user.id], assessment.date)
+        await db.execute(clear)
+        await db.execute(fill)
+    else:
+        await db.execute(_record_summary_stmt(user.id, assessment.date, delta[1], count=delta[0]))
+
+    prediction = None
+    if prediction_result:
+        prediction = (await db.scalars(_upsert_prediction_stmt(assessment, prediction_result))).one()
+        invalidate_dashboard(db.sync_session, user.id)
+
+    await _save(db)
+    return assessment, prediction
+
+
+async def compute_rolling_summary(db: AsyncSession, user: User,
+                                  as_of: Optional[date] = None) -> Optional[DailySummaryRolling7D]:
+    day = as_of or date.today()
+    summary = (await db.scalars(_summary_lookup_stmt(user.id, day))).first()
+    if summary is None:
+        count, *sums = (await db.execute(_window_stmt(user.id, day))).one()
+        summary = (await db.scalars(_seed_summary_stmt(user.id, day, count, sums))).one()
+        await _save(db)
+    return _usable(summary)
+
+
+async def add_assessments_and_predictions_bulk(
+    db: AsyncSession,
+    rows: List[dict],
+    score: Callable[[list], list],
+) -> Tuple[int, int, int]:
+    rows, latest = _prepare_bulk_rows(rows)
+    _assign_bulk_ids(rows, await db.execute(_bulk_upsert_assessments_stmt(), rows))
+
+    clear, fill = _rebuild_summary_stmts(list(latest), min(row["date"] for row in rows))
+    await db.execute(clear)
+    await db.execute(fill)
+    summaries: Dict[str, DailySummaryRolling7D] = {
+        summary.user_id: summary
+        for summary in await db.scalars(
+            _rolling_summaries_stmt({user_id: row["date"] for user_id, row in latest.items()})
+        )
+    }
+    # Scoring up to 10k rows is CPU work; keep it off the event loop
+    predictions = await run_in_threadpool(_bulk_predictions, latest, summaries, score)
+    if predictions:
+        await db.execute(bulk_upsert_predictions_stmt(), predictions)
+        for prediction in predictions:
+            invalidate_dashboard(db.sync_session, prediction["user_id"])
+
+    await _save(db)
+    return len(rows), len(latest), len(predictions)
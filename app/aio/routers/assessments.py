@@ -0,0 +1,122 @@
+import asyncio
+from datetime import date
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from app.schemas import AssessmentPage, DailyAssessmentIn, BulkAssessmentIn, BulkAssessmentOut
+from app.dependencies import get_async_db, get_async_engine, async_unit_of_work
+from app.export import ENCODERS, export_columns, export_response, history_stmt, stream_export_async
+from app.aio.auth import get_current_user
+from app.aio.crud import (
+    add_assessment_and_prediction, add_assessments_and_predictions_bulk, compute_rolling_summary, log_action
+)
+from app.predict import predict_burnout, predict_burnout_batch
+from app.batching import batcher
+from app.models import User
+from app.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, assessment_page_stmt, build_assessment_page
+
+router = APIRouter(prefix="/assessments", tags=["assessments"])
+
+
+@router.get("/", response_model=AssessmentPage)
+async def list_assessments(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current: User = Depends(get_current_user)
+):
+    """The caller's assessments, newest first; follow next_cursor for older pages."""
+    rows = (await db.execute(assessment_page_stmt(current.id, cursor, start, end, limit))).all()
+    return build_assessment_page(rows, limit)
+
+
+@router.post("/")
+async def submit_daily_assessment(
+    data: DailyAssessmentIn,
+    db: AsyncSession = Depends(get_async_db),
+    current: User = Depends(get_current_user)
+):
+    async with async_unit_of_work(db):
+        summary = await compute_rolling_summary(db, current)
+
+        if not summary:
+            assess, _ = await add_assessment_and_prediction(db, current, data, None)
+            await log_action(db, current.id, "submit_assessment", details=f"assess_id={assess.id}")
+            return {
+                "burnout_risk": None,
+                "confidence": None,
+                "message": "Assessment saved. Burnout prediction will be available after 7 entries."
+            }
+
+        features = (
+            summary.avg_tired_last_7_days,
+            summary.avg_capable_last_7_days,
+            summary.avg_meaningful_last_7_days,
+        )
+        if batcher:
+            pred = await batcher.predict_async(*features)
+        else:
+            # Lazy model loading and scoring are CPU work; keep them off the event loop
+            pred = await asyncio.to_thread(predict_burnout, *features)
+        assess, prediction = await add_assessment_and_prediction(db, current, data, pred)
+        await log_action(db, current.id, "submit_assessment", details=f"assess_id={assess.id}")
+    return {"burnout_risk": pred["burnout_risk"], "confidence": pred["confidence"]}
+
+
+@router.post("/bulk", response_model=BulkAssessmentOut)
+async def submit_bulk_assessments(
+    data: BulkAssessmentIn,
+    db: AsyncSession = Depends(get_async_db),
+    current: User = Depends(get_current_user)
+):
+    """Backfill dated assessments for the caller, or for any users when called by an admin."""
+    rows = [
+        {
+            "user_id": item.user_id or current.id,
+            "date": item.date,
+            "tired_score": item.tired_score,
+            "capable_score": item.capable_score,
+            "meaningful_score": item.meaningful_score,
+        }
+        for item in data.assessments
+    ]
+    user_ids = {row["user_id"] for row in rows}
+    if user_ids != {current.id}:
+        if not current.is_admin:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN,
+                                detail="Only admins can import assessments for other users")
+        known = set(await db.scalars(select(User.id).where(User.id.in_(user_ids))))
+        if known != user_ids:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,
+                                detail=f"Unknown user ids: {sorted(user_ids - known)}")
+    if max(row["date"] for row in rows) > date.today():
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                            detail="Assessments cannot be dated in the future")
+
+    async with async_unit_of_work(db):
+        inserted, users, predictions = await add_assessments_and_predictions_bulk(db, rows, predict_burnout_batch)
+        await log_action(db, current.id, "bulk_import_assessments", details=f"rows={inserted} users={users}")
+    return BulkAssessmentOut(inserted=inserted, users=users, predictions=predictions)
+
+
+@router.get("/export")
+async def export_history(
+    fmt: Literal["csv", "ndjson"] = Query("csv", alias="format"),
+    compress: bool = False,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    db: AsyncSession = Depends(get_async_db),
+    bind: AsyncEngine = Depends(get_async_engine),
+    current: User = Depends(get_current_user)
+):
+    """Download the caller's assessments and predictions as CSV or NDJSON, streamed (gzipped with compress=true)."""
+    stmt = history_stmt(current.id, start, end)
+    encoder = ENCODERS[fmt](export_columns(stmt))
+    async with async_unit_of_work(db):
+        await log_action(db, current.id, "export_history", details=f"format={fmt}")
+    return export_response(
+        stream_export_async(bind, stmt, encoder, compress), encoder, compress, "burnout-history"
+    )
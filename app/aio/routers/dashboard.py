@@ -0,0 +1,22 @@
+from datetime import date
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.schemas import DashboardOut
+from app.dependencies import get_async_db
+from app.auth import oauth2_scheme, token_subject
+from app.aio.auth import load_user
+from app.routers.dashboard import cached_dashboard, dashboard_predictions_stmt, dashboard_response
+
+router = APIRouter(prefix="/dashboard", tags=["dashboard"])
+
+
+@router.get("/", response_model=DashboardOut)
+async def dashboard(request: Request, token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)):
+    today = date.today()
+    # Checked before the cache too, so deactivated users stop getting the cached body
+    current = await load_user(db, token_subject(token))
+    cached = cached_dashboard(request, current.id, today)
+    if cached is not None:
+        return cached
+    predictions = (await db.scalars(dashboard_predictions_stmt(current.id, today))).all()
+    return dashboard_response(request, current.id, today, predictions)
@@ -0,0 +1,25 @@
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models import User
+from app.schemas import PredictionPage
+from app.dependencies import get_async_db
+from app.aio.auth import get_current_user
+from app.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, build_prediction_page, prediction_page_stmt
+
+router = APIRouter(prefix="/predictions", tags=["predictions"])
+
+
+@router.get("/", response_model=PredictionPage)
+async def list_predictions(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current: User = Depends(get_current_user)
+):
+    """The caller's predictions, newest first; follow next_cursor for older pages."""
+    rows = (await db.execute(prediction_page_stmt(current.id, cursor, start, end, limit))).all()
+    return build_prediction_page(rows, limit)
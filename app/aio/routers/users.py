@@ -0,0 +1,85 @@
+from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime, timedelta
+from jose import jwt
+from fastapi_mail import FastMail, MessageSchema, MessageType
+from app.schemas import UserCreate, TokenWithUser, PasswordResetRequest, PasswordResetComplete, UserOut, ProfileEdit
+from app.dependencies import get_async_db, async_unit_of_work
+from app.aio.crud import create_user, get_user_by_email, update_user, set_password, record_login, log_action
+from app.aio.auth import get_current_user
+from app.auth import create_access_token
+from app.hashing import password_hasher
+from app.config import settings
+from app.models import User
+from fastapi.security import OAuth2PasswordRequestForm
+
+router = APIRouter(prefix="/users", tags=["users"])
+
+@router.post("/register", response_model=UserOut)
+async def register_user(data: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    existing = await get_user_by_email(db, data.email)
+    if existing:
+        raise HTTPException(status_code=400, detail="Email already registered")
+    pw_hash = await password_hasher.hash_async(data.password)
+    async with async_unit_of_work(db):
+        user = await create_user(db, data.email, pw_hash, data.full_name)
+        await log_action(db, user.id, "register_user", f"email={user.email}")
+    return user
+
+@router.post("/login", response_model=TokenWithUser)
+async def login_user(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_async_db)):
+    user = await get_user_by_email(db, form_data.username)
+    verified, new_hash = (
+        await password_hasher.verify_and_update_async(form_data.password, user.password_hash) if user
+        else (False, None)
+    )
+    if not verified:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    token = create_access_token(user.id)
+    async with async_unit_of_work(db):
+        await record_login(db, user, new_hash)
+        await log_action(db, user.id, "login")
+    return {"access_token": token, "user": user}
+
+@router.post("/password-recover")
+async def recover_password(req: PasswordResetRequest, background_tasks: BackgroundTasks,
+                           db: AsyncSession = Depends(get_async_db)):
+    user = await get_user_by_email(db, req.email)
+    if not user:
+        raise HTTPException(status_code=404, detail="Email not registered")
+    token_expires = timedelta(minutes=settings.RESET_TOKEN_EXPIRE_MINUTES)
+    token = jwt.encode({"sub": user.id,
+                        "exp": datetime.utcnow() + token_expires},
+                       settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    reset_link = f"{settings.APP_HOST}/reset-password?token={token}"
+    message = MessageSchema(subject="Password Reset",
+                             recipients=[user.email],
+                             body=f"Click here: {reset_link}",
+                             subtype=MessageType.html)
+    fm = FastMail(settings)
+    background_tasks.add_task(fm.send_message, message)
+    async with async_unit_of_work(db):
+        await log_action(db, user.id, "recover_password")
+    return {"msg": "Password reset email sent"}
+
+@router.post("/password-reset")
+async def complete_reset(req: PasswordResetComplete, db: AsyncSession = Depends(get_async_db)):
+    try:
+        payload = jwt.decode(req.token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        user = await db.get(User, payload.get("sub"))
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid or expired token")
+    if user is None:
+        raise HTTPException(status_code=400, detail="Invalid or expired token")
+    pw_hash = await password_hasher.hash_async(req.new_password)
+    async with async_unit_of_work(db):
+        await set_password(db, user, pw_hash)
+        await log_action(db, user.id, "reset_password")
+    return {"msg": "Password updated"}
+
+@router.put("/profile", response_model=UserOut)
+async def edit_profile(data: ProfileEdit, current=Depends(get_current_user), db: AsyncSession = Depends(get_async_db)):
+    async with async_unit_of_work(db):
+        user = await update_user(db, current, full_name=data.full_name)
+        await log_action(db, user.id, "edit_profile", details=f"name={data.full_name}")
+    return user
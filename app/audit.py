@@ -0,0 +1,179 @@
+import logging
+import threading
+import time
+from collections import deque
+from typing import List, Optional
+
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.dependencies import engine
+from app.metrics import Histogram, metrics_registry
+from app.models import AuditLog
+
+logger = logging.getLogger(__name__)
+
+# Session.info key holding entries logged in a transaction that has not committed yet
+PENDING_KEY = "pending_audit"
+
+
+class AuditBuffer:
+    """
+    Bounded in-process buffer with a background writer for ``audit_logs``.
+
+    ``enqueue`` appends entries (plain dicts of AuditLog columns) and returns
+    straight away. A writer thread flushes them with one multi-row INSERT when
+    ``batch_size`` entries are waiting or ``flush_interval`` has passed. At most
+    ``max_entries`` are held: when the buffer is full a producer waits up to
+    ``enqueue_timeout`` for room (backpressure) and the entry is dropped if none
+    frees up. ``close`` drains everything still buffered.
+    """
+
+    def __init__(self, bind, max_entries: int = 10000, batch_size: int = 500,
+                 flush_interval_ms: float = 1000, enqueue_timeout_ms: float = 0):
+        self.bind = bind
+        self.max_entries = max(1, max_entries)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval_ms / 1000
+        self.enqueue_timeout = enqueue_timeout_ms / 1000
+        self._entries = deque()
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._closing = False
+        self._thread: Optional[threading.Thread] = None
+        self.counters = {
+            "enqueued": 0, "written": 0, "dropped": 0, "failed": 0, "flushes": 0, "backpressure_waits": 0,
+        }
+        self.flush_duration = Histogram(
+            "audit_flush_duration_seconds", "Time to write one batch of audit log entries",
+            [0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5],
+        )
+
+    def enqueue(self, entries: List[dict]) -> int:
+        """Buffer ``entries``; returns how many were accepted (the rest were dropped)."""
+        accepted = 0
+        with self._cond:
+            for entry in entries:
+                if len(self._entries) >= self.max_entries:
+                    self.counters["backpressure_waits"] += 1
+                    if not self._cond.wait_for(lambda: len(self._entries) < self.max_entries,
+                                               timeout=self.enqueue_timeout):
+                        self.counters["dropped"] += 1
+                        continue
+                self._entries.append(entry)
+                accepted += 1
+            self.counters["enqueued"] += accepted
+            if len(self._entries) >= self.batch_size:
+                self._cond.notify_all()
+        self._ensure_started()
+        return accepted
+
+    def flush(self) -> None:
+        """Write everything currently buffered from the calling thread."""
+        while True:
+            batch = self._take()
+            if not batch:
+                return
+            self._write(batch)
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Stop the writer after it has drained the buffer."""
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.flush()
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {**self.counters, "buffered": len(self._entries)}
+
+    def _ensure_started(self) -> None:
+        if self._thread is None and not self._closing:
+            with self._cond:
+                if self._thread is None and not self._closing:
+                    self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+                    self._thread.start()
+
+    def _take(self) -> List[dict]:
+        with self._cond:
+            batch = [self._entries.popleft() for _ in range(min(len(self._entries), self.batch_size))]
+            if batch:
+                # Wake producers waiting for room
+                self._cond.notify_all()
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._closing or len(self._entries) >= self.batch_size,
+                                    timeout=self.flush_interval)
+                closing = self._closing
+            batch = self._take()
+            if batch:
+                self._write(batch)
+            if closing and not batch:
+                return
+
+    def _write(self, batch: List[dict]) -> None:
+        started = time.perf_counter()
+        try:
+            with self._write_lock, self.bind.begin() as conn:
+                conn.execute(insert(AuditLog), batch)
+        except Exception:
+            logger.exception("Failed to write %d audit log entries", len(batch))
+            with self._cond:
+                self.counters["failed"] += len(batch)
+            return
+        elapsed = time.perf_counter() - started
+        self.flush_duration.observe(elapsed)
+        with self._cond:
+            self.counters["written"] += len(batch)
+            self.counters["flushes"] += 1
+        logger.debug("Flushed %d audit entries in %.1f ms", len(batch), elapsed * 1000)
+
+
+audit_buffer = (
+    AuditBuffer(
+        engine,
+        max_entries=settings.AUDIT_BUFFER_MAX_ENTRIES,
+        batch_size=settings.AUDIT_FLUSH_BATCH_SIZE,
+        flush_interval_ms=settings.AUDIT_FLUSH_INTERVAL_MS,
+        enqueue_timeout_ms=settings.AUDIT_ENQUEUE_TIMEOUT_MS,
+    )
+    if settings.AUDIT_BUFFERED else None
+)
+
+
+def _audit_metrics():
+    stats = audit_buffer.stats()
+    yield "audit_buffer_entries", "gauge", "Audit entries waiting to be written", [({}, stats["buffered"])]
+    yield "audit_entries_total", "counter", "Audit entries by outcome", [
+        ({"outcome": outcome}, stats[outcome]) for outcome in ("enqueued", "written", "dropped", "failed")
+    ]
+    yield "audit_flushes_total", "counter", "Batches written by the audit writer", [({}, stats["flushes"])]
+    yield "audit_backpressure_waits_total", "counter", "Enqueues that found the buffer full", [
+        ({}, stats["backpressure_waits"])
+    ]
+
+
+if audit_buffer is not None:
+    metrics_registry.histogram(audit_buffer.flush_duration)
+    metrics_registry.collector(_audit_metrics)
+
+
+# Entries logged inside a unit of work reference rows written in the same
+# transaction, so they are only handed to the writer once it commits.
+@event.listens_for(Session, "after_commit")
+def _enqueue_pending(session: Session) -> None:
+    pending = session.info.pop(PENDING_KEY, None)
+    if pending and audit_buffer is not None:
+        audit_buffer.enqueue(pending)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending(session: Session, previous_transaction) -> None:
+    session.info.pop(PENDING_KEY, None)
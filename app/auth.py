@@ -1,4 +1,3 @@
-from passlib.context import CryptContext
 from datetime import datetime, timedelta
 from jose import jwt, JWTError
 from fastapi import Depends, HTTPException, status
@@ -9,15 +8,16 @@ from .dependencies import get_db
 from .models import User
 from .schemas import TokenData
 from .crud import get_user_by_email
+from .hashing import password_hasher
+from .cache import principal_cache
 
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="login")
 
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    return password_hasher.hash(password)
 
 def verify_password(plain: str, hashed: str) -> bool:
-    return pwd_context.verify(plain, hashed)
+    return password_hasher.verify(plain, hashed)
 
 def create_access_token(user_id: str):
     expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -25,6 +25,22 @@ def create_access_token(user_id: str):
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
 def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
+    return load_user(db, token_subject(token))
+
+def token_subject(token: str) -> str:
+    """User id of a valid ``token``, from the principal cache when possible."""
+    user_id = principal_cache.subject(token) if principal_cache else None
+    return user_id if user_id is not None else decode_access_token(token)
+
+def load_user(db: Session, user_id: str) -> User:
+    cached = principal_cache.user(user_id) if principal_cache else None
+    if cached is not None:
+        return db.merge(cached, load=False)
+    user = db.query(User).filter(User.id == user_id).first()
+    return check_active(user)
+
+def decode_access_token(token: str) -> str:
+    """Verify ``token`` and return its subject (remembered in the principal cache)."""
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         user_id: str = payload.get("sub")
@@ -32,7 +48,18 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
     except JWTError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
-    user = db.query(User).filter(User.id == user_id).first()
+    if principal_cache:
+        principal_cache.remember_token(token, user_id, payload.get("exp"))
+    return user_id
+
+def check_active(user: User) -> User:
     if user is None or not user.is_active:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User inactive or not found")
+    if principal_cache:
+        principal_cache.remember_user(user)
     return user
+
+def get_current_admin(current: User = Depends(get_current_user)) -> User:
+    if not current.is_admin:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
+    return current
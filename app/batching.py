@@ -0,0 +1,141 @@
+import asyncio
+import logging
+import queue
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Optional
+
+from app.config import settings
+from app.metrics import Histogram, metrics_registry
+from app.predict import predict_burnout_batch
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+@dataclass
+class _Request:
+    features: tuple
+    model: Optional[str]
+    version: Optional[str]
+    future: Future = field(default_factory=Future)
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+class InferenceBatcher:
+    """
+    Micro-batching front end for ``predict_burnout``.
+
+    Callers (threadpool routes via ``predict``, async code via ``predict_async``)
+    enqueue a single row and wait on a future. One dispatcher thread takes the
+    first waiting request, keeps collecting until ``max_batch_size`` rows are
+    queued or ``max_wait`` has passed since that first request, then scores the
+    batch with one ``predict_burnout_batch`` call per model and resolves every
+    caller's future with its own row's result.
+    """
+
+    def __init__(self, max_batch_size: int = 64, max_wait_ms: float = 2.0):
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max_wait_ms / 1000
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self.batch_size = Histogram(
+            "inference_batch_size", "Rows scored per dispatched batch",
+            [1, 2, 4, 8, 16, 32, 64, 128, 256],
+        )
+        self.queue_wait = Histogram(
+            "inference_queue_wait_seconds", "Time a request waited before its batch was scored",
+            [0.0005, 0.001, 0.002, 0.005, 0.01, 0.025, 0.05, 0.1],
+        )
+
+    def submit(self, avg_tired: float, avg_capable: float, avg_meaningful: float,
+               model: Optional[str] = None, version: Optional[str] = None) -> Future:
+        """Enqueue one row and return a future resolving to its ``predict_burnout`` result."""
+        self._ensure_started()
+        request = _Request((avg_tired, avg_capable, avg_meaningful), model, version)
+        self._queue.put(request)
+        return request.future
+
+    def predict(self, avg_tired: float, avg_capable: float, avg_meaningful: float,
+                model: Optional[str] = None, version: Optional[str] = None) -> dict:
+        return self.submit(avg_tired, avg_capable, avg_meaningful, model, version).result()
+
+    async def predict_async(self, avg_tired: float, avg_capable: float, avg_meaningful: float,
+                            model: Optional[str] = None, version: Optional[str] = None) -> dict:
+        return await asyncio.wrap_future(self.submit(avg_tired, avg_capable, avg_meaningful, model, version))
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Score whatever is already queued, then stop the dispatcher thread."""
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+            self._thread = None
+
+    def stats(self) -> dict:
+        return {"batch_size": self.batch_size.snapshot(), "queue_wait_seconds": self.queue_wait.snapshot()}
+
+    def _ensure_started(self) -> None:
+        if self._thread is None:
+            with self._start_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="inference-batcher", daemon=True)
+                    self._thread.start()
+
+    def _collect(self, first: _Request):
+        batch, stopping = [first], False
+        deadline = first.enqueued_at + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                stopping = True
+                break
+            batch.append(item)
+        return batch, stopping
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is _STOP:
+                break
+            batch, stopping = self._collect(first)
+            self._dispatch(batch)
+
+    def _dispatch(self, batch) -> None:
+        started = time.perf_counter()
+        self.batch_size.observe(len(batch))
+        groups = defaultdict(list)
+        for request in batch:
+            self.queue_wait.observe(started - request.enqueued_at)
+            if not request.future.set_running_or_notify_cancel():
+                continue
+            groups[(request.model, request.version)].append(request)
+
+        for (model, version), requests in groups.items():
+            try:
+                results = predict_burnout_batch([r.features for r in requests], model=model, version=version)
+            except Exception as exc:
+                logger.exception("Batched inference failed for %d rows", len(requests))
+                for request in requests:
+                    request.future.set_exception(exc)
+                continue
+            for request, result in zip(requests, results):
+                request.future.set_result(result)
+
+
+batcher = (
+    InferenceBatcher(settings.INFERENCE_BATCH_MAX_SIZE, settings.INFERENCE_BATCH_MAX_WAIT_MS)
+    if settings.INFERENCE_BATCHING else None
+)
+if batcher is not None:
+    metrics_registry.histogram(batcher.batch_size)
+    metrics_registry.histogram(batcher.queue_wait)
@@ -0,0 +1,145 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Hashable, Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.config import settings
+from app.models import User
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe LRU mapping whose entries also expire after ``ttl_seconds``."""
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 60):
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl_seconds
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING or entry[0] <= now:
+                if entry is not _MISSING:
+                    del self._entries[key]
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, expires_at: Optional[float] = None) -> None:
+        """Store ``value``; ``expires_at`` (monotonic) can only shorten the TTL."""
+        expiry = time.monotonic() + self.ttl
+        if expires_at is not None:
+            expiry = min(expiry, expires_at)
+        with self._lock:
+            self._entries[key] = (expiry, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+class PrincipalCache:
+    """
+    Cache for ``get_current_user``: decoded tokens and active users.
+
+    Tokens are keyed by a digest of the whole token and map to the user id and expiry from
+    the verified payload. Users are kept as a snapshot of their column values
+    and re-attached to the request's session without a SELECT. Anything that
+    changes a user must call ``invalidate`` (crud does this for profile updates,
+    password resets and deactivation).
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 60):
+        self.tokens = TTLCache(max_entries, ttl_seconds)
+        self.users = TTLCache(max_entries, ttl_seconds)
+
+    @staticmethod
+    def token_key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def subject(self, token: str) -> Optional[str]:
+        """User id of a previously verified, unexpired ``token``."""
+        return self.tokens.get(self.token_key(token))
+
+    def remember_token(self, token: str, user_id: str, exp: Optional[float]) -> None:
+        expires_at = time.monotonic() + (exp - time.time()) if exp else None
+        self.tokens.set(self.token_key(token), user_id, expires_at)
+
+    def user(self, user_id: str) -> Optional[User]:
+        """A detached copy of the cached user, ready for ``Session.merge(load=False)``."""
+        values = self.users.get(user_id)
+        if values is None:
+            return None
+        user = User(**values)
+        make_transient_to_detached(user)
+        return user
+
+    def remember_user(self, user: User) -> None:
+        values = {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+        self.users.set(user.id, values)
+
+    def invalidate(self, user_id: str) -> None:
+        self.users.pop(user_id)
+
+    def stats(self) -> dict:
+        return {"tokens": self.tokens.stats(), "users": self.users.stats()}
+
+
+principal_cache = (
+    PrincipalCache(settings.AUTH_CACHE_MAX_ENTRIES, settings.AUTH_CACHE_TTL_SECONDS)
+    if settings.AUTH_CACHE else None
+)
+
+dashboard_cache = (
+    TTLCache(settings.DASHBOARD_CACHE_MAX_ENTRIES, settings.DASHBOARD_CACHE_TTL_SECONDS)
+    if settings.DASHBOARD_CACHE else None
+)
+
+INVALIDATE_KEY = "invalidate_cached"
+
+
+def _invalidate(db: Session, cache: Optional[TTLCache], key: Hashable) -> None:
+    """Drop ``key`` from ``cache`` now and again once ``db`` commits."""
+    if cache is None:
+        return
+    cache.pop(key)
+    # A concurrent request could re-cache the old value before the commit lands
+    db.info.setdefault(INVALIDATE_KEY, []).append((cache, key))
+
+
+def invalidate_user(db: Session, user_id: str) -> None:
+    _invalidate(db, principal_cache.users if principal_cache else None, user_id)
+
+
+def invalidate_dashboard(db: Session, user_id: str, day: Optional[date] = None) -> None:
+    _invalidate(db, dashboard_cache, (user_id, day or date.today()))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    for cache, key in session.info.pop(INVALIDATE_KEY, ()):
+        cache.pop(key)
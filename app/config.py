@@ -1,3 +1,4 @@
+from typing import Optional
 from pydantic_settings import BaseSettings  # ✅ use pydantic_settings not pydantic
 
 class Settings(BaseSettings):
@@ -9,6 +10,63 @@ class Settings(BaseSettings):
     MAIL_FROM: str
     EMAIL_BACKEND: str = "smtp"
     APP_HOST: str
+    # Connection pool, per engine and worker process: keep
+    # workers x (DB_POOL_SIZE + DB_MAX_OVERFLOW) under Postgres max_connections
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    # Seconds after which a connection is replaced (-1 never)
+    DB_POOL_RECYCLE: int = -1
+    DB_POOL_PRE_PING: bool = False
+    # Behind PgBouncer in transaction mode (disables asyncpg prepared statement caching)
+    DB_PGBOUNCER: bool = False
+    # Argon2 cost; existing hashes are upgraded on the next successful login
+    ARGON2_TIME_COST: int = 3
+    ARGON2_MEMORY_COST: int = 65536  # KiB
+    ARGON2_PARALLELISM: int = 4
+    # Processes dedicated to password hashing (0 hashes inline in the web worker)
+    PASSWORD_HASH_WORKERS: int = 0
+    # Cache verified tokens and active users for get_current_user
+    AUTH_CACHE: bool = False
+    AUTH_CACHE_TTL_SECONDS: float = 60
+    AUTH_CACHE_MAX_ENTRIES: int = 10000
+    # Per-user GET /dashboard/ responses, revalidated with ETag / If-None-Match
+    DASHBOARD_CACHE: bool = False
+    DASHBOARD_CACHE_TTL_SECONDS: float = 300
+    DASHBOARD_CACHE_MAX_ENTRIES: int = 10000
+    # Serve users/assessments/dashboard from async routers on an asyncpg engine
+    ASYNC_DB: bool = False
+    # Defaults to DATABASE_URL with the postgresql+asyncpg driver
+    ASYNC_DATABASE_URL: Optional[str] = None
+    # Prometheus metrics on /metrics (request, query, inference, hashing, audit and pool timings).
+    # With METRICS_TOKEN set, scrapers must send it as "Authorization: Bearer <token>".
+    METRICS: bool = False
+    METRICS_TOKEN: Optional[str] = None
+    # Sampling profiler for requests with "X-Profile: <PROFILE_TOKEN>" or a random
+    # PROFILE_SAMPLE_RATE share of them; folded stacks are written to PROFILE_DIR
+    PROFILING: bool = False
+    PROFILE_TOKEN: Optional[str] = None
+    PROFILE_SAMPLE_RATE: float = 0.0
+    PROFILE_DIR: str = "profiles"
+    PROFILE_INTERVAL_MS: float = 1.0
+    # Registered model (see app/predict.py) used for live predictions
+    MODEL_NAME: str = "logistic_regression"
+    MODEL_VERSION: str = "1"
+    # Precompute predictions for every 7-day mean of 0-6 scores at model load
+    PREDICTION_LOOKUP_TABLE: bool = False
+    # Optional directory to persist the table in and memory-map it from
+    PREDICTION_LOOKUP_DIR: Optional[str] = None
+    # Coalesce concurrent predictions into vectorized batches
+    INFERENCE_BATCHING: bool = False
+    INFERENCE_BATCH_MAX_SIZE: int = 64
+    INFERENCE_BATCH_MAX_WAIT_MS: float = 2.0
+    # Write audit_logs from an in-process buffer instead of inline
+    AUDIT_BUFFERED: bool = False
+    AUDIT_BUFFER_MAX_ENTRIES: int = 10000
+    AUDIT_FLUSH_BATCH_SIZE: int = 500
+    AUDIT_FLUSH_INTERVAL_MS: float = 1000
+    # How long a request may wait for room in a full buffer before the entry is dropped
+    AUDIT_ENQUEUE_TIMEOUT_MS: float = 0
 
     class Config:
         env_file = ".env"
@@ -1,18 +1,39 @@
-from datetime import date, timedelta
-import numpy as np
-from sqlalchemy.orm import Session
+from datetime import date, datetime, time, timedelta, timezone
+from sqlalchemy import (
+    Date, Float, String, and_, cast, column, delete, func, insert, literal, literal_column, select, union_all, update,
+    values
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, aliased
 
-from app.models import User, Assessment, Prediction, DailySummaryRolling7D, AuditLog
-from typing import Optional, Tuple
+from app.models import (
+    User, Assessment, Prediction, DailySummaryRolling7D, AuditLog, CohortDailyStats, CohortRefreshState
+)
+from typing import Callable, Dict, List, Optional, Tuple
 import uuid
 from app.schemas import DailyAssessmentIn
+from app.audit import PENDING_KEY, audit_buffer
+from app.cache import invalidate_dashboard, invalidate_user
+
+
+def day_bounds(day: date) -> Tuple[datetime, datetime]:
+    """Local-midnight bounds of ``day``, so filters compare ``predicted_at`` directly."""
+    start = datetime.combine(day, time.min).astimezone()
+    return start, datetime.combine(day + timedelta(days=1), time.min).astimezone()
+
+
+def _save(db: Session) -> None:
+    """Commit, or only flush when the caller runs inside ``dependencies.unit_of_work``."""
+    if db.info.get("unit_of_work"):
+        db.flush()
+    else:
+        db.commit()
 
 
 def create_user(db: Session, email: str, password_hash: str, full_name: str) -> User:
     user = User(email=email, password_hash=password_hash, full_name=full_name)
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    _save(db)
     return user
 
 
@@ -23,82 +44,530 @@ def get_user_by_email(db: Session, email: str) -> Optional[User]:
 def update_user(db: Session, user: User, full_name: Optional[str] = None) -> User:
     if full_name:
         user.full_name = full_name
-    db.commit()
+    invalidate_user(db, user.id)
+    _save(db)
+    return user
+
+
+def set_password(db: Session, user: User, password_hash: str) -> User:
+    user.password_hash = password_hash
+    invalidate_user(db, user.id)
+    _save(db)
     return user
 
 
+def record_login(db: Session, user: User, password_hash: Optional[str] = None) -> User:
+    """Stamp ``last_login`` and store an upgraded password hash, if login produced one."""
+    user.last_login = datetime.utcnow()
+    if password_hash:
+        user.password_hash = password_hash
+    invalidate_user(db, user.id)
+    _save(db)
+    return user
+
+
+def set_admin(db: Session, user: User, is_admin: bool = True) -> User:
+    user.is_admin = is_admin
+    invalidate_user(db, user.id)
+    _save(db)
+    return user
+
+
+def deactivate_user(db: Session, user: User) -> User:
+    user.is_active = False
+    invalidate_user(db, user.id)
+    invalidate_dashboard(db, user.id)
+    _save(db)
+    return user
+
+
+def _buffer_audit(db, user_id: str, action: str, details: str) -> bool:
+    """Hand the entry to the buffered writer when enabled; False means write it inline."""
+    if audit_buffer is None:
+        return False
+    # Buffered mode: the background writer inserts it, after this transaction commits
+    entry = {"user_id": user_id, "action": action, "details": details,
+             "timestamp": datetime.now(timezone.utc)}
+    if db.info.get("unit_of_work"):
+        db.info.setdefault(PENDING_KEY, []).append(entry)
+    else:
+        audit_buffer.enqueue([entry])
+    return True
+
+
 def log_action(db: Session, user_id: str, action: str, details: str = "") -> None:
+    if _buffer_audit(db, user_id, action, details):
+        return
     entry = AuditLog(user_id=user_id, action=action, details=details)
     db.add(entry)
-    db.commit()
+    _save(db)
 
 
 def add_assessment_and_prediction(
     db: Session,
     user: User,
     data: DailyAssessmentIn,
-    prediction_result: Optional[dict] = None
+    prediction_result: Optional[dict] = None,
 ):
-    # Save the assessment first
-    assessment = Assessment(
-        user_id=user.id,
+    """
+    Save the user's assessment for the day, replacing an earlier one for the same day.
+
+    The assessment is upserted on (user_id, date) and the rolling summaries
+    are moved by the difference it makes; a prediction is likewise upserted
+    on the assessment.
+    """
+    scores = _scores(data)
+    assessment, inserted, *old_scores = db.execute(_upsert_assessment_stmt(user.id, data)).one()
+    delta = _summary_delta(scores, inserted, old_scores)
+    if delta is None:
+        rebuild_rolling_summaries(db, [user.id], assessment.date)
+    else:
+        db.execute(_record_summary_stmt(user.id, assessment.date, delta[1], count=delta[0]))
+
+    prediction = None
+    if prediction_result:
+        prediction = db.scalars(_upsert_prediction_stmt(assessment, prediction_result)).one()
+        invalidate_dashboard(db, user.id)
+
+    _save(db)
+    return assessment, prediction
+
+
+def _scores(data: DailyAssessmentIn) -> list:
+    return [data.tired_score, data.capable_score, data.meaningful_score]
+
+
+def _upsert_assessment_stmt(user_id: str, data: DailyAssessmentIn):
+    """
+    INSERT ... ON CONFLICT (user_id, date) DO UPDATE returning the stored row,
+    whether it was inserted, and (for an update) the scores it replaced.
+    """
+    stmt = pg_insert(Assessment).values(
+        id=str(uuid.uuid4()),
+        user_id=user_id,
         date=date.today(),
         tired_score=data.tired_score,
         capable_score=data.capable_score,
         meaningful_score=data.meaningful_score,
     )
-    db.add(assessment)
-    db.commit()
-    db.refresh(assessment)
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_assessment_user_date",
+        set_={
+            **{f"{name}_score": stmt.excluded[f"{name}_score"] for name in SUMMARY_SCORES},
+            "submitted_at": func.now(),
+        },
+    )
+    # Subqueries in RETURNING read the statement's snapshot, i.e. the row as it was before the update
+    previous = aliased(Assessment)
+    old_scores = [
+        select(getattr(previous, f"{name}_score"))
+        .where(previous.id == literal_column(f"{Assessment.__tablename__}.id")).scalar_subquery()
+        for name in SUMMARY_SCORES
+    ]
+    return stmt.returning(Assessment, literal_column("xmax = 0"), *old_scores).execution_options(
+        populate_existing=True
+    )
 
-    # Save prediction if available
-    prediction = None
-    if prediction_result:
-        prediction = Prediction(
-            assessment_id=assessment.id,
-            burnout_risk=prediction_result["burnout_risk"],
-            label=prediction_result["label"],
-            confidence=prediction_result["confidence"],
-            model_version=prediction_result.get("model_version", "1.0.0")
-        )
-        db.add(prediction)
-        db.commit()
-        db.refresh(prediction)
 
-    return assessment, prediction
+def _summary_delta(scores: list, inserted: bool, old_scores: list) -> Optional[Tuple[int, list]]:
+    """(count, score sums) to add to the summaries, or None when they must be rebuilt."""
+    if inserted:
+        return 1, scores
+    if any(old is None for old in old_scores):
+        # The row being replaced was committed concurrently, after this statement's snapshot
+        return None
+    return 0, [new - old for new, old in zip(scores, old_scores)]
 
 
+def _upsert_prediction_stmt(assessment: Assessment, prediction_result: dict):
+    values = prediction_values(assessment.user_id, assessment.id, prediction_result)
+    stmt = pg_insert(Prediction).values(id=str(uuid.uuid4()), **values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Prediction.assessment_id],
+        set_={**{key: stmt.excluded[key] for key in values}, "predicted_at": func.now()},
+    )
+    return stmt.returning(Prediction).execution_options(populate_existing=True)
 
-def compute_rolling_summary(db: Session, user: User) -> Optional[DailySummaryRolling7D]:
-    today = date.today()
-    week_ago = today - timedelta(days=6)
 
-    rows = db.query(Assessment).filter(
-        Assessment.user_id == user.id,
-        Assessment.date >= week_ago
-    ).all()
+def prediction_values(user_id: str, assessment_id: str, prediction_result: dict) -> dict:
+    """Column values of a Prediction row for a ``predict_burnout`` result."""
+    return {
+        "user_id": user_id,
+        "assessment_id": assessment_id,
+        "burnout_risk": prediction_result["burnout_risk"],
+        "label": prediction_result["label"],
+        "confidence": prediction_result["confidence"],
+        "model_version": prediction_result.get("model_version", "1.0.0"),
+    }
 
-    # Only compute if we have at least 7 assessments
-    if len(rows) < 7:
-        return None
 
-    arr = np.array([[r.tired_score, r.capable_score, r.meaningful_score] for r in rows])
-    avg = np.mean(arr, axis=0)
-
-    summary = DailySummaryRolling7D(
-        user_id=user.id,
-        summary_date=today,
-        avg_tired_last_7_days=float(avg[0]),
-        avg_capable_last_7_days=float(avg[1]),
-        avg_meaningful_last_7_days=float(avg[2]),
-        features_json={
-            "avg_tired": avg[0],
-            "avg_capable": avg[1],
-            "avg_meaningful": avg[2]
+
+# Rolling 7-day summaries
+#
+# daily_summary_rolling_7d holds one row per (user_id, summary_date) with the
+# count and per-score sums of that user's assessments in [summary_date - 6,
+# summary_date]. A row is seeded from the assessments table the first time it
+# is read and is then kept current by incrementing it as assessments are
+# written, so reading a summary is a single-row lookup.
+
+SUMMARY_SCORES = ("tired", "capable", "meaningful")
+
+
+def _summary_values(count, sums) -> dict:
+    """Column values for a summary row holding ``count`` assessments with per-score ``sums``."""
+    avgs = [cast(total, Float) / count for total in sums]
+    row = {"assessment_count": count}
+    for name, total, avg in zip(SUMMARY_SCORES, sums, avgs):
+        row[f"sum_{name}"] = total
+        row[f"avg_{name}_last_7_days"] = avg
+    row["features_json"] = func.jsonb_build_object(
+        *[arg for name, avg in zip(SUMMARY_SCORES, avgs) for arg in (f"avg_{name}", avg)]
+    )
+    return row
+
+
+def _window_aggregates(user_id_col, day_col):
+    """Count and score sums of a user's assessments over the 7 days ending at ``day_col``."""
+    a = aliased(Assessment)
+    on = and_(a.user_id == user_id_col, a.date.between(day_col - 6, day_col))
+    aggregates = [func.count(a.id)] + [
+        func.coalesce(func.sum(getattr(a, f"{name}_score")), 0) for name in SUMMARY_SCORES
+    ]
+    return a, on, aggregates
+
+
+def compute_rolling_summary(db: Session, user: User, as_of: Optional[date] = None) -> Optional[DailySummaryRolling7D]:
+    """
+    Return the user's rolling 7-day summary as of ``as_of`` (default today).
+
+    Reads the maintained row when it exists, otherwise seeds it with one
+    aggregate query. Returns None while the window holds fewer than 7
+    assessments.
+    """
+    day = as_of or date.today()
+    summary = db.scalars(_summary_lookup_stmt(user.id, day)).first()
+    if summary is None:
+        count, *sums = db.execute(_window_stmt(user.id, day)).one()
+        summary = db.scalars(_seed_summary_stmt(user.id, day, count, sums)).one()
+        _save(db)
+    return _usable(summary)
+
+
+def _usable(summary: DailySummaryRolling7D) -> Optional[DailySummaryRolling7D]:
+    # Only usable once we have at least 7 assessments
+    return summary if summary.assessment_count >= 7 else None
+
+
+def _summary_lookup_stmt(user_id: str, day: date):
+    return select(DailySummaryRolling7D).filter_by(user_id=user_id, summary_date=day)
+
+
+def _window_stmt(user_id: str, day: date):
+    a, on, aggregates = _window_aggregates(literal(user_id), literal(day, Date))
+    return select(*aggregates).select_from(a).where(on)
+
+
+def _seed_summary_stmt(user_id: str, day: date, count: int, sums):
+    """Upsert returning the seeded summary row."""
+    row = _summary_values(count, sums) if count else {
+        "assessment_count": 0, **{f"sum_{name}": 0 for name in SUMMARY_SCORES}
+    }
+    stmt = pg_insert(DailySummaryRolling7D).values(user_id=user_id, summary_date=day, **row)
+    # A concurrent seed may have won; the no-op update lets RETURNING hand back its row
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_daily_summary_user_date", set_={"user_id": stmt.excluded.user_id}
+    ).returning(DailySummaryRolling7D)
+    return stmt.execution_options(populate_existing=True)
+
+
+def _record_summary_stmt(user_id: str, on_date: date, scores, count: int = 1):
+    """
+    Fold one assessment (or a score delta) into every stored summary whose window covers ``on_date``.
+
+    Windows that have not been seeded yet are left alone; they pick the
+    assessment up from the assessments table when first read.
+    """
+    t = DailySummaryRolling7D
+    new_count = t.assessment_count + count
+    new_sums = [getattr(t, f"sum_{name}") + score for name, score in zip(SUMMARY_SCORES, scores)]
+    stmt = (
+        update(t)
+        .where(t.user_id == user_id, t.summary_date.between(on_date, on_date + timedelta(days=6)))
+        .values(**_summary_values(new_count, new_sums))
+    )
+    return stmt.execution_options(synchronize_session=False)
+
+
+def rebuild_rolling_summaries(db: Session, user_ids: Optional[List[str]] = None,
+                              since: Optional[date] = None) -> int:
+    """
+    Recompute stored summaries from the assessments table.
+
+    Deletes the summaries of ``user_ids`` (default: everyone) dated ``since``
+    or later (default: all) and writes one row per (user, day with an
+    assessment) in a single INSERT ... SELECT. Days without assessments are
+    re-seeded lazily on read. Does not commit; returns the rows written.
+    """
+    clear, fill = _rebuild_summary_stmts(user_ids, since)
+    db.execute(clear)
+    return db.execute(fill).rowcount
+
+
+def _rebuild_summary_stmts(user_ids: Optional[List[str]], since: Optional[date]):
+    t = DailySummaryRolling7D
+    scope = []
+    if user_ids is not None:
+        scope.append(t.user_id.in_(user_ids))
+    if since is not None:
+        scope.append(t.summary_date >= since)
+
+    days = select(Assessment.user_id, Assessment.date).distinct()
+    if user_ids is not None:
+        days = days.where(Assessment.user_id.in_(user_ids))
+    if since is not None:
+        days = days.where(Assessment.date >= since)
+    days = days.subquery("days")
+
+    a, on, (count, *sums) = _window_aggregates(days.c.user_id, days.c.date)
+    row = _summary_values(count, sums)
+    source = (
+        select(func.gen_random_uuid().cast(String), days.c.user_id, days.c.date, *row.values())
+        .join(a, on)
+        .group_by(days.c.user_id, days.c.date)
+    )
+    clear = delete(t).where(*scope).execution_options(synchronize_session=False)
+    return clear, insert(t).from_select(["id", "user_id", "summary_date", *row.keys()], source)
+
+
+# Re-read rows stamped up to this long before the last watermark: submitted_at and
+# predicted_at come from now(), i.e. transaction start, not commit time
+COHORT_REFRESH_OVERLAP = timedelta(minutes=5)
+COHORT_LABELS = ("low", "moderate", "high")
+
+
+def refresh_cohort_stats(db: Session, full: bool = False) -> int:
+    """
+    Bring ``cohort_daily_stats`` up to date; returns the number of days rewritten.
+
+    Only days with an assessment or prediction written since the previous
+    refresh are re-aggregated, each from that day's rows alone. The first run,
+    or ``full``, aggregates every day. Concurrent refreshes queue on the
+    watermark row.
+    """
+    state = db.get(CohortRefreshState, 1, with_for_update=True)
+    started = db.scalar(select(func.now()))
+    since = None if full or state is None else state.watermark - COHORT_REFRESH_OVERLAP
+    written = db.execute(_refresh_cohort_stmt(since)).rowcount
+    db.execute(_cohort_watermark_stmt(started))
+    _save(db)
+    return written
+
+
+def _cohort_touched_days(since: datetime):
+    a, p = Assessment, Prediction
+    return union_all(
+        select(a.date).where(a.submitted_at >= since),
+        select(a.date).join(p, p.assessment_id == a.id).where(p.predicted_at >= since),
+    )
+
+
+def _refresh_cohort_stmt(since: Optional[datetime]):
+    a, p, t = Assessment, Prediction, CohortDailyStats
+    label = func.lower(p.label)
+    row = {
+        "assessment_count": func.count(a.id),
+        **{f"sum_{name}": func.coalesce(func.sum(getattr(a, f"{name}_score")), 0) for name in SUMMARY_SCORES},
+        "prediction_count": func.count(p.id),
+        **{f"{name}_count": func.count(p.id).filter(label == name) for name in COHORT_LABELS},
+    }
+    source = select(a.date, *row.values()).outerjoin(p, p.assessment_id == a.id).group_by(a.date)
+    if since is not None:
+        source = source.where(a.date.in_(_cohort_touched_days(since)))
+    stmt = pg_insert(t).from_select(["day", *row], source)
+    return stmt.on_conflict_do_update(
+        index_elements=[t.day], set_={**{key: stmt.excluded[key] for key in row}, "refreshed_at": func.now()}
+    )
+
+
+def _cohort_watermark_stmt(watermark: datetime):
+    stmt = pg_insert(CohortRefreshState).values(id=1, watermark=watermark)
+    return stmt.on_conflict_do_update(index_elements=[CohortRefreshState.id], set_={"watermark": watermark})
+
+
+def get_cohort_stats(db: Session, start: date, end: date, bucket: str = "day") -> List[dict]:
+    """
+    Risk label counts and mean scores per day or ISO week (Monday start) in
+    [start, end], summed from ``cohort_daily_stats``.
+    """
+    t = CohortDailyStats
+    key = t.day if bucket == "day" else cast(func.date_trunc("week", t.day), Date)
+    counts = ["assessment_count", *(f"sum_{name}" for name in SUMMARY_SCORES),
+              "prediction_count", *(f"{name}_count" for name in COHORT_LABELS)]
+    stmt = (
+        select(key.label("start"), *(func.sum(getattr(t, name)).label(name) for name in counts))
+        .where(t.day.between(start, end))
+        .group_by(key)
+        .order_by(key)
+    )
+    return [
+        {
+            "start": row.start,
+            "assessments": row.assessment_count,
+            "predictions": row.prediction_count,
+            **{name: getattr(row, f"{name}_count") for name in COHORT_LABELS},
+            **{f"mean_{name}": getattr(row, f"sum_{name}") / row.assessment_count if row.assessment_count else None
+               for name in SUMMARY_SCORES},
         }
+        for row in db.execute(stmt)
+    ]
+
+
+def get_cohort_watermark(db: Session) -> Optional[datetime]:
+    return db.scalar(select(CohortRefreshState.watermark).where(CohortRefreshState.id == 1))
+
+
+def get_rolling_summaries(db: Session, as_of: Dict[str, date]) -> Dict[str, DailySummaryRolling7D]:
+    """
+    Stored rolling summaries for many users at once.
+
+    ``as_of`` maps user_id to the summary date to read. Users with no stored
+    row or fewer than 7 assessments in their window are left out.
+    """
+    if not as_of:
+        return {}
+    return {summary.user_id: summary for summary in db.scalars(_rolling_summaries_stmt(as_of))}
+
+
+def _rolling_summaries_stmt(as_of: Dict[str, date]):
+    wanted = values(
+        column("user_id", String), column("summary_date", Date), name="wanted"
+    ).data(list(as_of.items()))
+    t = DailySummaryRolling7D
+    return (
+        select(t)
+        .join(wanted, and_(t.user_id == wanted.c.user_id, t.summary_date == wanted.c.summary_date))
+        .where(t.assessment_count >= 7)
+    )
+
+
+def add_assessments_and_predictions_bulk(
+    db: Session,
+    rows: List[dict],
+    score: Callable[[list], list],
+) -> Tuple[int, int, int]:
+    """
+    Backfill many dated assessments in one transaction.
+
+    ``rows`` carry user_id, date and the three scores and are upserted on
+    (user_id, date) with one multi-row statement. Stored rolling summaries of the affected users are then
+    rebuilt once from the earliest imported date onwards, and read back as of
+    each user's latest imported date (the window includes the imported rows).
+    Every user with a full window gets one prediction, attached to that latest
+    assessment; ``score`` receives all their feature rows in a single
+    vectorized call.
+
+    Returns (assessments written, users affected, predictions written).
+    """
+    rows, latest = _prepare_bulk_rows(rows)
+    _assign_bulk_ids(rows, db.execute(_bulk_upsert_assessments_stmt(), rows))
+
+    clear, fill = _rebuild_summary_stmts(list(latest), min(row["date"] for row in rows))
+    db.execute(clear)
+    db.execute(fill)
+    summaries = get_rolling_summaries(db, {user_id: row["date"] for user_id, row in latest.items()})
+    predictions = _bulk_predictions(latest, summaries, score)
+    if predictions:
+        db.execute(bulk_upsert_predictions_stmt(), predictions)
+        for prediction in predictions:
+            invalidate_dashboard(db, prediction["user_id"])
+
+    _save(db)
+    return len(rows), len(latest), len(predictions)
+
+
+def _prepare_bulk_rows(rows: List[dict]) -> Tuple[List[dict], Dict[str, dict]]:
+    """
+    Collapse ``rows`` to one per (user, date), the last one winning as a later
+    resubmission would, and return them with each user's latest-dated row.
+    """
+    unique = {(row["user_id"], row["date"]): row for row in rows}
+    latest: Dict[str, dict] = {}
+    for row in unique.values():
+        row["id"] = str(uuid.uuid4())
+        current = latest.get(row["user_id"])
+        if current is None or row["date"] >= current["date"]:
+            latest[row["user_id"]] = row
+    return list(unique.values()), latest
+
+
+def _bulk_upsert_assessments_stmt():
+    stmt = pg_insert(Assessment)
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_assessment_user_date",
+        set_={
+            **{f"{name}_score": stmt.excluded[f"{name}_score"] for name in SUMMARY_SCORES},
+            "submitted_at": func.now(),
+        },
+    )
+    # Matched back by (user_id, date) rather than sort_by_parameter_order, which
+    # without a sentinel column makes insertmanyvalues send one statement per row
+    return stmt.returning(Assessment.id, Assessment.user_id, Assessment.date)
+
+
+def _assign_bulk_ids(rows: List[dict], result) -> None:
+    """Rows that replaced an existing assessment keep its id; record it for their predictions."""
+    ids = {(user_id, day): assessment_id for assessment_id, user_id, day in result}
+    for row in rows:
+        row["id"] = ids[(row["user_id"], row["date"])]
+
+
+def bulk_upsert_predictions_stmt():
+    """Upsert on assessment_id, executed with a list of ``prediction_values`` rows (plus ids)."""
+    stmt = pg_insert(Prediction)
+    return stmt.on_conflict_do_update(
+        index_elements=[Prediction.assessment_id],
+        set_={
+            **{key: stmt.excluded[key] for key in ("burnout_risk", "label", "confidence", "model_version")},
+            "predicted_at": func.now(),
+        },
     )
 
-    db.add(summary)
-    db.commit()
-    db.refresh(summary)
-    return summary
+
+def latest_windows_stmt(after: Optional[str] = None, until: Optional[str] = None):
+    """
+    Each user's latest assessment with the count and score sums of the 7 days
+    ending on it, for users with a full window and ``after < user_id <= until``,
+    in user_id order (used by scripts/rescore.py).
+    """
+    latest = (
+        select(Assessment.user_id, Assessment.id, Assessment.date)
+        .distinct(Assessment.user_id)
+        .order_by(Assessment.user_id, Assessment.date.desc())
+    )
+    if after is not None:
+        latest = latest.where(Assessment.user_id > after)
+    if until is not None:
+        latest = latest.where(Assessment.user_id <= until)
+    latest = latest.subquery("latest")
+    a, on, (count, *sums) = _window_aggregates(latest.c.user_id, latest.c.date)
+    return (
+        select(latest.c.user_id, latest.c.id, count, *sums)
+        .join(a, on)
+        .group_by(latest.c.user_id, latest.c.id)
+        .having(count >= 7)
+        .order_by(latest.c.user_id)
+    )
+
+
+def _bulk_predictions(latest: Dict[str, dict], summaries: Dict[str, DailySummaryRolling7D], score) -> List[dict]:
+    if not summaries:
+        return []
+    user_ids = list(summaries)
+    results = score([
+        [s.avg_tired_last_7_days, s.avg_capable_last_7_days, s.avg_meaningful_last_7_days]
+        for s in (summaries[user_id] for user_id in user_ids)
+    ])
+    return [
+        {"id": str(uuid.uuid4()), **prediction_values(user_id, latest[user_id]["id"], result)}
+        for user_id, result in zip(user_ids, results)
+    ]
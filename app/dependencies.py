@@ -1,14 +1,101 @@
+from contextlib import asynccontextmanager, contextmanager
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from app.config import settings
+from app.metrics import instrument_engine, metrics_registry
+from app.pooling import engine_options, pool_metrics
 
-engine = create_engine(settings.DATABASE_URL)
+engine = create_engine(settings.DATABASE_URL, **engine_options())
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 Base = declarative_base()
 
+
+def async_database_url(url: str) -> str:
+    """Point a Postgres URL at the asyncpg driver."""
+    return make_url(url).set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+
+
+# Async stack (asyncpg), only built when the async routers are enabled. The sync
+# engine above stays available for scripts and non-async routes.
+async_engine = (
+    create_async_engine(settings.ASYNC_DATABASE_URL or async_database_url(settings.DATABASE_URL),
+                        **engine_options(is_async=True))
+    if settings.ASYNC_DB else None
+)
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+if settings.METRICS:
+    for instrumented in (engine, async_engine.sync_engine if async_engine else None):
+        if instrumented is not None:
+            instrument_engine(instrumented)
+    metrics_registry.collector(pool_metrics(
+        lambda: {"sync": engine.pool, **({"async": async_engine.pool} if async_engine else {})}
+    ))
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def get_engine():
+    """Engine for work that outlives the request session, such as streamed exports."""
+    return engine
+
+
+def get_async_engine():
+    return async_engine
+
+
+@contextmanager
+def unit_of_work(db):
+    """
+    Run a block of crud calls as one transaction.
+
+    Inside the block crud helpers only flush; the block commits once on success
+    and rolls back on error. Objects are not expired by that commit, so the
+    response can be built from them without re-selecting. Nested blocks join the
+    outermost one.
+    """
+    if db.info.get("unit_of_work"):
+        yield db
+        return
+    db.info["unit_of_work"] = True
+    try:
+        yield db
+        expire_on_commit, db.expire_on_commit = db.expire_on_commit, False
+        try:
+            db.commit()
+        finally:
+            db.expire_on_commit = expire_on_commit
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.info["unit_of_work"] = False
+
+
+@asynccontextmanager
+async def async_unit_of_work(db):
+    """``unit_of_work`` for an AsyncSession (whose sessions never expire on commit)."""
+    if db.info.get("unit_of_work"):
+        yield db
+        return
+    db.info["unit_of_work"] = True
+    try:
+        yield db
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    finally:
+        db.info["unit_of_work"] = False
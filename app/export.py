@@ -0,0 +1,135 @@
+import csv
+import io
+import json
+import zlib
+from datetime import date, datetime
+from typing import AsyncIterator, Iterator, Optional, Sequence
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+
+from app.models import Assessment, Prediction
+
+# Rows fetched from the server-side cursor, encoded and sent per chunk
+EXPORT_BATCH_SIZE = 1000
+
+
+def history_stmt(user_id: Optional[str] = None, start: Optional[date] = None, end: Optional[date] = None):
+    """Assessments with their prediction (if any) as plain columns, in (user_id, date) order."""
+    a, p = Assessment, Prediction
+    stmt = (
+        select(
+            a.user_id, a.date, a.tired_score, a.capable_score, a.meaningful_score, a.submitted_at,
+            p.label, p.burnout_risk, p.confidence, p.model_version, p.predicted_at,
+        )
+        .outerjoin(p, p.assessment_id == a.id)
+        .order_by(a.user_id, a.date)
+    )
+    if user_id is not None:
+        stmt = stmt.where(a.user_id == user_id)
+    if start is not None:
+        stmt = stmt.where(a.date >= start)
+    if end is not None:
+        stmt = stmt.where(a.date <= end)
+    return stmt
+
+
+def _isoformat(value):
+    return value.isoformat() if isinstance(value, (date, datetime)) else value
+
+
+class CsvEncoder:
+    media_type = "text/csv"
+    extension = "csv"
+
+    def __init__(self, columns: Sequence[str]):
+        self.columns = list(columns)
+
+    def header(self) -> bytes:
+        return self.encode([self.columns])
+
+    def encode(self, rows) -> bytes:
+        buf = io.StringIO()
+        csv.writer(buf).writerows([[_isoformat(value) for value in row] for row in rows])
+        return buf.getvalue().encode()
+
+
+class NdjsonEncoder:
+    media_type = "application/x-ndjson"
+    extension = "ndjson"
+
+    def __init__(self, columns: Sequence[str]):
+        self.columns = list(columns)
+
+    def header(self) -> bytes:
+        return b""
+
+    def encode(self, rows) -> bytes:
+        return "".join(
+            json.dumps(dict(zip(self.columns, map(_isoformat, row)))) + "\n" for row in rows
+        ).encode()
+
+
+ENCODERS = {"csv": CsvEncoder, "ndjson": NdjsonEncoder}
+
+
+class _Gzip:
+    def __init__(self):
+        self._compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+
+    def __call__(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _Identity:
+    def __call__(self, data: bytes) -> bytes:
+        return data
+
+    def flush(self) -> bytes:
+        return b""
+
+
+def stream_export(engine, stmt, encoder, compress: bool) -> Iterator[bytes]:
+    """
+    Encode ``stmt``'s rows in batches straight off a server-side cursor on
+    its own connection (the request session is closed before streaming starts).
+    """
+    pack = _Gzip() if compress else _Identity()
+    yield pack(encoder.header())
+    with engine.connect() as conn:
+        result = conn.execution_options(stream_results=True, max_row_buffer=EXPORT_BATCH_SIZE).execute(stmt)
+        for rows in result.partitions(EXPORT_BATCH_SIZE):
+            chunk = pack(encoder.encode(rows))
+            if chunk:
+                yield chunk
+    yield pack.flush()
+
+
+async def stream_export_async(engine, stmt, encoder, compress: bool) -> AsyncIterator[bytes]:
+    """``stream_export`` on an AsyncEngine."""
+    pack = _Gzip() if compress else _Identity()
+    yield pack(encoder.header())
+    async with engine.connect() as conn:
+        result = await conn.stream(stmt.execution_options(max_row_buffer=EXPORT_BATCH_SIZE))
+        async for rows in result.partitions(EXPORT_BATCH_SIZE):
+            chunk = pack(encoder.encode(rows))
+            if chunk:
+                yield chunk
+    yield pack.flush()
+
+
+def export_response(body, encoder, compress: bool, filename: str) -> StreamingResponse:
+    """Stream ``body`` as a download, as a ``.gz`` file when ``compress`` is set."""
+    filename = f"{filename}.{encoder.extension}"
+    media_type = encoder.media_type
+    if compress:
+        filename, media_type = f"{filename}.gz", "application/gzip"
+    return StreamingResponse(body, media_type=media_type,
+                             headers={"Content-Disposition": f'attachment; filename="{filename}"'})
+
+
+def export_columns(stmt) -> list:
+    return [column.name for column in stmt.selected_columns]
@@ -0,0 +1,135 @@
+import asyncio
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Tuple
+
+from passlib.context import CryptContext
+
+from app.config import settings
+from app.metrics import LabeledHistogram, metrics_registry
+
+logger = logging.getLogger(__name__)
+
+# Context of a pool process, built there by ``_init_worker``
+_context: Optional[CryptContext] = None
+
+
+def build_context(time_cost: int, memory_cost: int, parallelism: int) -> CryptContext:
+    """Argon2 context; hashes made with other parameters report ``needs_update``."""
+    return CryptContext(
+        schemes=["argon2"],
+        deprecated="auto",
+        argon2__rounds=time_cost,
+        argon2__memory_cost=memory_cost,
+        argon2__parallelism=parallelism,
+    )
+
+
+def _init_worker(time_cost: int, memory_cost: int, parallelism: int) -> None:
+    global _context
+    _context = build_context(time_cost, memory_cost, parallelism)
+
+
+def _hash(password: str, context: Optional[CryptContext] = None) -> str:
+    return (context or _context).hash(password)
+
+
+def _verify(password: str, hashed: str, context: Optional[CryptContext] = None) -> bool:
+    return (context or _context).verify(password, hashed)
+
+
+def _verify_and_update(password: str, hashed: str,
+                       context: Optional[CryptContext] = None) -> Tuple[bool, Optional[str]]:
+    context = context or _context
+    if not context.verify(password, hashed):
+        return False, None
+    return True, context.hash(password) if context.needs_update(hashed) else None
+
+
+hash_duration = metrics_registry.histogram(LabeledHistogram(
+    "password_hash_duration_seconds", "Argon2 hash/verify time, including any wait for a pool process",
+    [0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5], ["operation"],
+))
+_OPERATIONS = {"_hash": "hash", "_verify": "verify", "_verify_and_update": "verify"}
+
+
+class PasswordHasher:
+    """
+    Argon2 hashing and verification, optionally off the web worker.
+
+    With ``workers`` > 0 every hash runs in a dedicated process pool of that
+    size, so a burst of logins is capped at ``workers`` cores and cannot starve
+    the threads serving other endpoints. With 0 hashing runs inline.
+    """
+
+    def __init__(self, time_cost: int = 3, memory_cost: int = 65536, parallelism: int = 4, workers: int = 0):
+        self.params = (time_cost, memory_cost, parallelism)
+        self.workers = max(0, workers)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._start_lock = threading.Lock()
+        self.context = build_context(*self.params)
+
+    def hash(self, password: str) -> str:
+        return self._call(_hash, password)
+
+    def verify(self, password: str, hashed: str) -> bool:
+        """Verify ``password`` only, for callers that do not persist an upgraded hash."""
+        return self._call(_verify, password, hashed)
+
+    def verify_and_update(self, password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+        """Verify ``password``; on success also return a new hash if ``hashed`` uses outdated parameters."""
+        return self._call(_verify_and_update, password, hashed)
+
+    async def hash_async(self, password: str) -> str:
+        return await self._call_async(_hash, password)
+
+    async def verify_and_update_async(self, password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+        return await self._call_async(_verify_and_update, password, hashed)
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _call(self, fn, *args):
+        started = time.perf_counter()
+        try:
+            if not self.workers:
+                return fn(*args, context=self.context)
+            return self._ensure_pool().submit(fn, *args).result()
+        finally:
+            hash_duration.labels(_OPERATIONS[fn.__name__]).observe(time.perf_counter() - started)
+
+    async def _call_async(self, fn, *args):
+        started = time.perf_counter()
+        try:
+            if not self.workers:
+                return await asyncio.to_thread(fn, *args, context=self.context)
+            return await asyncio.wrap_future(self._ensure_pool().submit(fn, *args))
+        finally:
+            hash_duration.labels(_OPERATIONS[fn.__name__]).observe(time.perf_counter() - started)
+
+    def _ensure_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            with self._start_lock:
+                if self._pool is None:
+                    # spawn: forking a process that holds DB connections and threads is unsafe
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=_init_worker,
+                        initargs=self.params,
+                    )
+                    logger.info("Started password hashing pool with %d workers", self.workers)
+        return self._pool
+
+
+password_hasher = PasswordHasher(
+    time_cost=settings.ARGON2_TIME_COST,
+    memory_cost=settings.ARGON2_MEMORY_COST,
+    parallelism=settings.ARGON2_PARALLELISM,
+    workers=settings.PASSWORD_HASH_WORKERS,
+)
@@ -1,6 +1,12 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from .routers import users, assessments, dashboard
-from .dependencies import Base, engine
+from .config import settings
+from .dependencies import async_engine
+from .batching import batcher
+from .audit import audit_buffer
+from .hashing import password_hasher
+from .metrics import MetricsMiddleware
+from .routers import admin, metrics
 
 import logging
 from fastapi.middleware.cors import CORSMiddleware
@@ -8,9 +14,27 @@ from fastapi.middleware.cors import CORSMiddleware
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-Base.metadata.create_all(bind=engine)
+# The async routers expose the same endpoints on AsyncSession/asyncpg
+if settings.ASYNC_DB:
+    from .aio.routers import users, assessments, dashboard, predictions
+else:
+    from .routers import users, assessments, dashboard, predictions
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Drain in-flight work before the worker exits
+    if batcher:
+        batcher.close()
+    if audit_buffer:
+        audit_buffer.close()
+    password_hasher.close()
+    if async_engine:
+        await async_engine.dispose()
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -19,7 +43,18 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+if settings.METRICS:
+    app.add_middleware(MetricsMiddleware)
 
 app.include_router(users.router)
 app.include_router(assessments.router)
 app.include_router(dashboard.router)
+app.include_router(predictions.router)
+app.include_router(admin.router)
+if settings.METRICS:
+    app.include_router(metrics.router)
+
+# Last, so every route is wrapped and the profiler is the outermost middleware
+if settings.PROFILING:
+    from .profiling import enable as enable_profiling
+    enable_profiling(app)
@@ -0,0 +1,234 @@
+import bisect
+import functools
+import threading
+import time
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+
+
+class Histogram:
+    """
+    Fixed-bucket, thread-safe histogram.
+
+    Buckets are upper bounds (inclusive); observations above the last bound land
+    in an implicit +Inf bucket. Counts are kept per bucket and cumulated only
+    when a snapshot is taken, so ``observe`` stays O(log buckets).
+    """
+
+    def __init__(self, name: str, description: str, buckets: Sequence[float]):
+        self.name = name
+        self.description = description
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[i] += 1
+            self._sum += value
+
+    def snapshot(self) -> dict:
+        """Cumulative bucket counts keyed by upper bound ("+Inf" last), plus count and sum."""
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        cumulative, running = {}, 0
+        for bound, count in zip([format(b, "g") for b in self.buckets] + ["+Inf"], counts):
+            running += count
+            cumulative[bound] = running
+        return {"buckets": cumulative, "count": running, "sum": total}
+
+
+class LabeledHistogram:
+    """A family of ``Histogram``s sharing name and buckets, one per label value tuple."""
+
+    def __init__(self, name: str, description: str, buckets: Sequence[float], label_names: Sequence[str]):
+        self.name = name
+        self.description = description
+        self.buckets = tuple(buckets)
+        self.label_names = tuple(label_names)
+        self._children: Dict[tuple, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str) -> Histogram:
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(values, Histogram(self.name, self.description, self.buckets))
+        return child
+
+    def children(self) -> List[Tuple[dict, Histogram]]:
+        with self._lock:
+            items = list(self._children.items())
+        return [(dict(zip(self.label_names, values)), child) for values, child in items]
+
+
+# A collector returns (name, type, help, [(labels, value), ...]) families for gauges and counters
+Collector = Callable[[], Iterable[Tuple[str, str, str, List[Tuple[dict, float]]]]]
+
+
+def _labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    escaped = (str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for v in labels.values())
+    return "{" + ",".join(f'{k}="{v}"' for k, v in zip(labels, escaped)) + "}"
+
+
+class MetricsRegistry:
+    """Histograms and collector callbacks rendered together in the Prometheus text format."""
+
+    def __init__(self):
+        self._histograms: List[object] = []
+        self._collectors: List[Collector] = []
+        self._lock = threading.Lock()
+
+    def histogram(self, metric):
+        """Register a ``Histogram`` or ``LabeledHistogram`` and return it."""
+        with self._lock:
+            self._histograms.append(metric)
+        return metric
+
+    def collector(self, fn: Collector) -> Collector:
+        with self._lock:
+            self._collectors.append(fn)
+        return fn
+
+    def render(self) -> str:
+        with self._lock:
+            histograms, collectors = list(self._histograms), list(self._collectors)
+        lines: List[str] = []
+        for metric in histograms:
+            children = metric.children() if isinstance(metric, LabeledHistogram) else [({}, metric)]
+            lines += [f"# HELP {metric.name} {metric.description}", f"# TYPE {metric.name} histogram"]
+            for labels, histogram in children:
+                snapshot = histogram.snapshot()
+                for bound, count in snapshot["buckets"].items():
+                    lines.append(f"{metric.name}_bucket{_labels({**labels, 'le': bound})} {count}")
+                lines.append(f"{metric.name}_sum{_labels(labels)} {snapshot['sum']}")
+                lines.append(f"{metric.name}_count{_labels(labels)} {snapshot['count']}")
+        for collect in collectors:
+            for name, kind, description, samples in collect():
+                lines += [f"# HELP {name} {description}", f"# TYPE {name} {kind}"]
+                lines += [f"{name}{_labels(labels)} {value}" for labels, value in samples]
+        return "\n".join(lines) + "\n"
+
+
+metrics_registry = MetricsRegistry()
+
+
+def timed(histogram: Histogram):
+    """Decorator observing each call's duration (including failed calls) in ``histogram``."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - started)
+        return wrapper
+    return decorate
+
+
+class RequestStats:
+    __slots__ = ("queries", "db_seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+
+
+# Database work of the request being served (None outside a request)
+current_request: ContextVar[Optional[RequestStats]] = ContextVar("current_request", default=None)
+
+LATENCY_BUCKETS = [0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10]
+
+request_latency = metrics_registry.histogram(LabeledHistogram(
+    "http_request_duration_seconds", "HTTP request latency by route",
+    LATENCY_BUCKETS, ["method", "route", "status"],
+))
+request_queries = metrics_registry.histogram(LabeledHistogram(
+    "http_request_db_queries", "Database queries issued per HTTP request",
+    [0, 1, 2, 3, 5, 8, 13, 21, 50, 100], ["method", "route"],
+))
+request_db_time = metrics_registry.histogram(LabeledHistogram(
+    "http_request_db_seconds", "Time spent in database queries per HTTP request",
+    LATENCY_BUCKETS, ["method", "route"],
+))
+query_duration = metrics_registry.histogram(Histogram(
+    "db_query_duration_seconds", "Database statement execution time", LATENCY_BUCKETS,
+))
+
+
+def instrument_engine(engine) -> Callable[[], None]:
+    """
+    Time every statement executed on ``engine`` (a sync Engine) and attribute it
+    to the current request. Returns a function that removes the listeners.
+    """
+
+    def before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    def after(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_started"].pop()
+        query_duration.observe(elapsed)
+        stats = current_request.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.db_seconds += elapsed
+
+    def failed(context):
+        if context.connection is not None and context.connection.info.get("query_started"):
+            context.connection.info["query_started"].pop()
+
+    listeners = [("before_cursor_execute", before), ("after_cursor_execute", after), ("handle_error", failed)]
+    for name, fn in listeners:
+        event.listen(engine, name, fn)
+
+    def remove() -> None:
+        for name, fn in listeners:
+            event.remove(engine, name, fn)
+
+    return remove
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording latency and database work per route.
+
+    Routes are labeled with their path template (``/assessments/``), never the
+    raw path, so label cardinality stays bounded; unmatched paths share one label.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        stats = RequestStats()
+        token = current_request.set(stats)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            current_request.reset(token)
+            route = scope.get("route")
+            path = getattr(route, "path", "unmatched")
+            method = scope["method"]
+            request_latency.labels(method, path, str(status["code"])).observe(elapsed)
+            request_queries.labels(method, path).observe(stats.queries)
+            request_db_time.labels(method, path).observe(stats.db_seconds)
@@ -0,0 +1,165 @@
+import hashlib
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import joblib
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LoadStats:
+    load_seconds: float
+    # Python-heap allocations still held once the load returned (numpy buffers included)
+    memory_bytes: int
+    # On-disk size of the artifacts behind it
+    artifact_bytes: int
+
+
+@dataclass
+class ModelEntry:
+    """A registered model: its artifact files and how to turn them into a scorer."""
+    name: str
+    version: str
+    artifacts: Tuple[str, ...]
+    builder: Callable[["ModelRegistry"], object]
+    model: object = None
+    stats: Optional[LoadStats] = None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    @property
+    def tag(self) -> str:
+        """Identifier persisted as ``Prediction.model_version``."""
+        return f"{self.name}@{self.version}"
+
+
+# Tracing is shared by overlapping (and nested) loads: the first one starts it,
+# the last one stops it, unless something else had it on already
+_trace_lock = threading.Lock()
+_trace_users = 0
+_trace_owned = False
+
+
+def _trace_begin() -> None:
+    global _trace_users, _trace_owned
+    with _trace_lock:
+        if _trace_users == 0:
+            _trace_owned = not tracemalloc.is_tracing()
+            if _trace_owned:
+                tracemalloc.start()
+        _trace_users += 1
+
+
+def _trace_end() -> None:
+    global _trace_users
+    with _trace_lock:
+        _trace_users -= 1
+        if _trace_users == 0 and _trace_owned:
+            tracemalloc.stop()
+
+
+def _measure(load: Callable[[], object], paths: Iterable[str]):
+    """
+    Run ``load`` and return its result with wall time, the allocations it kept
+    and the size of ``paths``. Tracing is only on while a load runs (once per
+    model and artifact); allocations other threads make meanwhile are counted
+    too, so memory is an upper bound.
+    """
+    _trace_begin()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        started = time.perf_counter()
+        result = load()
+        elapsed = time.perf_counter() - started
+        kept = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        _trace_end()
+    artifact_bytes = sum(os.path.getsize(path) for path in paths)
+    return result, LoadStats(load_seconds=elapsed, memory_bytes=max(kept, 0), artifact_bytes=artifact_bytes)
+
+
+class ModelRegistry:
+    """
+    Lazily loaded, versioned model artifacts.
+
+    Models are registered by (name, version) with the artifact files they need
+    and a builder that turns those artifacts into a scorer. Nothing is unpickled
+    until a model is first requested; each artifact file is loaded at most once
+    and shared between models (e.g. the scaler and label encoder). Load time,
+    memory and artifact size are recorded per model and per artifact.
+    """
+
+    def __init__(self, model_dir: str):
+        self.model_dir = model_dir
+        self._entries: Dict[Tuple[str, str], ModelEntry] = {}
+        self._artifacts: Dict[str, object] = {}
+        self._artifact_stats: Dict[str, LoadStats] = {}
+        self._artifact_lock = threading.Lock()
+
+    def register(self, name: str, version: str, artifacts, builder) -> None:
+        self._entries[(name, version)] = ModelEntry(name, version, tuple(artifacts), builder)
+
+    def entry(self, name: str, version: str) -> ModelEntry:
+        try:
+            return self._entries[(name, version)]
+        except KeyError:
+            raise KeyError(f"Unknown model {name}@{version}") from None
+
+    def artifact(self, filename: str):
+        """Unpickle ``filename`` from the model directory on first use."""
+        if filename not in self._artifacts:
+            with self._artifact_lock:
+                if filename not in self._artifacts:
+                    path = os.path.join(self.model_dir, filename)
+                    obj, stats = _measure(lambda: joblib.load(path), [path])
+                    self._artifact_stats[filename] = stats
+                    self._artifacts[filename] = obj
+        return self._artifacts[filename]
+
+    def get(self, name: str, version: str) -> ModelEntry:
+        """Return the entry for (name, version), building its model on first use."""
+        entry = self.entry(name, version)
+        if entry.model is None:
+            with entry.lock:
+                if entry.model is None:
+                    model, stats = _measure(lambda: entry.builder(self), self.paths(entry))
+                    entry.stats = stats
+                    entry.model = model
+                    logger.info(
+                        "Loaded model %s in %.1f ms (%.1f KiB in memory, %.1f KiB on disk)",
+                        entry.tag, stats.load_seconds * 1000, stats.memory_bytes / 1024, stats.artifact_bytes / 1024,
+                    )
+        return entry
+
+    def paths(self, entry: ModelEntry) -> List[str]:
+        return [os.path.join(self.model_dir, filename) for filename in entry.artifacts]
+
+    def fingerprint(self, name: str, version: str) -> str:
+        """Short digest of the artifact files behind a model, used to key derived caches."""
+        digest = hashlib.sha1()
+        for path in self.paths(self.entry(name, version)):
+            with open(path, "rb") as fh:
+                digest.update(fh.read())
+        return digest.hexdigest()[:12]
+
+    def stats(self) -> List[dict]:
+        """Per-model load status, load time, memory and artifact size (served on GET /admin/models)."""
+        return [
+            {
+                "name": entry.name,
+                "version": entry.version,
+                "loaded": entry.model is not None,
+                "load_seconds": entry.stats.load_seconds if entry.stats else None,
+                "memory_bytes": entry.stats.memory_bytes if entry.stats else None,
+                "artifact_bytes": entry.stats.artifact_bytes if entry.stats else None,
+            }
+            for entry in self._entries.values()
+        ]
+
+    def artifact_stats(self) -> Dict[str, LoadStats]:
+        return dict(self._artifact_stats)
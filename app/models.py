@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, DateTime, Boolean, Date, Integer, Float, ForeignKey
+from sqlalchemy import Column, String, DateTime, Boolean, Date, Integer, Float, ForeignKey, Index, UniqueConstraint, DDL, event, false
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -7,6 +7,8 @@ from .dependencies import Base
 
 class User(Base):
     __tablename__ = "users"
+    # Return server defaults (timestamps) from the INSERT itself via RETURNING
+    __mapper_args__ = {"eager_defaults": True}
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     email = Column(String, unique=True, nullable=False, index=True)
     password_hash = Column(String, nullable=False)
@@ -14,11 +16,20 @@ class User(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     last_login = Column(DateTime(timezone=True))
     is_active = Column(Boolean, default=True)
+    is_admin = Column(Boolean, default=False, server_default=false(), nullable=False)
     assessments = relationship("Assessment", back_populates="user")
     logs = relationship("AuditLog", back_populates="user")
 
 class Assessment(Base):
     __tablename__ = "assessments"
+    __mapper_args__ = {"eager_defaults": True}
+    # One assessment per user and day; resubmitting updates it (see crud.add_assessment_and_prediction)
+    __table_args__ = (
+        UniqueConstraint("user_id", "date", name="uq_assessment_user_date"),
+        # Day and change lookups for crud.refresh_cohort_stats
+        Index("ix_assessments_date", "date"),
+        Index("ix_assessments_submitted_at", "submitted_at"),
+    )
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id = Column(String, ForeignKey("users.id"), nullable=False)
     date = Column(Date, nullable=False)
@@ -31,7 +42,10 @@ class Assessment(Base):
 
 class Prediction(Base):
     __tablename__ = "predictions"
+    __mapper_args__ = {"eager_defaults": True}
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    # Copied from the assessment so per-user reads do not need to join through it
+    user_id = Column(String, ForeignKey("users.id"), nullable=False)
     assessment_id = Column(String, ForeignKey("assessments.id"), nullable=False)
     burnout_risk = Column(Boolean)
     label = Column(String)  # <--- New column
@@ -40,23 +54,71 @@ class Prediction(Base):
     predicted_at = Column(DateTime(timezone=True), server_default=func.now())
     assessment = relationship("Assessment", back_populates="prediction")
 
+    __table_args__ = (
+        Index("ix_predictions_user_predicted_at", "user_id", predicted_at.desc()),
+        Index("ix_predictions_assessment_id", "assessment_id", unique=True),
+        Index("ix_predictions_predicted_at", "predicted_at"),
+    )
+
 
 class DailySummaryRolling7D(Base):
     __tablename__ = "daily_summary_rolling_7d"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (UniqueConstraint("user_id", "summary_date", name="uq_daily_summary_user_date"),)
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id = Column(String, ForeignKey("users.id"), nullable=False)
-    summary_date = Column(Date)
+    summary_date = Column(Date, nullable=False)
+    # Running totals over [summary_date - 6, summary_date], maintained incrementally
+    assessment_count = Column(Integer, nullable=False, default=0)
+    sum_tired = Column(Integer, nullable=False, default=0)
+    sum_capable = Column(Integer, nullable=False, default=0)
+    sum_meaningful = Column(Integer, nullable=False, default=0)
     avg_tired_last_7_days = Column(Float)
     avg_capable_last_7_days = Column(Float)
     avg_meaningful_last_7_days = Column(Float)
     features_json = Column(JSONB)
     computed_at = Column(DateTime(timezone=True), server_default=func.now())
 
+class CohortDailyStats(Base):
+    __tablename__ = "cohort_daily_stats"
+    # Org-wide totals per assessment day, maintained by crud.refresh_cohort_stats
+    day = Column(Date, primary_key=True)
+    assessment_count = Column(Integer, nullable=False, default=0)
+    sum_tired = Column(Integer, nullable=False, default=0)
+    sum_capable = Column(Integer, nullable=False, default=0)
+    sum_meaningful = Column(Integer, nullable=False, default=0)
+    prediction_count = Column(Integer, nullable=False, default=0)
+    low_count = Column(Integer, nullable=False, default=0)
+    moderate_count = Column(Integer, nullable=False, default=0)
+    high_count = Column(Integer, nullable=False, default=0)
+    refreshed_at = Column(DateTime(timezone=True), server_default=func.now())
+
+class CohortRefreshState(Base):
+    __tablename__ = "cohort_refresh_state"
+    # Single row: assessments and predictions written before the watermark are in cohort_daily_stats
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    watermark = Column(DateTime(timezone=True), nullable=False)
+
 class AuditLog(Base):
     __tablename__ = "audit_logs"
+    __mapper_args__ = {"eager_defaults": True}
+    # Range-partitioned by month on timestamp, which therefore has to be part of
+    # the primary key. Monthly partitions come from scripts/create_audit_partitions.py;
+    # rows outside them land in audit_logs_default.
+    __table_args__ = (
+        Index("ix_audit_logs_user_timestamp", "user_id", "timestamp"),
+        {"postgresql_partition_by": "RANGE (timestamp)"},
+    )
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id = Column(String, ForeignKey("users.id"), nullable=False)
     action = Column(String, nullable=False)
     details = Column(String)
-    timestamp = Column(DateTime(timezone=True), server_default=func.now())
+    timestamp = Column(DateTime(timezone=True), primary_key=True, server_default=func.now())
     user = relationship("User", back_populates="logs")
+
+
+event.listen(
+    AuditLog.__table__,
+    "after_create",
+    DDL("CREATE TABLE IF NOT EXISTS audit_logs_default PARTITION OF audit_logs DEFAULT"),
+)
@@ -0,0 +1,102 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, select, tuple_
+
+from app.crud import day_bounds
+from app.models import Assessment, Prediction
+from app.schemas import AssessmentOut, AssessmentPage, PredictionOut, PredictionPage
+
+# Page sizes accepted by the history endpoints
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def encode_cursor(*values) -> str:
+    """Opaque token for the sort key of the last row on a page."""
+    raw = json.dumps([value.isoformat() if isinstance(value, (date, datetime)) else value for value in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, parsers: Sequence[Callable]) -> tuple:
+    """Sort key from ``encode_cursor``, each value passed through its parser (400 if malformed)."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if len(values) != len(parsers):
+            raise ValueError(cursor)
+        return tuple(parse(value) for parse, value in zip(parsers, values))
+    except (ValueError, TypeError, binascii.Error):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def before(sort_col, id_col, key: tuple):
+    """
+    Rows after ``key`` in (sort_col DESC, id DESC) order. The plain ``<=`` bound
+    on sort_col is what lets the (user_id, sort_col) index seek straight to the
+    page; the row comparison only separates ties.
+    """
+    return and_(sort_col <= key[0], tuple_(sort_col, id_col) < key)
+
+
+def keyset_page(rows: Sequence, limit: int, key: Callable) -> Tuple[List, Optional[str]]:
+    """Split ``limit + 1`` fetched rows into the page and the cursor for the next one."""
+    if len(rows) <= limit:
+        return list(rows), None
+    page = list(rows[:limit])
+    return page, encode_cursor(*key(page[-1]))
+
+
+def assessment_page_stmt(user_id: str, cursor: Optional[str], start: Optional[date], end: Optional[date], limit: int):
+    """
+    One page of a user's assessments, newest first, as plain columns. Seeks on
+    uq_assessment_user_date from the cursor, so deep pages cost the same as the first.
+    """
+    a = Assessment
+    stmt = (
+        select(a.id, a.date, a.tired_score, a.capable_score, a.meaningful_score, a.submitted_at)
+        .where(a.user_id == user_id)
+        .order_by(a.date.desc(), a.id.desc())
+        .limit(limit + 1)
+    )
+    if cursor is not None:
+        stmt = stmt.where(before(a.date, a.id, decode_cursor(cursor, (date.fromisoformat, str))))
+    if start is not None:
+        stmt = stmt.where(a.date >= start)
+    if end is not None:
+        stmt = stmt.where(a.date <= end)
+    return stmt
+
+
+def build_assessment_page(rows, limit: int) -> AssessmentPage:
+    items, next_cursor = keyset_page(rows, limit, lambda row: (row.date, row.id))
+    return AssessmentPage(items=[AssessmentOut(**row._mapping) for row in items], next_cursor=next_cursor)
+
+
+def prediction_page_stmt(user_id: str, cursor: Optional[str], start: Optional[date], end: Optional[date], limit: int):
+    """
+    One page of a user's predictions, newest first, as plain columns. Seeks on
+    ix_predictions_user_predicted_at from the cursor, so deep pages cost the same as the first.
+    """
+    p = Prediction
+    stmt = (
+        select(p.id, p.assessment_id, p.burnout_risk, p.label, p.confidence, p.model_version, p.predicted_at)
+        .where(p.user_id == user_id)
+        .order_by(p.predicted_at.desc(), p.id.desc())
+        .limit(limit + 1)
+    )
+    if cursor is not None:
+        stmt = stmt.where(before(p.predicted_at, p.id, decode_cursor(cursor, (datetime.fromisoformat, str))))
+    if start is not None:
+        stmt = stmt.where(p.predicted_at >= day_bounds(start)[0])
+    if end is not None:
+        stmt = stmt.where(p.predicted_at < day_bounds(end)[1])
+    return stmt
+
+
+def build_prediction_page(rows, limit: int) -> PredictionPage:
+    items, next_cursor = keyset_page(rows, limit, lambda row: (row.predicted_at, row.id))
+    return PredictionPage(items=[PredictionOut(**row._mapping) for row in items], next_cursor=next_cursor)
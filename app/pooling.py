@@ -0,0 +1,107 @@
+import threading
+import time
+import uuid
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.config import settings
+from app.metrics import LabeledHistogram, metrics_registry
+
+
+pool_wait = metrics_registry.histogram(LabeledHistogram(
+    "db_pool_wait_seconds", "Time to obtain a pooled database connection",
+    [0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30], ["pool"],
+))
+
+
+class PoolTelemetry:
+    """
+    Checkout counters for a QueuePool.
+
+    Mixed into the pool class so every ``connect`` is timed: the wait
+    histogram covers queueing for a free connection plus opening (and
+    pre-pinging) one and is shared by all pools of the same ``kind`` (so it
+    survives pool re-creation). Checkouts that give up after ``pool_timeout``
+    are counted as timeouts. ``stats`` adds the pool's own occupancy figures.
+    """
+
+    kind = "sync"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._telemetry_lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait = pool_wait.labels(self.kind)
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            with self._telemetry_lock:
+                self.timeouts += 1
+            raise
+        self.wait.observe(time.perf_counter() - started)
+        with self._telemetry_lock:
+            self.checkouts += 1
+        return connection
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size(),
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            # QueuePool counts overflow from -pool_size up while the pool fills
+            "overflow": max(0, self.overflow()),
+            "max_overflow": self._max_overflow,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_seconds": self.wait.snapshot(),
+        }
+
+
+class InstrumentedQueuePool(PoolTelemetry, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(PoolTelemetry, AsyncAdaptedQueuePool):
+    kind = "async"
+
+
+def pool_metrics(pools):
+    """Collector for ``metrics_registry``: occupancy and counters of ``pools()`` ({kind: pool})."""
+    def collect():
+        stats = {kind: pool.stats() for kind, pool in pools().items()}
+        for key, kind, description in (
+            ("size", "gauge", "Configured pool size"),
+            ("checked_out", "gauge", "Connections currently checked out"),
+            ("overflow", "gauge", "Overflow connections currently open"),
+            ("checkouts", "counter", "Connections handed out by the pool"),
+            ("timeouts", "counter", "Checkouts that gave up after pool_timeout"),
+        ):
+            name = f"db_pool_{key}_total" if kind == "counter" else f"db_pool_{key}"
+            yield name, kind, description, [({"pool": pool}, s[key]) for pool, s in stats.items()]
+    return collect
+
+
+def engine_options(is_async: bool = False) -> dict:
+    """create_engine / create_async_engine keyword arguments from the DB_* settings."""
+    options = {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    if settings.DB_PGBOUNCER and is_async:
+        # PgBouncer in transaction mode may hand each transaction a different
+        # server connection, so asyncpg must not reuse named prepared statements
+        options["connect_args"] = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+        }
+    return options
@@ -1,26 +1,202 @@
-import joblib
 import numpy as np
 import os
+from abc import ABC, abstractmethod
+from typing import Optional
+from app.config import settings
+from app.metrics import LabeledHistogram, metrics_registry, timed
+from app.model_registry import ModelRegistry
 
 # Resolve model paths relative to the current file's directory
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 MODEL_DIR = os.path.join(BASE_DIR, "..", "model", "output")
 
-# Load all models and artifacts
-lr = joblib.load(os.path.join(MODEL_DIR, "logistic_regression_model.pkl"))
-rf = joblib.load(os.path.join(MODEL_DIR, "random_forest_model.pkl"))
-xgb = joblib.load(os.path.join(MODEL_DIR, "xgboost_model.pkl"))
-scaler = joblib.load(os.path.join(MODEL_DIR, "burnout_scaler.pkl"))
-label_enc = joblib.load(os.path.join(MODEL_DIR, "burnout_label_encoder.pkl"))
+SCALER_FILE = "burnout_scaler.pkl"
+LABEL_ENCODER_FILE = "burnout_label_encoder.pkl"
 
-def predict_burnout(avg_tired: float, avg_capable: float, avg_meaningful: float):
+
+class ScoringEngine(ABC):
+    """Common interface: ``predict_proba`` over raw (N, 3) features plus label decoding."""
+
+    labels: np.ndarray
+    # Optional PredictionTable attached at load time
+    table = None
+
+    @abstractmethod
+    def predict_proba(self, X) -> np.ndarray:
+        ...
+
+    def predict(self, X):
+        """Return (labels, confidences) arrays for a single row or an (N, 3) batch."""
+        proba = self.predict_proba(X)
+        idx = proba.argmax(axis=1)
+        return self.labels[idx], proba[np.arange(len(idx)), idx]
+
+
+class LogisticRegressionEngine(ScoringEngine):
+    """
+    Closed-form NumPy scorer for the scaled multinomial Logistic Regression.
+
+    The scaler statistics, coefficients, intercepts and decoded class labels are
+    pulled out of the fitted sklearn objects once, so scoring is a single
+    standardize + affine + softmax pass with no sklearn validation. The operations
+    are applied in the same order sklearn uses, so probabilities are bit-for-bit
+    identical to ``lr.predict_proba(scaler.transform(X))``.
+    """
+
+    def __init__(self, scaler, model, label_encoder):
+        self.mean = np.array(scaler.mean_ if scaler.with_mean else 0.0, dtype=np.float64)
+        self.scale = np.array(scaler.scale_ if scaler.with_std else 1.0, dtype=np.float64)
+        self.coef_t = np.ascontiguousarray(model.coef_.T, dtype=np.float64)
+        self.intercept = np.array(model.intercept_, dtype=np.float64)
+        # Column i of the probability matrix maps straight to its decoded label
+        self.labels = np.asarray(label_encoder.inverse_transform(model.classes_))
+
+    def predict_proba(self, X) -> np.ndarray:
+        """Class probabilities for a (3,) row or an (N, 3) batch, shape (N, n_classes)."""
+        X = np.asarray(X, dtype=np.float64).reshape(-1, self.coef_t.shape[0])
+        z = ((X - self.mean) / self.scale) @ self.coef_t + self.intercept
+        z -= z.max(axis=1, keepdims=True)
+        np.exp(z, out=z)
+        z /= z.sum(axis=1, keepdims=True)
+        return z
+
+
+class EstimatorEngine(ScoringEngine):
+    """
+    Scorer for tree ensembles (Random Forest, XGBoost) fitted on unscaled features.
+
+    These have no closed form worth replicating, so this calls the estimator's own
+    ``predict_proba`` once per row or batch.
+    """
+
+    def __init__(self, model, label_encoder):
+        self.model = model
+        self.n_features = model.n_features_in_
+        self.labels = np.asarray(label_encoder.inverse_transform(model.classes_))
+
+    def predict_proba(self, X) -> np.ndarray:
+        X = np.asarray(X, dtype=np.float64).reshape(-1, self.n_features)
+        return np.asarray(self.model.predict_proba(X), dtype=np.float64)
+
+
+class PredictionTable:
+    """
+    Precomputed label/confidence for every point of the model's input domain.
+
+    Features are 7-day means of integer 0-6 answers, so each axis only takes the
+    values k/7 for k in 0..42. The table holds one (label index, confidence)
+    record per lattice point (43^3 records, ~0.7 MB) and predictions for
+    on-lattice inputs become a single index lookup. Inputs that are not exactly
+    on the lattice return None so callers can fall back to live scoring.
+    """
+
+    STEPS = 7
+    SIZE = 6 * STEPS + 1
+    DTYPE = np.dtype([("label", np.uint8), ("confidence", np.float64)])
+
+    def __init__(self, records: np.ndarray, labels: np.ndarray):
+        self.records = records
+        self.labels = labels
+
+    @classmethod
+    def build(cls, engine: ScoringEngine) -> "PredictionTable":
+        axis = np.arange(cls.SIZE) / cls.STEPS
+        grid = np.stack(np.meshgrid(axis, axis, axis, indexing="ij"), axis=-1).reshape(-1, 3)
+        proba = engine.predict_proba(grid)
+        records = np.empty(len(grid), dtype=cls.DTYPE)
+        records["label"] = proba.argmax(axis=1)
+        records["confidence"] = proba.max(axis=1)
+        return cls(records.reshape(cls.SIZE, cls.SIZE, cls.SIZE), engine.labels)
+
+    @classmethod
+    def load_or_build(cls, engine: ScoringEngine, directory: Optional[str] = None,
+                      key: str = "") -> "PredictionTable":
+        """Build the table, or memory-map it from ``directory`` when a copy for ``key`` exists."""
+        if not directory:
+            return cls.build(engine)
+        path = os.path.join(directory, f"prediction_table_{key}.npy")
+        if not os.path.exists(path):
+            os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as fh:
+                np.save(fh, cls.build(engine).records)
+            os.replace(tmp_path, path)
+        return cls(np.load(path, mmap_mode="r"), engine.labels)
+
+    def index(self, X: np.ndarray):
+        """Lattice indices of each row of X and a mask of rows that are exactly on the lattice."""
+        k = np.rint(X * self.STEPS)
+        on_lattice = np.all((k / self.STEPS == X) & (k >= 0) & (k < self.SIZE), axis=1)
+        return k.astype(np.intp), on_lattice
+
+    def lookup(self, avg_tired: float, avg_capable: float, avg_meaningful: float):
+        """Return (label, confidence) for an on-lattice input, otherwise None."""
+        k, on_lattice = self.index(np.array([[avg_tired, avg_capable, avg_meaningful]], dtype=np.float64))
+        if not on_lattice[0]:
+            return None
+        record = self.records[tuple(k[0])]
+        return self.labels[record["label"]], record["confidence"]
+
+
+def _register(name: str, version: str, model_file: str, scaled: bool) -> None:
+    artifacts = (model_file, SCALER_FILE, LABEL_ENCODER_FILE) if scaled else (model_file, LABEL_ENCODER_FILE)
+
+    def build(reg: ModelRegistry):
+        if scaled:
+            engine = LogisticRegressionEngine(
+                reg.artifact(SCALER_FILE), reg.artifact(model_file), reg.artifact(LABEL_ENCODER_FILE)
+            )
+        else:
+            engine = EstimatorEngine(reg.artifact(model_file), reg.artifact(LABEL_ENCODER_FILE))
+        if settings.PREDICTION_LOOKUP_TABLE:
+            engine.table = PredictionTable.load_or_build(
+                engine, settings.PREDICTION_LOOKUP_DIR, reg.fingerprint(name, version)
+            )
+        return engine
+
+    registry.register(name, version, artifacts, build)
+
+
+# Artifacts are unpickled lazily, the first time a model is scored
+registry = ModelRegistry(MODEL_DIR)
+_register("logistic_regression", "1", "logistic_regression_model.pkl", scaled=True)
+_register("random_forest", "1", "random_forest_model.pkl", scaled=False)
+_register("xgboost", "1", "xgboost_model.pkl", scaled=False)
+
+
+def _to_result(label, confidence, model_version: str) -> dict:
+    label = str(label)
+    return {
+        "burnout_risk": label.lower() == "high",
+        "label": label,
+        "confidence": float(confidence),
+        "model_version": model_version
+    }
+
+
+def active_model(model: Optional[str] = None, version: Optional[str] = None):
+    """Registry entry a prediction would use; unset arguments fall back to MODEL_NAME/MODEL_VERSION."""
+    return registry.get(model or settings.MODEL_NAME, version or settings.MODEL_VERSION)
+
+
+prediction_duration = metrics_registry.histogram(LabeledHistogram(
+    "prediction_duration_seconds", "Time spent inside predict_burnout and predict_burnout_batch",
+    [0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5], ["function"],
+))
+
+
+@timed(prediction_duration.labels("predict_burnout"))
+def predict_burnout(avg_tired: float, avg_capable: float, avg_meaningful: float,
+                    model: Optional[str] = None, version: Optional[str] = None):
     """
-    Predict burnout risk using the Logistic Regression model with proper scaling.
+    Predict burnout risk using the configured model (Logistic Regression by default).
 
     Args:
         avg_tired (float): Average tiredness score
         avg_capable (float): Average capability score
         avg_meaningful (float): Average meaningfulness score
+        model (str, optional): Registered model name, defaults to ``settings.MODEL_NAME``
+        version (str, optional): Registered model version, defaults to ``settings.MODEL_VERSION``
 
     Returns:
         dict: {
@@ -30,24 +206,41 @@ def predict_burnout(avg_tired: float, avg_capable: float, avg_meaningful: float)
             "model_version": str
         }
     """
-    data = np.array([[avg_tired, avg_capable, avg_meaningful]])
-
-    # Scale input
-    scaled = scaler.transform(data)
+    entry = active_model(model, version)
+    engine = entry.model
+    if engine.table is not None:
+        hit = engine.table.lookup(avg_tired, avg_capable, avg_meaningful)
+        if hit is not None:
+            return _to_result(*hit, entry.tag)
+    labels, confidences = engine.predict([avg_tired, avg_capable, avg_meaningful])
+    return _to_result(labels[0], confidences[0], entry.tag)
 
-    # Predict encoded class label
-    encoded_pred = lr.predict(scaled)[0]
 
-    # Decode to actual label (e.g., "Low", "Moderate", "High")
-    label = label_enc.inverse_transform([encoded_pred])[0]
+@timed(prediction_duration.labels("predict_burnout_batch"))
+def predict_burnout_batch(features, model: Optional[str] = None, version: Optional[str] = None) -> list:
+    """
+    Vectorized ``predict_burnout`` for many rows at once.
 
-    # Get class probabilities
-    proba = lr.predict_proba(scaled)[0]
-    confidence = float(np.max(proba))
+    Args:
+        features: (N, 3) array-like of (avg_tired, avg_capable, avg_meaningful) rows
+        model (str, optional): Registered model name, defaults to ``settings.MODEL_NAME``
+        version (str, optional): Registered model version, defaults to ``settings.MODEL_VERSION``
 
-    return {
-        "burnout_risk": label.lower() == "high",
-        "label": label,
-        "confidence": confidence,
-        "model_version": "logistic_regression"
-    }
+    Returns:
+        list[dict]: one ``predict_burnout``-shaped result per input row
+    """
+    entry = active_model(model, version)
+    engine, table = entry.model, entry.model.table
+    X = np.asarray(features, dtype=np.float64).reshape(-1, 3)
+    if table is None:
+        labels, confidences = engine.predict(X)
+    else:
+        labels = np.empty(len(X), dtype=engine.labels.dtype)
+        confidences = np.empty(len(X), dtype=np.float64)
+        k, on_lattice = table.index(X)
+        records = table.records[k[on_lattice, 0], k[on_lattice, 1], k[on_lattice, 2]]
+        labels[on_lattice] = table.labels[records["label"]]
+        confidences[on_lattice] = records["confidence"]
+        if not on_lattice.all():
+            labels[~on_lattice], confidences[~on_lattice] = engine.predict(X[~on_lattice])
+    return [_to_result(label, conf, entry.tag) for label, conf in zip(labels, confidences)]
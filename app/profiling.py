@@ -0,0 +1,203 @@
+import functools
+import inspect
+import logging
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from contextvars import ContextVar
+from typing import Optional
+
+from fastapi.routing import APIRoute
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "x-profile"
+
+
+class RequestProfile:
+    """
+    Stack samples of one request, in folded ("a;b;c count") flamegraph format.
+
+    Threads running the request's endpoint or dependencies register themselves
+    (see ``install``); a sampler thread reads their current frames every
+    ``interval`` seconds. Async callables register the event loop thread, whose
+    samples can include other requests interleaved with this one.
+    """
+
+    def __init__(self, name: str, interval: float):
+        self.name = name
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._threads: Counter = Counter()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sampler = threading.Thread(target=self._run, name=f"profiler-{name}", daemon=True)
+
+    def enter(self) -> None:
+        with self._lock:
+            self._threads[threading.get_ident()] += 1
+
+    def exit(self) -> None:
+        with self._lock:
+            self._threads[threading.get_ident()] -= 1
+
+    def start(self) -> None:
+        self._sampler.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._sampler.join()
+
+    def folded(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            with self._lock:
+                threads = [ident for ident, depth in self._threads.items() if depth > 0]
+            frames = sys._current_frames()
+            for ident in threads:
+                frame = frames.get(ident)
+                if frame is not None:
+                    self.stacks[_fold(frame)] += 1
+                    self.samples += 1
+
+
+_WRAPPER_CODES = set()
+
+
+def _fold(frame) -> str:
+    """Root-first ``;``-joined frames, cut at the profiling wrapper."""
+    names = []
+    while frame is not None and frame.f_code not in _WRAPPER_CODES:
+        code = frame.f_code
+        names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(";", ":"))
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+current_profile: ContextVar[Optional[RequestProfile]] = ContextVar("current_profile", default=None)
+
+
+def _profiled(call):
+    """Wrap a plain or async callable so it registers its thread with the active profile."""
+    if inspect.iscoroutinefunction(call):
+        @functools.wraps(call)
+        async def wrapper(*args, **kwargs):
+            profile = current_profile.get()
+            if profile is None:
+                return await call(*args, **kwargs)
+            profile.enter()
+            try:
+                return await call(*args, **kwargs)
+            finally:
+                profile.exit()
+    else:
+        @functools.wraps(call)
+        def wrapper(*args, **kwargs):
+            profile = current_profile.get()
+            if profile is None:
+                return call(*args, **kwargs)
+            profile.enter()
+            try:
+                return call(*args, **kwargs)
+            finally:
+                profile.exit()
+    _WRAPPER_CODES.add(wrapper.__code__)
+    return wrapper
+
+
+def _wrap_dependant(dependant, seen: set) -> None:
+    for sub in dependant.dependencies:
+        _wrap_dependant(sub, seen)
+    call = dependant.call
+    # Generator dependencies (sessions) are left alone: FastAPI runs them as context managers
+    if call is None or id(call) in seen or inspect.isgeneratorfunction(call) or inspect.isasyncgenfunction(call):
+        return
+    if not (inspect.isfunction(call) or inspect.iscoroutinefunction(call)):
+        return
+    dependant.call = _profiled(call)
+    seen.add(id(dependant.call))
+
+
+def install(app) -> None:
+    """Wrap every route's endpoint and dependencies of ``app``. Call after all routers are included."""
+    seen: set = set()
+    for route in app.routes:
+        if isinstance(route, APIRoute):
+            _wrap_dependant(route.dependant, seen)
+
+
+class ProfilingMiddleware:
+    """
+    Profile requests carrying ``X-Profile: <PROFILE_TOKEN>`` or a random
+    ``PROFILE_SAMPLE_RATE`` share of them. Each profile is written to
+    ``PROFILE_DIR`` as ``<name>.folded`` (input for flamegraph.pl or
+    speedscope) and its name returned in the ``X-Profile-Id`` header.
+    """
+
+    def __init__(self, app, directory: str, token: Optional[str] = None,
+                 sample_rate: float = 0.0, interval_ms: float = 1.0):
+        self.app = app
+        self.directory = directory
+        self.token = token
+        self.sample_rate = sample_rate
+        self.interval = interval_ms / 1000
+
+    def _selected(self, scope) -> bool:
+        if self.token:
+            for key, value in scope.get("headers", ()):
+                if key == PROFILE_HEADER.encode() and value.decode() == self.token:
+                    return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._selected(scope):
+            await self.app(scope, receive, send)
+            return
+
+        slug = scope["path"].strip("/").replace("/", "_") or "root"
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}-{scope['method']}-{slug}-{uuid.uuid4().hex[:8]}"
+        profile = RequestProfile(name, self.interval)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + [(b"x-profile-id", name.encode())]
+            await send(message)
+
+        token = current_profile.set(profile)
+        profile.start()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            profile.stop()
+            current_profile.reset(token)
+            self._write(profile, time.perf_counter() - started)
+
+    def _write(self, profile: RequestProfile, elapsed: float) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"{profile.name}.folded")
+        with open(path, "w") as f:
+            f.write(profile.folded())
+        logger.info("Profiled request in %.1f ms (%d samples) -> %s", elapsed * 1000, profile.samples, path)
+
+
+def enable(app) -> None:
+    """Turn on profiling for ``app`` according to the PROFILE_* settings."""
+    install(app)
+    app.add_middleware(
+        ProfilingMiddleware,
+        directory=settings.PROFILE_DIR,
+        token=settings.PROFILE_TOKEN,
+        sample_rate=settings.PROFILE_SAMPLE_RATE,
+        interval_ms=settings.PROFILE_INTERVAL_MS,
+    )
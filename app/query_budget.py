@@ -0,0 +1,82 @@
+import time
+from collections import Counter
+from typing import Dict, List, NamedTuple, Optional
+
+from sqlalchemy import event
+
+
+class RecordedQuery(NamedTuple):
+    statement: str
+    parameters: object
+    seconds: float
+
+
+class QueryRecorder:
+    """
+    Record every statement executed on a sync ``engine`` while active.
+
+    Used as a context manager around one request (``with QueryRecorder(engine)
+    as queries: client.post(...)``), it gives the statement count and DB time of
+    that request. Statements are compared by their SQL text with bound
+    parameters left out, so the same SELECT issued once per row shows up in
+    ``repeated()`` as a likely N+1.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.queries: List[RecordedQuery] = []
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("recorder_started", []).append(time.perf_counter())
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["recorder_started"].pop()
+        self.queries.append(RecordedQuery(" ".join(statement.split()), parameters, elapsed))
+
+    def _failed(self, context):
+        if context.connection is not None and context.connection.info.get("recorder_started"):
+            context.connection.info["recorder_started"].pop()
+
+    def __enter__(self) -> "QueryRecorder":
+        event.listen(self.engine, "before_cursor_execute", self._before)
+        event.listen(self.engine, "after_cursor_execute", self._after)
+        event.listen(self.engine, "handle_error", self._failed)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        event.remove(self.engine, "before_cursor_execute", self._before)
+        event.remove(self.engine, "after_cursor_execute", self._after)
+        event.remove(self.engine, "handle_error", self._failed)
+
+    @property
+    def count(self) -> int:
+        return len(self.queries)
+
+    @property
+    def db_seconds(self) -> float:
+        return sum(query.seconds for query in self.queries)
+
+    def repeated(self, threshold: int = 2) -> Dict[str, int]:
+        """Statements issued at least ``threshold`` times, with their counts."""
+        counts = Counter(query.statement for query in self.queries)
+        return {statement: n for statement, n in counts.items() if n >= threshold}
+
+    def report(self) -> str:
+        lines = [f"{self.count} statements, {self.db_seconds * 1000:.1f} ms"]
+        lines += [f"  {i}. {query.statement}" for i, query in enumerate(self.queries, 1)]
+        return "\n".join(lines)
+
+    def assert_budget(self, max_statements: int, max_repeats: Optional[int] = 1) -> None:
+        """
+        Fail if more than ``max_statements`` ran or, unless ``max_repeats`` is
+        None, any statement ran more than ``max_repeats`` times.
+        """
+        problems = []
+        if self.count > max_statements:
+            problems.append(f"expected at most {max_statements} statements")
+        if max_repeats is not None:
+            problems += [
+                f"possible N+1: {n}x {statement}"
+                for statement, n in self.repeated(max_repeats + 1).items()
+            ]
+        assert not problems, "\n".join(problems + [self.report()])
@@ -0,0 +1,97 @@
+from datetime import date, timedelta
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from app.auth import get_current_admin
+from app.crud import deactivate_user, get_cohort_stats, get_cohort_watermark, log_action, refresh_cohort_stats
+from app.dependencies import engine, async_engine, get_db, get_engine, unit_of_work
+from app.export import ENCODERS, export_columns, export_response, history_stmt, stream_export
+from app.models import User
+from app.predict import registry
+from app.schemas import CohortStatsOut
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(get_current_admin)])
+
+# Longest range one cohort request may cover, so its cost stays bounded
+MAX_COHORT_DAYS = 366
+
+
+@router.get("/pool")
+def pool_stats():
+    """Connection pool occupancy and checkout telemetry of this worker's engines."""
+    stats = {"sync": engine.pool.stats()}
+    if async_engine is not None:
+        stats["async"] = async_engine.pool.stats()
+    return stats
+
+
+@router.post("/users/{user_id}/deactivate")
+def deactivate(user_id: str, db: Session = Depends(get_db), admin: User = Depends(get_current_admin)):
+    """Block a user's logins and existing tokens; cached principals on this worker are dropped."""
+    user = db.get(User, user_id)
+    if user is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    with unit_of_work(db):
+        deactivate_user(db, user)
+        log_action(db, admin.id, "deactivate_user", details=f"user_id={user_id}")
+    return {"id": user.id, "is_active": user.is_active}
+
+
+@router.get("/models")
+def model_stats():
+    """Registered models, whether this worker has loaded them, load time and artifact size."""
+    return registry.stats()
+
+
+@router.get("/cohorts", response_model=CohortStatsOut)
+def cohort_stats(
+    bucket: Literal["day", "week"] = "day",
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    db: Session = Depends(get_db),
+):
+    """
+    Org-wide Low/Moderate/High counts and mean scores per day or week, read from
+    the pre-aggregated cohort_daily_stats (see POST /admin/cohorts/refresh).
+    Defaults to the last 30 days, or the last 12 weeks.
+    """
+    end = end or date.today()
+    start = start or end - timedelta(days=29 if bucket == "day" else 7 * 12 - 1)
+    if bucket == "week":
+        start -= timedelta(days=start.weekday())
+    if start > end or (end - start).days >= MAX_COHORT_DAYS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail=f"start must be on or before end and at most {MAX_COHORT_DAYS} days earlier")
+    return CohortStatsOut(
+        bucket=bucket,
+        refreshed_at=get_cohort_watermark(db),
+        buckets=get_cohort_stats(db, start, end, bucket),
+    )
+
+
+@router.post("/cohorts/refresh")
+def refresh_cohorts(full: bool = False, db: Session = Depends(get_db)):
+    """Fold assessments and predictions written since the last refresh into cohort_daily_stats."""
+    with unit_of_work(db):
+        days = refresh_cohort_stats(db, full=full)
+    return {"days": days}
+
+
+@router.get("/export")
+def export_all_history(
+    fmt: Literal["csv", "ndjson"] = Query("csv", alias="format"),
+    compress: bool = False,
+    user_id: Optional[str] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    db: Session = Depends(get_db),
+    bind: Engine = Depends(get_engine),
+    admin: User = Depends(get_current_admin),
+):
+    """Org-wide (or one user's) assessments and predictions, streamed with constant memory."""
+    stmt = history_stmt(user_id, start, end)
+    encoder = ENCODERS[fmt](export_columns(stmt))
+    with unit_of_work(db):
+        log_action(db, admin.id, "export_all_history", details=f"format={fmt} user_id={user_id or '*'}")
+    return export_response(stream_export(bind, stmt, encoder, compress), encoder, compress, "burnout-history-all")
@@ -1,36 +1,115 @@
-from fastapi import APIRouter, Depends
+from datetime import date
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
-from app.schemas import DailyAssessmentIn
-from app.dependencies import get_db
+from app.schemas import AssessmentPage, DailyAssessmentIn, BulkAssessmentIn, BulkAssessmentOut
+from app.dependencies import get_db, get_engine, unit_of_work
+from app.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, assessment_page_stmt, build_assessment_page
+from app.export import ENCODERS, export_columns, export_response, history_stmt, stream_export
 from app.auth import get_current_user
-from app.crud import add_assessment_and_prediction, compute_rolling_summary, log_action
-from app.predict import predict_burnout
+from app.crud import (
+    add_assessment_and_prediction, add_assessments_and_predictions_bulk, compute_rolling_summary, log_action
+)
+from app.predict import predict_burnout, predict_burnout_batch
+from app.batching import batcher
 from ..models import User
 
 router = APIRouter(prefix="/assessments", tags=["assessments"])
 
+
+@router.get("/", response_model=AssessmentPage)
+def list_assessments(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    db: Session = Depends(get_db),
+    current: User = Depends(get_current_user)
+):
+    """The caller's assessments, newest first; follow next_cursor for older pages."""
+    rows = db.execute(assessment_page_stmt(current.id, cursor, start, end, limit)).all()
+    return build_assessment_page(rows, limit)
+
+
 @router.post("/")
 def submit_daily_assessment(
     data: DailyAssessmentIn,
     db: Session = Depends(get_db),
     current: User = Depends(get_current_user)
 ):
-    summary = compute_rolling_summary(db, current)
+    with unit_of_work(db):
+        summary = compute_rolling_summary(db, current)
+
+        if not summary:
+            assess, _ = add_assessment_and_prediction(db, current, data, None)
+            log_action(db, current.id, "submit_assessment", details=f"assess_id={assess.id}")
+            return {
+                "burnout_risk": None,
+                "confidence": None,
+                "message": "Assessment saved. Burnout prediction will be available after 7 entries."
+            }
 
-    if not summary:
-        assess, _ = add_assessment_and_prediction(db, current, data, None)
+        predict = batcher.predict if batcher else predict_burnout
+        pred = predict(
+            summary.avg_tired_last_7_days,
+            summary.avg_capable_last_7_days,
+            summary.avg_meaningful_last_7_days
+        )
+        assess, prediction = add_assessment_and_prediction(db, current, data, pred)
         log_action(db, current.id, "submit_assessment", details=f"assess_id={assess.id}")
-        return {
-            "burnout_risk": None,
-            "confidence": None,
-            "message": "Assessment saved. Burnout prediction will be available after 7 entries."
+    return {"burnout_risk": pred["burnout_risk"], "confidence": pred["confidence"]}
+
+
+@router.post("/bulk", response_model=BulkAssessmentOut)
+def submit_bulk_assessments(
+    data: BulkAssessmentIn,
+    db: Session = Depends(get_db),
+    current: User = Depends(get_current_user)
+):
+    """Backfill dated assessments for the caller, or for any users when called by an admin."""
+    rows = [
+        {
+            "user_id": item.user_id or current.id,
+            "date": item.date,
+            "tired_score": item.tired_score,
+            "capable_score": item.capable_score,
+            "meaningful_score": item.meaningful_score,
         }
+        for item in data.assessments
+    ]
+    user_ids = {row["user_id"] for row in rows}
+    if user_ids != {current.id}:
+        if not current.is_admin:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN,
+                                detail="Only admins can import assessments for other users")
+        known = {user_id for (user_id,) in db.query(User.id).filter(User.id.in_(user_ids))}
+        if known != user_ids:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,
+                                detail=f"Unknown user ids: {sorted(user_ids - known)}")
+    if max(row["date"] for row in rows) > date.today():
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                            detail="Assessments cannot be dated in the future")
 
-    pred = predict_burnout(
-        summary.avg_tired_last_7_days,
-        summary.avg_capable_last_7_days,
-        summary.avg_meaningful_last_7_days
-    )
-    assess, prediction = add_assessment_and_prediction(db, current, data, pred)
-    log_action(db, current.id, "submit_assessment", details=f"assess_id={assess.id}")
-    return {"burnout_risk": pred["burnout_risk"], "confidence": pred["confidence"]}
+    with unit_of_work(db):
+        inserted, users, predictions = add_assessments_and_predictions_bulk(db, rows, predict_burnout_batch)
+        log_action(db, current.id, "bulk_import_assessments", details=f"rows={inserted} users={users}")
+    return BulkAssessmentOut(inserted=inserted, users=users, predictions=predictions)
+
+
+@router.get("/export")
+def export_history(
+    fmt: Literal["csv", "ndjson"] = Query("csv", alias="format"),
+    compress: bool = False,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    db: Session = Depends(get_db),
+    bind: Engine = Depends(get_engine),
+    current: User = Depends(get_current_user)
+):
+    """Download the caller's assessments and predictions as CSV or NDJSON, streamed (gzipped with compress=true)."""
+    stmt = history_stmt(current.id, start, end)
+    encoder = ENCODERS[fmt](export_columns(stmt))
+    with unit_of_work(db):
+        log_action(db, current.id, "export_history", details=f"format={fmt}")
+    return export_response(stream_export(bind, stmt, encoder, compress), encoder, compress, "burnout-history")
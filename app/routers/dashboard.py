@@ -1,57 +1,104 @@
-from datetime import date
-from fastapi import APIRouter, Depends
+import hashlib
+from datetime import date, datetime, timezone
+from email.utils import format_datetime
+from typing import List, NamedTuple, Optional, Tuple
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import select, union_all
 from app.models import Prediction
 from app.schemas import DashboardOut, DailyPredictionOut
 from app.dependencies import get_db
-from app.auth import get_current_user
+from app.auth import load_user, oauth2_scheme, token_subject
+from app.cache import dashboard_cache
+from app.crud import day_bounds
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
 
-@router.get("/", response_model=DashboardOut)
-def dashboard(current=Depends(get_current_user), db: Session = Depends(get_db)):
-    today = date.today()
+def dashboard_predictions_stmt(user_id: str, today: date):
+    """
+    Today's latest prediction and the 5 before today, in one round trip.
 
-    # Today's prediction (if any), based on predicted_at date
-    today_prediction = (
-        db.query(Prediction)
-        .filter(
-            Prediction.assessment.has(user_id=current.id),
-            func.date(Prediction.predicted_at) == today,
-        )
-        .first()
-    )
+    Each branch is a range scan of ix_predictions_user_predicted_at.
+    """
+    start, end = day_bounds(today)
+    latest = select(Prediction).where(Prediction.user_id == user_id).order_by(Prediction.predicted_at.desc())
+    today_branch = latest.where(Prediction.predicted_at >= start, Prediction.predicted_at < end).limit(1)
+    recent_branch = latest.where(Prediction.predicted_at < start).limit(5)
+    return select(Prediction).from_statement(union_all(today_branch, recent_branch))
+
+
+def split_dashboard(predictions: List[Prediction], today: date) -> Tuple[Optional[Prediction], List[Prediction]]:
+    start, _ = day_bounds(today)
+    today_prediction = next((pred for pred in predictions if pred.predicted_at >= start), None)
+    recent = sorted((pred for pred in predictions if pred.predicted_at < start),
+                    key=lambda pred: pred.predicted_at, reverse=True)
+    return today_prediction, recent
 
-    # Last 5 predictions before today
-    recent_predictions = (
-        db.query(Prediction)
-        .filter(
-            Prediction.assessment.has(user_id=current.id),
-            func.date(Prediction.predicted_at) < today,
-        )
-        .order_by(Prediction.predicted_at.desc())
-        .limit(5)
-        .all()
+
+def _prediction_out(pred: Prediction) -> DailyPredictionOut:
+    return DailyPredictionOut(
+        date=pred.predicted_at.date(),
+        burnout_risk=pred.burnout_risk,
+        confidence=pred.confidence,
+        model_version=pred.model_version,
+        label=pred.label,
     )
 
+
+def build_dashboard(today_prediction: Optional[Prediction], recent_predictions: List[Prediction]) -> DashboardOut:
     return DashboardOut(
-        today_prediction=DailyPredictionOut(
-            date=today_prediction.predicted_at.date(),
-            burnout_risk=today_prediction.burnout_risk,
-            confidence=today_prediction.confidence,
-            model_version=today_prediction.model_version,
-            label=today_prediction.label,
-        ) if today_prediction else None,
-        recent_predictions=[
-            DailyPredictionOut(
-                date=pred.predicted_at.date(),
-                burnout_risk=pred.burnout_risk,
-                confidence=pred.confidence,
-                model_version=pred.model_version,
-                label=pred.label,
-            )
-            for pred in recent_predictions
-        ],
+        today_prediction=_prediction_out(today_prediction) if today_prediction else None,
+        recent_predictions=[_prediction_out(pred) for pred in recent_predictions],
+    )
+
+
+class CachedDashboard(NamedTuple):
+    body: bytes
+    etag: str
+    last_modified: Optional[datetime]
+
+
+def cached_dashboard(request: Request, user_id: str, today: date) -> Optional[Response]:
+    """Answer from the dashboard cache, or None on a miss."""
+    entry = dashboard_cache.get((user_id, today)) if dashboard_cache is not None else None
+    return _conditional_response(request, entry) if entry is not None else None
+
+
+def dashboard_response(request: Request, user_id: str, today: date, predictions: List[Prediction]):
+    dashboard = build_dashboard(*split_dashboard(predictions, today))
+    if dashboard_cache is None:
+        return dashboard
+    body = dashboard.model_dump_json().encode()
+    entry = CachedDashboard(
+        body=body,
+        etag=f'"{hashlib.sha1(body).hexdigest()}"',
+        last_modified=max((pred.predicted_at for pred in predictions), default=None),
     )
+    dashboard_cache.set((user_id, today), entry)
+    return _conditional_response(request, entry)
+
+
+def _conditional_response(request: Request, entry: CachedDashboard) -> Response:
+    # no-cache: clients may store the body but must revalidate it with If-None-Match
+    headers = {"ETag": entry.etag, "Cache-Control": "private, no-cache"}
+    if entry.last_modified is not None:
+        headers["Last-Modified"] = format_datetime(entry.last_modified.astimezone(timezone.utc), usegmt=True)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if entry.etag in tags or "*" in tags:
+            return Response(status_code=304, headers=headers)
+    return Response(entry.body, media_type="application/json", headers=headers)
+
+
+@router.get("/", response_model=DashboardOut)
+def dashboard(request: Request, token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+    today = date.today()
+    # Checked before the cache too, so deactivated users stop getting the cached body
+    current = load_user(db, token_subject(token))
+    cached = cached_dashboard(request, current.id, today)
+    if cached is not None:
+        return cached
+    predictions = db.scalars(dashboard_predictions_stmt(current.id, today)).all()
+    return dashboard_response(request, current.id, today, predictions)
@@ -0,0 +1,26 @@
+import secrets
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import PlainTextResponse
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from app.config import settings
+from app.metrics import metrics_registry
+
+router = APIRouter(tags=["metrics"])
+
+_bearer = HTTPBearer(auto_error=False)
+
+
+def require_metrics_token(credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer)) -> None:
+    """Reject scrapes without METRICS_TOKEN, when one is configured."""
+    if settings.METRICS_TOKEN is None:
+        return
+    if credentials is None or not secrets.compare_digest(credentials.credentials, settings.METRICS_TOKEN):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid metrics token")
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False,
+            dependencies=[Depends(require_metrics_token)])
+def metrics():
+    """Prometheus text exposition of this worker's metrics."""
+    return PlainTextResponse(metrics_registry.render(), media_type="text/plain; version=0.0.4")
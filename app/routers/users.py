@@ -4,10 +4,12 @@ from datetime import datetime, timedelta
 from jose import jwt
 from fastapi_mail import FastMail, MessageSchema, MessageType
 from app.schemas import UserCreate, TokenWithUser, PasswordResetRequest, PasswordResetComplete, UserOut, ProfileEdit
-from app.dependencies import get_db
-from app.crud import create_user, get_user_by_email, update_user, log_action
-from app.auth import hash_password, verify_password, create_access_token, get_current_user
+from app.dependencies import get_db, unit_of_work
+from app.crud import create_user, get_user_by_email, update_user, set_password, record_login, log_action
+from app.auth import hash_password, create_access_token, get_current_user
 from app.config import settings
+from app.models import User
+from app.hashing import password_hasher
 from fastapi.security import OAuth2PasswordRequestForm
 
 router = APIRouter(prefix="/users", tags=["users"])
@@ -18,18 +20,23 @@ def register_user(data: UserCreate, db: Session = Depends(get_db)):
     if existing:
         raise HTTPException(status_code=400, detail="Email already registered")
     pw_hash = hash_password(data.password)
-    user = create_user(db, data.email, pw_hash, data.full_name)
-    log_action(db, user.id, "register_user", f"email={user.email}")
+    with unit_of_work(db):
+        user = create_user(db, data.email, pw_hash, data.full_name)
+        log_action(db, user.id, "register_user", f"email={user.email}")
     return user
 
 @router.post("/login", response_model=TokenWithUser)
 def login_user(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
     user = get_user_by_email(db, form_data.username)
-    if not user or not verify_password(form_data.password, user.password_hash):
+    verified, new_hash = (
+        password_hasher.verify_and_update(form_data.password, user.password_hash) if user else (False, None)
+    )
+    if not verified:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
     token = create_access_token(user.id)
-    user.last_login = datetime.utcnow(); db.commit()
-    log_action(db, user.id, "login")
+    with unit_of_work(db):
+        record_login(db, user, new_hash)
+        log_action(db, user.id, "login")
     return {"access_token": token, "user": user}
 
 @router.post("/password-recover")
@@ -49,23 +56,28 @@ def recover_password(req: PasswordResetRequest, background_tasks: BackgroundTask
                              subtype=MessageType.html)
     fm = FastMail(settings)
     background_tasks.add_task(fm.send_message, message)
-    log_action(db, user.id, "recover_password")
+    with unit_of_work(db):
+        log_action(db, user.id, "recover_password")
     return {"msg": "Password reset email sent"}
 
 @router.post("/password-reset")
 def complete_reset(req: PasswordResetComplete, db: Session = Depends(get_db)):
     try:
         payload = jwt.decode(req.token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        user = db.query(User).get(payload.get("sub"))
+        user = db.get(User, payload.get("sub"))
     except Exception:
         raise HTTPException(status_code=400, detail="Invalid or expired token")
-    user.password_hash = hash_password(req.new_password)
-    db.commit()
-    log_action(db, user.id, "reset_password")
+    if user is None:
+        raise HTTPException(status_code=400, detail="Invalid or expired token")
+    pw_hash = hash_password(req.new_password)
+    with unit_of_work(db):
+        set_password(db, user, pw_hash)
+        log_action(db, user.id, "reset_password")
     return {"msg": "Password updated"}
 
 @router.put("/profile", response_model=UserOut)
 def edit_profile(data: ProfileEdit, current=Depends(get_current_user), db: Session = Depends(get_db)):
-    user = update_user(db, current, full_name=data.full_name)
-    log_action(db, user.id, "edit_profile", details=f"name={data.full_name}")
+    with unit_of_work(db):
+        user = update_user(db, current, full_name=data.full_name)
+        log_action(db, user.id, "edit_profile", details=f"name={data.full_name}")
     return user
@@ -1,8 +1,8 @@
-from pydantic import BaseModel, EmailStr, constr
+from pydantic import BaseModel, EmailStr, constr, conlist
 from typing import Optional
 from pydantic import BaseModel
 from typing import Optional, List
-from datetime import date
+from datetime import date, datetime
 
 class UserCreate(BaseModel):
     email: EmailStr
@@ -41,6 +41,45 @@ class DailyAssessmentIn(BaseModel):
     capable_score: int
     meaningful_score: int
 
+class DatedAssessmentIn(DailyAssessmentIn):
+    date: date
+    # Only admins may import on behalf of other users; defaults to the caller
+    user_id: Optional[str] = None
+
+class BulkAssessmentIn(BaseModel):
+    assessments: conlist(DatedAssessmentIn, min_length=1, max_length=10000)
+
+class BulkAssessmentOut(BaseModel):
+    inserted: int
+    users: int
+    predictions: int
+
+class AssessmentOut(BaseModel):
+    id: str
+    date: date
+    tired_score: Optional[int]
+    capable_score: Optional[int]
+    meaningful_score: Optional[int]
+    submitted_at: Optional[datetime]
+
+class AssessmentPage(BaseModel):
+    items: List[AssessmentOut]
+    # Pass back as ?cursor= for the next (older) page; None on the last page
+    next_cursor: Optional[str]
+
+class PredictionOut(BaseModel):
+    id: str
+    assessment_id: str
+    burnout_risk: Optional[bool]
+    label: Optional[str]
+    confidence: Optional[float]
+    model_version: Optional[str]
+    predicted_at: datetime
+
+class PredictionPage(BaseModel):
+    items: List[PredictionOut]
+    next_cursor: Optional[str]
+
 class DailyPredictionOut(BaseModel):
     date: date
     burnout_risk: bool
@@ -51,4 +90,23 @@ class DailyPredictionOut(BaseModel):
 
 class DashboardOut(BaseModel):
     today_prediction: Optional[DailyPredictionOut]
-    recent_predictions: List[DailyPredictionOut]
\ No newline at end of file
+    recent_predictions: List[DailyPredictionOut]
+
+
+class CohortBucketOut(BaseModel):
+    start: date
+    assessments: int
+    predictions: int
+    low: int
+    moderate: int
+    high: int
+    mean_tired: Optional[float]
+    mean_capable: Optional[float]
+    mean_meaningful: Optional[float]
+
+
+class CohortStatsOut(BaseModel):
+    bucket: str
+    # Data written after this is not counted yet (None until the first refresh)
+    refreshed_at: Optional[datetime]
+    buckets: List[CohortBucketOut]
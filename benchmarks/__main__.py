@@ -0,0 +1,43 @@
+import argparse
+import logging
+import sys
+import warnings
+
+from benchmarks import cases
+from benchmarks.harness import compare, load, report, run, save
+
+logging.disable(logging.INFO)
+# The tree models were fitted on a DataFrame; scoring plain arrays warns on every call
+warnings.filterwarnings("ignore", message="X does not have valid feature names")
+
+parser = argparse.ArgumentParser(
+    prog="python -m benchmarks",
+    description="Time the API hot paths and compare the medians with a saved baseline.",
+)
+parser.add_argument("-o", "--output", default="benchmarks/results.json", help="where to write this run's results")
+parser.add_argument("-b", "--baseline", help="results file to compare against")
+parser.add_argument("-t", "--threshold", type=float, default=0.2,
+                    help="allowed slowdown of a median before it counts as a regression (default 0.2 = 20%%)")
+parser.add_argument("-k", "--filter", help="only run benchmarks whose name contains this string")
+parser.add_argument("-r", "--rounds", type=int, default=7)
+parser.add_argument("--no-db", action="store_true", help="skip the benchmarks that need the database")
+args = parser.parse_args()
+
+selected = cases.prediction_cases() + cases.auth_cases() + cases.dashboard_cases()
+if args.no_db:
+    results = run(selected, args.rounds, args.filter)
+else:
+    from app.dependencies import SessionLocal
+
+    with cases.database_cases(SessionLocal) as db_cases:
+        results = run(selected + db_cases, args.rounds, args.filter)
+save(results, args.output)
+print(f"Wrote {len(results['results'])} results to {args.output}")
+
+if args.baseline:
+    rows = compare(results, load(args.baseline), args.threshold)
+    print(report(rows))
+    regressions = [row["name"] for row in rows if row["regression"]]
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
@@ -0,0 +1,102 @@
+import uuid
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+
+import numpy as np
+from sqlalchemy import delete, insert
+
+from app.auth import create_access_token, decode_access_token, hash_password, verify_password
+from app.crud import compute_rolling_summary
+from app.models import Assessment, DailySummaryRolling7D, Prediction, User
+from app.predict import predict_burnout, predict_burnout_batch
+from benchmarks.harness import Case
+
+MODELS = ("logistic_regression", "random_forest", "xgboost")
+BATCH_SIZES = (64, 1024)
+HISTORY_DAYS = (7, 90, 365, 1825)
+
+
+def prediction_cases():
+    rng = np.random.default_rng(0)
+    cases = []
+    for model in MODELS:
+        cases.append(Case(f"predict.{model}.single", lambda m=model: predict_burnout(3.1, 2.4, 4.0, model=m)))
+        for size in BATCH_SIZES:
+            X = rng.uniform(0, 6, size=(size, 3))
+            cases.append(Case(f"predict.{model}.batch_{size}", lambda m=model, X=X: predict_burnout_batch(X, model=m)))
+        # The first batch scored one call at a time, for the batched speedup
+        X = rng.uniform(0, 6, size=(BATCH_SIZES[0], 3))
+        cases.append(Case(
+            f"predict.{model}.loop_{BATCH_SIZES[0]}",
+            lambda m=model, X=X: [predict_burnout(*row, model=m) for row in X],
+        ))
+    return cases
+
+
+def auth_cases():
+    hashed = hash_password("correct horse battery")
+    token = create_access_token(str(uuid.uuid4()))
+    return [
+        Case("auth.hash_password", lambda: hash_password("correct horse battery")),
+        Case("auth.verify_password", lambda: verify_password("correct horse battery", hashed)),
+        Case("auth.jwt_create", lambda: create_access_token("4f9c8c2e-benchmark")),
+        Case("auth.jwt_decode", lambda: decode_access_token(token)),
+    ]
+
+
+def dashboard_cases():
+    from app.routers.dashboard import build_dashboard, split_dashboard
+
+    today = date.today()
+    now = datetime.now().astimezone()
+    predictions = [
+        Prediction(burnout_risk=i % 2 == 0, label="High" if i % 2 == 0 else "Low", confidence=0.8,
+                   model_version="logistic_regression@1", predicted_at=now - timedelta(days=i))
+        for i in range(6)
+    ]
+    return [
+        Case("dashboard.build", lambda: build_dashboard(*split_dashboard(predictions, today))),
+        Case("dashboard.serialize", lambda: build_dashboard(*split_dashboard(predictions, today)).model_dump_json()),
+    ]
+
+
+@contextmanager
+def database_cases(session_factory):
+    """
+    ``compute_rolling_summary`` for users with 7 days to 5 years of history, both
+    seeding the summary from assessments and reading the maintained row. The
+    benchmark users and their rows are removed afterwards.
+    """
+    db = session_factory()
+    today = date.today()
+    users = []
+    try:
+        cases = []
+        for days in HISTORY_DAYS:
+            user = User(email=f"bench-{uuid.uuid4()}@example.com", password_hash="x", full_name="Benchmark")
+            db.add(user)
+            db.flush()
+            db.execute(insert(Assessment), [
+                {"id": str(uuid.uuid4()), "user_id": user.id, "date": today - timedelta(days=i),
+                 "tired_score": i % 7, "capable_score": (i + 2) % 7, "meaningful_score": (i + 4) % 7}
+                for i in range(days)
+            ])
+            db.commit()
+            users.append(user)
+
+            def clear(user_id=user.id):
+                db.execute(delete(DailySummaryRolling7D).where(DailySummaryRolling7D.user_id == user_id))
+                db.commit()
+
+            cases.append(Case(f"rolling_summary.seed.{days}d", lambda u=user: compute_rolling_summary(db, u), setup=clear))
+            cases.append(Case(f"rolling_summary.maintained.{days}d", lambda u=user: compute_rolling_summary(db, u)))
+        yield cases
+    finally:
+        db.rollback()
+        user_ids = [user.id for user in users]
+        if user_ids:
+            for model in (DailySummaryRolling7D, Assessment):
+                db.execute(delete(model).where(model.user_id.in_(user_ids)))
+            db.execute(delete(User).where(User.id.in_(user_ids)))
+            db.commit()
+        db.close()
@@ -0,0 +1,115 @@
+import json
+import platform
+import statistics
+import sys
+import time
+import timeit
+from datetime import datetime, timezone
+from typing import Callable, List, NamedTuple, Optional
+
+
+class Case(NamedTuple):
+    name: str
+    fn: Callable[[], object]
+    # Run before every call, outside the timing (forces number=1)
+    setup: Optional[Callable[[], object]] = None
+
+
+def measure(case: Case, rounds: int = 7, min_round_seconds: float = 0.2) -> dict:
+    """
+    Per-call timings of ``case.fn`` over ``rounds`` rounds.
+
+    Without a setup, each round repeats the call ``number`` times (picked like
+    ``timeit -n`` so a round lasts about ``min_round_seconds``) to keep timer
+    overhead out of sub-microsecond results.
+    """
+    if case.setup is None:
+        timer = timeit.Timer(case.fn)
+        number = 1
+        while timer.timeit(number) < min_round_seconds and number < 10 ** 7:
+            number *= 10
+        samples = [timer.timeit(number) / number for _ in range(rounds)]
+    else:
+        number = 1
+        samples = []
+        for _ in range(rounds):
+            case.setup()
+            started = time.perf_counter()
+            case.fn()
+            samples.append(time.perf_counter() - started)
+    return {
+        "median": statistics.median(samples),
+        "min": min(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "rounds": rounds,
+        "number": number,
+    }
+
+
+def run(cases: List[Case], rounds: int = 7, pattern: Optional[str] = None) -> dict:
+    results = {}
+    for case in cases:
+        if pattern and pattern not in case.name:
+            continue
+        results[case.name] = measure(case, rounds)
+        print(f"{case.name:<55} {_format(results[case.name]['median']):>10}", file=sys.stderr)
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float = 0.2) -> List[dict]:
+    """
+    Rows for benchmarks present in both runs, with ``regression`` set where the
+    median slowed down by more than ``threshold`` (0.2 = 20%).
+    """
+    rows = []
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        ratio = result["median"] / before["median"] if before["median"] else float("inf")
+        rows.append({
+            "name": name,
+            "baseline": before["median"],
+            "current": result["median"],
+            "ratio": ratio,
+            "regression": ratio > 1 + threshold,
+        })
+    return rows
+
+
+def report(rows: List[dict]) -> str:
+    lines = [f"{'benchmark':<55} {'baseline':>10} {'current':>10} {'change':>8}"]
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else ""
+        lines.append(
+            f"{row['name']:<55} {_format(row['baseline']):>10} {_format(row['current']):>10} "
+            f"{(row['ratio'] - 1) * 100:>+7.1f}%{flag}"
+        )
+    return "\n".join(lines)
+
+
+def _format(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def load(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def save(results: dict, path: str) -> None:
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+        f.write("\n")
@@ -1,8 +1,21 @@
 # locustfile.py
-from locust import HttpUser, task, between, events
-from locust.exception import StopUser
-from uuid import uuid4
+#
+# Scenarios (run one by naming its class, or all of them by their weights):
+#   locust -f locustfile.py --headless -u 100 -r 20 -t 5m --host http://localhost:8000 SeededUser
+#   SeededUser            daily check-ins from users with weeks of history (prediction path)
+#   LoginStormUser        everyone logging in at once (Argon2 verification)
+#   DashboardPollingUser  dashboard-heavy mix with ETag revalidation
+#   BulkBackfillUser      clients importing months of history through /assessments/bulk
+#
+# --report-json writes p50/p95/p99 per endpoint; with --baseline-json the run fails
+# when an endpoint's p95 or p99 is more than --regression-threshold slower than the baseline.
+import json
 import random
+from datetime import date, timedelta
+from uuid import uuid4
+
+from locust import HttpUser, task, between, constant, events
+from locust.exception import StopUser
 
 # -----------------------------
 # SLA Configuration
@@ -13,17 +26,44 @@ SLA_ENDPOINTS = [
     ("POST", "/assessments/"),
     ("GET", "/dashboard/"),
 ]
+PERCENTILES = (0.5, 0.95, 0.99)
+# Days of history each seeded user imports before its scenario starts
+SEED_DAYS = 28
+
+
+@events.init_command_line_parser.add_listener
+def _(parser):
+    parser.add_argument("--report-json", default="", help="Write per-endpoint p50/p95/p99 to this file")
+    parser.add_argument("--baseline-json", default="", help="Report from an earlier run to compare against")
+    parser.add_argument("--regression-threshold", type=float, default=0.2,
+                        help="Allowed p95/p99 slowdown against the baseline (0.2 = 20%%)")
+
+
+def random_scores():
+    return {
+        "tired_score": random.randint(0, 6),
+        "capable_score": random.randint(0, 6),
+        "meaningful_score": random.randint(0, 6),
+    }
+
+
+def history(days, end=None):
+    """Dated assessments for the ``days`` days before ``end`` (default today)."""
+    end = end or date.today()
+    return [{**random_scores(), "date": (end - timedelta(days=i)).isoformat()} for i in range(1, days + 1)]
 
 
 class BurnoutUser(HttpUser):
     """
-    Simulated user flow:
-      - Register (ignore duplicate)
+    Base flow shared by the scenarios:
+      - Register a unique user (ignore duplicate)
       - Login and store Bearer token
-      - Post daily assessment (weighted 2)
-      - View dashboard (weighted 1)
+      - Optionally import SEED_DAYS of history, so daily check-ins reach the
+        7-assessment window and run a prediction
     """
+    abstract = True
     wait_time = between(1, 2)  # simulate think time
+    seed_history = True
 
     def on_start(self):
         # Generate a unique credential per simulated user
@@ -41,7 +81,17 @@ class BurnoutUser(HttpUser):
             },
             name="/users/register"
         )
+        self.login()
+        if self.seed_history:
+            # Kept under its own name so setup traffic stays out of the scenario's numbers
+            self.client.post(
+                "/assessments/bulk",
+                json={"assessments": history(SEED_DAYS)},
+                headers=self.headers,
+                name="/assessments/bulk [seed]",
+            )
 
+    def login(self):
         # Login (OAuth2 form-style)
         res = self.client.post(
             "/users/login",
@@ -63,34 +113,117 @@ class BurnoutUser(HttpUser):
 
         self.headers = {"Authorization": f"Bearer {token}"}
 
-    @task(2)
     def submit_assessment(self):
-        """
-        Submit a daily assessment. The backend should trigger prediction inside this path.
-        """
-        data = {
-            "tired_score": random.randint(0, 6),
-            "capable_score": random.randint(0, 6),
-            "meaningful_score": random.randint(0, 6),
-        }
         # Use 'name' to normalize stats grouping for SLA checks
-        self.client.post(
-            "/assessments/",
-            json=data,
-            headers=self.headers,
-            name="/assessments/",
-        )
+        self.client.post("/assessments/", json=random_scores(), headers=self.headers, name="/assessments/")
+
+    def access_dashboard(self, headers=None):
+        return self.client.get("/dashboard/", headers=headers or self.headers, name="/dashboard/")
+
+
+class SeededUser(BurnoutUser):
+    """Daily check-ins (weighted 2) and dashboard views (weighted 1) with a full history."""
+    weight = 6
+
+    @task(2)
+    def check_in(self):
+        self.submit_assessment()
 
     @task(1)
-    def access_dashboard(self):
-        """
-        Retrieve dashboard, which should reflect latest risk/prediction.
-        """
-        self.client.get(
-            "/dashboard/",
+    def dashboard(self):
+        self.access_dashboard()
+
+
+class LoginStormUser(BurnoutUser):
+    """Repeated logins with almost no think time, as after a push reminder."""
+    weight = 1
+    wait_time = between(0.1, 0.5)
+    seed_history = False
+
+    @task
+    def login_again(self):
+        self.login()
+
+
+class DashboardPollingUser(BurnoutUser):
+    """Frequent dashboard refreshes that revalidate with If-None-Match, occasional check-ins."""
+    weight = 3
+    wait_time = between(0.5, 1)
+
+    def on_start(self):
+        super().on_start()
+        self.etag = None
+
+    @task(10)
+    def poll_dashboard(self):
+        headers = dict(self.headers, **({"If-None-Match": self.etag} if self.etag else {}))
+        with self.client.get("/dashboard/", headers=headers, name="/dashboard/", catch_response=True) as res:
+            if res.status_code in (200, 304):
+                self.etag = res.headers.get("ETag", self.etag)
+                res.success()
+
+    @task(1)
+    def check_in(self):
+        self.submit_assessment()
+        self.etag = None
+
+
+class BulkBackfillUser(BurnoutUser):
+    """Clients importing earlier months of history in batches."""
+    weight = 1
+    wait_time = constant(2)
+    seed_history = False
+
+    def on_start(self):
+        super().on_start()
+        self.backfilled_until = date.today()
+
+    @task
+    def backfill(self):
+        self.client.post(
+            "/assessments/bulk",
+            json={"assessments": history(90, end=self.backfilled_until)},
             headers=self.headers,
-            name="/dashboard/",
+            name="/assessments/bulk",
         )
+        self.backfilled_until -= timedelta(days=90)
+
+
+# -----------------------------
+# Reports
+# -----------------------------
+def endpoint_report(stats):
+    """p50/p95/p99 (ms), request and failure counts per endpoint."""
+    endpoints = {}
+    for entry in list(stats.entries.values()) + [stats.total]:
+        if entry.num_requests == 0:
+            continue
+        key = f"{entry.method} {entry.name}" if entry.method else entry.name
+        endpoints[key] = {
+            "requests": entry.num_requests,
+            "failures": entry.num_failures,
+            "rps": round(entry.total_rps, 2),
+            **{f"p{int(q * 100)}": entry.get_response_time_percentile(q) for q in PERCENTILES},
+        }
+    return endpoints
+
+
+def compare_reports(current, baseline, threshold):
+    """Lines describing each endpoint's p95/p99 against the baseline, and whether any regressed."""
+    lines, regressed = [], False
+    for key, result in current.items():
+        before = baseline.get(key)
+        if not before:
+            continue
+        for p in ("p95", "p99"):
+            if not before[p]:
+                continue
+            change = result[p] / before[p] - 1
+            flag = ""
+            if change > threshold:
+                flag, regressed = "  REGRESSION", True
+            lines.append(f"{key:<35} {p} {before[p]:>8.1f} -> {result[p]:>8.1f} ms ({change:+.1%}){flag}")
+    return lines, regressed
 
 
 # -----------------------------
@@ -100,7 +233,8 @@ class BurnoutUser(HttpUser):
 def _(environment, **kwargs):
     """
     Enforce SLA on key endpoints at the end of a headless run.
-    Fails the process (non-zero exit) if any p95 > SLA_P95_MS.
+    Fails the process (non-zero exit) if any p95 > SLA_P95_MS, or if p95/p99
+    regressed against --baseline-json.
     """
     stats = environment.stats
     all_ok = True
@@ -131,3 +265,21 @@ def _(environment, **kwargs):
         environment.process_exit_code = 1
     else:
         print(f"\nSLA MET: All monitored endpoints have p95 ≤ {SLA_P95_MS} ms.")
+
+    options = environment.parsed_options
+    if options is None:
+        return
+    endpoints = endpoint_report(stats)
+    if options.report_json:
+        with open(options.report_json, "w") as f:
+            json.dump({"user_classes": [cls.__name__ for cls in environment.user_classes],
+                       "endpoints": endpoints}, f, indent=2)
+        print(f"Wrote percentiles for {len(endpoints)} endpoints to {options.report_json}")
+    if options.baseline_json:
+        with open(options.baseline_json) as f:
+            baseline = json.load(f)["endpoints"]
+        comparison, regressed = compare_reports(endpoints, baseline, options.regression_threshold)
+        print("\n=== BASELINE COMPARISON ===\n" + "\n".join(comparison))
+        if regressed:
+            print(f"\nREGRESSION: p95/p99 more than {options.regression_threshold:.0%} slower than the baseline.")
+            environment.process_exit_code = 1
@@ -0,0 +1,79 @@
+"""Baseline: the schema as created by Base.metadata.create_all before migrations
+
+Databases created that way are adopted with ``alembic stamp 0001`` followed by
+``alembic upgrade head``.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("password_hash", sa.String(), nullable=False),
+        sa.Column("full_name", sa.String()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("last_login", sa.DateTime(timezone=True)),
+        sa.Column("is_active", sa.Boolean()),
+    )
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "assessments",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("user_id", sa.String(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("tired_score", sa.Integer()),
+        sa.Column("capable_score", sa.Integer()),
+        sa.Column("meaningful_score", sa.Integer()),
+        sa.Column("submitted_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+
+    op.create_table(
+        "predictions",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("assessment_id", sa.String(), sa.ForeignKey("assessments.id"), nullable=False),
+        sa.Column("burnout_risk", sa.Boolean()),
+        sa.Column("label", sa.String()),
+        sa.Column("confidence", sa.Float()),
+        sa.Column("model_version", sa.String()),
+        sa.Column("predicted_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+
+    op.create_table(
+        "daily_summary_rolling_7d",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("user_id", sa.String(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("summary_date", sa.Date()),
+        sa.Column("avg_tired_last_7_days", sa.Float()),
+        sa.Column("avg_capable_last_7_days", sa.Float()),
+        sa.Column("avg_meaningful_last_7_days", sa.Float()),
+        sa.Column("features_json", postgresql.JSONB()),
+        sa.Column("computed_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+
+    op.create_table(
+        "audit_logs",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("user_id", sa.String(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("action", sa.String(), nullable=False),
+        sa.Column("details", sa.String()),
+        sa.Column("timestamp", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+
+
+def downgrade() -> None:
+    for table in ("audit_logs", "daily_summary_rolling_7d", "predictions", "assessments", "users"):
+        op.drop_table(table)
@@ -0,0 +1,52 @@
+"""Admin flag, prediction owner and running totals on rolling summaries
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+SUMMARY_TOTALS = ("assessment_count", "sum_tired", "sum_capable", "sum_meaningful")
+
+
+def upgrade() -> None:
+    op.add_column("users", sa.Column("is_admin", sa.Boolean(), nullable=False, server_default=sa.false()))
+
+    # Copied from the owning assessment so per-user reads do not need to join through it
+    op.add_column("predictions", sa.Column("user_id", sa.String()))
+    op.execute("""
+        UPDATE predictions p SET user_id = a.user_id
+        FROM assessments a
+        WHERE a.id = p.assessment_id
+    """)
+    op.alter_column("predictions", "user_id", nullable=False)
+    op.create_foreign_key("predictions_user_id_fkey", "predictions", "users", ["user_id"], ["id"])
+    op.create_index("ix_predictions_user_predicted_at", "predictions", ["user_id", sa.text("predicted_at DESC")])
+
+    # Summaries used to be written once per submission. They are derived data:
+    # drop them here and rebuild with scripts/rebuild_rolling_summaries.py
+    # (crud.compute_rolling_summary also re-seeds any missing row on read).
+    op.execute("DELETE FROM daily_summary_rolling_7d")
+    for column in SUMMARY_TOTALS:
+        op.add_column("daily_summary_rolling_7d", sa.Column(column, sa.Integer(), nullable=False))
+    op.alter_column("daily_summary_rolling_7d", "summary_date", nullable=False)
+    op.create_unique_constraint("uq_daily_summary_user_date", "daily_summary_rolling_7d", ["user_id", "summary_date"])
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_daily_summary_user_date", "daily_summary_rolling_7d", type_="unique")
+    op.alter_column("daily_summary_rolling_7d", "summary_date", nullable=True)
+    for column in SUMMARY_TOTALS:
+        op.drop_column("daily_summary_rolling_7d", column)
+
+    op.drop_index("ix_predictions_user_predicted_at", table_name="predictions")
+    op.drop_constraint("predictions_user_id_fkey", "predictions", type_="foreignkey")
+    op.drop_column("predictions", "user_id")
+
+    op.drop_column("users", "is_admin")
@@ -0,0 +1,107 @@
+"""Per-day assessment uniqueness, lookup indexes and monthly audit_logs partitions
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+from datetime import date
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+# Later duplicates of a (user_id, date) assessment win, as a resubmission would now
+DUPLICATE_ASSESSMENTS = """
+    SELECT id, user_id FROM (
+        SELECT id, user_id, row_number() OVER (
+            PARTITION BY user_id, date ORDER BY submitted_at DESC NULLS LAST, id DESC
+        ) AS position
+        FROM assessments
+    ) ranked
+    WHERE position > 1
+"""
+
+
+# Months created past the current one; scripts/create_audit_partitions.py keeps extending them
+MONTHS_AHEAD = 3
+
+
+def _next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def _month_partitions(first: date):
+    month, last = first.replace(day=1), date.today().replace(day=1)
+    for _ in range(MONTHS_AHEAD):
+        last = _next_month(last)
+    while month <= last:
+        yield f"audit_logs_{month:%Y_%m}", month, _next_month(month)
+        month = _next_month(month)
+
+
+def upgrade() -> None:
+    # Keep one assessment (and one prediction) per user and day. Summaries of
+    # the affected users are derived data; they are re-seeded on the next read.
+    op.execute(
+        f"DELETE FROM daily_summary_rolling_7d WHERE user_id IN (SELECT user_id FROM ({DUPLICATE_ASSESSMENTS}) d)"
+    )
+    op.execute(f"DELETE FROM predictions WHERE assessment_id IN (SELECT id FROM ({DUPLICATE_ASSESSMENTS}) d)")
+    op.execute(f"DELETE FROM assessments WHERE id IN (SELECT id FROM ({DUPLICATE_ASSESSMENTS}) d)")
+    op.execute("""
+        DELETE FROM predictions WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (PARTITION BY assessment_id ORDER BY predicted_at DESC NULLS LAST, id DESC)
+                    AS position
+                FROM predictions
+            ) ranked
+            WHERE position > 1
+        )
+    """)
+    op.create_unique_constraint("uq_assessment_user_date", "assessments", ["user_id", "date"])
+    op.create_index("ix_predictions_assessment_id", "predictions", ["assessment_id"], unique=True)
+
+    # Rebuild audit_logs as a table partitioned by month on timestamp
+    op.rename_table("audit_logs", "audit_logs_unpartitioned")
+    op.execute("ALTER TABLE audit_logs_unpartitioned RENAME CONSTRAINT audit_logs_pkey TO audit_logs_unpartitioned_pkey")
+    op.create_table(
+        "audit_logs",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("user_id", sa.String(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("action", sa.String(), nullable=False),
+        sa.Column("details", sa.String()),
+        sa.Column("timestamp", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint("id", "timestamp"),
+        postgresql_partition_by="RANGE (timestamp)",
+    )
+    op.execute("CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT")
+    first = op.get_bind().execute(sa.text("SELECT min(timestamp)::date FROM audit_logs_unpartitioned")).scalar()
+    for name, start, end in _month_partitions(min(first or date.today(), date.today())):
+        op.execute(f"CREATE TABLE {name} PARTITION OF audit_logs FOR VALUES FROM ('{start}') TO ('{end}')")
+    op.execute("""
+        INSERT INTO audit_logs (id, user_id, action, details, timestamp)
+        SELECT id, user_id, action, details, coalesce(timestamp, now()) FROM audit_logs_unpartitioned
+    """)
+    op.drop_table("audit_logs_unpartitioned")
+    op.create_index("ix_audit_logs_user_timestamp", "audit_logs", ["user_id", "timestamp"])
+
+
+def downgrade() -> None:
+    op.rename_table("audit_logs", "audit_logs_partitioned")
+    op.execute("ALTER TABLE audit_logs_partitioned RENAME CONSTRAINT audit_logs_pkey TO audit_logs_partitioned_pkey")
+    op.create_table(
+        "audit_logs",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("user_id", sa.String(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("action", sa.String(), nullable=False),
+        sa.Column("details", sa.String()),
+        sa.Column("timestamp", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.execute("INSERT INTO audit_logs SELECT id, user_id, action, details, timestamp FROM audit_logs_partitioned")
+    op.execute("DROP TABLE audit_logs_partitioned CASCADE")
+
+    op.drop_index("ix_predictions_assessment_id", table_name="predictions")
+    op.drop_constraint("uq_assessment_user_date", "assessments", type_="unique")
@@ -0,0 +1,46 @@
+"""Pre-aggregated org-wide cohort stats per day
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "cohort_daily_stats",
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("assessment_count", sa.Integer(), nullable=False),
+        sa.Column("sum_tired", sa.Integer(), nullable=False),
+        sa.Column("sum_capable", sa.Integer(), nullable=False),
+        sa.Column("sum_meaningful", sa.Integer(), nullable=False),
+        sa.Column("prediction_count", sa.Integer(), nullable=False),
+        sa.Column("low_count", sa.Integer(), nullable=False),
+        sa.Column("moderate_count", sa.Integer(), nullable=False),
+        sa.Column("high_count", sa.Integer(), nullable=False),
+        sa.Column("refreshed_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_table(
+        "cohort_refresh_state",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False),
+        sa.Column("watermark", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index("ix_assessments_date", "assessments", ["date"])
+    op.create_index("ix_assessments_submitted_at", "assessments", ["submitted_at"])
+    op.create_index("ix_predictions_predicted_at", "predictions", ["predicted_at"])
+    # Left empty: the first crud.refresh_cohort_stats run has no watermark and aggregates every day
+
+
+def downgrade() -> None:
+    op.drop_index("ix_predictions_predicted_at", table_name="predictions")
+    op.drop_index("ix_assessments_submitted_at", table_name="assessments")
+    op.drop_index("ix_assessments_date", table_name="assessments")
+    op.drop_table("cohort_refresh_state")
+    op.drop_table("cohort_daily_stats")
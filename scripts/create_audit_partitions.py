@@ -0,0 +1,30 @@
+import sys
+from datetime import date
+from sqlalchemy import text
+from app.dependencies import engine
+
+import logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Create the monthly audit_logs partitions for this month and the next few
+# (default 3, or the first argument). Run it at least monthly, e.g. from cron:
+# a month without its partition collects rows in audit_logs_default, and the
+# partition can then only be created after those rows are moved out.
+months_ahead = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+
+
+def next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+month = date.today().replace(day=1)
+with engine.begin() as conn:
+    for _ in range(months_ahead + 1):
+        name = f"audit_logs_{month:%Y_%m}"
+        conn.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF audit_logs "
+            f"FOR VALUES FROM ('{month}') TO ('{next_month(month)}')"
+        ))
+        logger.info("Partition %s is in place", name)
+        month = next_month(month)
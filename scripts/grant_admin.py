@@ -0,0 +1,37 @@
+import argparse
+import sys
+from app.dependencies import SessionLocal, unit_of_work
+from app.crud import log_action, set_admin
+from app.models import User
+
+import logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Grant (or with --revoke, remove) admin rights, which unlock /admin/* and bulk
+# imports on behalf of other users:
+#
+#   PYTHONPATH=. python scripts/grant_admin.py alice@example.com
+#
+# Running workers pick the change up once their cached principal expires
+# (AUTH_CACHE_TTL_SECONDS).
+parser = argparse.ArgumentParser(description="Grant or revoke admin rights.")
+parser.add_argument("emails", nargs="+")
+parser.add_argument("--revoke", action="store_true")
+args = parser.parse_args()
+
+db = SessionLocal()
+try:
+    users = db.query(User).filter(User.email.in_(args.emails)).all()
+    missing = sorted(set(args.emails) - {user.email for user in users})
+    if missing:
+        logger.error("Unknown users: %s", ", ".join(missing))
+        sys.exit(1)
+    action = "revoke_admin" if args.revoke else "grant_admin"
+    with unit_of_work(db):
+        for user in users:
+            set_admin(db, user, not args.revoke)
+            log_action(db, user.id, action, details=f"email={user.email}")
+    logger.info("%s: %s", action, ", ".join(args.emails))
+finally:
+    db.close()
@@ -0,0 +1,28 @@
+import argparse
+from datetime import date
+from app.dependencies import SessionLocal
+from app.crud import rebuild_rolling_summaries
+
+import logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Recompute daily_summary_rolling_7d from the assessments table, e.g. right
+# after `alembic upgrade` past 0002 (which clears the old per-submission rows)
+# or after fixing assessments by hand:
+#
+#   PYTHONPATH=. python scripts/rebuild_rolling_summaries.py [--user ID ...] [--since 2026-01-01]
+#
+# Summaries for days without an assessment are still seeded lazily on read.
+parser = argparse.ArgumentParser(description="Rebuild rolling 7-day summaries from assessments.")
+parser.add_argument("--user", dest="user_ids", action="append", help="only this user id (repeatable; default: all)")
+parser.add_argument("--since", type=date.fromisoformat, help="only summaries dated on or after this day")
+args = parser.parse_args()
+
+db = SessionLocal()
+try:
+    rows = rebuild_rolling_summaries(db, args.user_ids, args.since)
+    db.commit()
+    logger.info("Rebuilt %d rolling summaries", rows)
+finally:
+    db.close()
@@ -0,0 +1,19 @@
+import sys
+from app.dependencies import SessionLocal
+from app.crud import refresh_cohort_stats
+
+import logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Fold new assessments and predictions into cohort_daily_stats, which backs
+# GET /admin/cohorts. Schedule it as often as the analytics need to be fresh
+# (e.g. every 5 minutes from cron); pass --full to re-aggregate every day.
+full = "--full" in sys.argv[1:]
+
+db = SessionLocal()
+try:
+    days = refresh_cohort_stats(db, full=full)
+    logger.info("Refreshed cohort stats for %d day(s)%s", days, " (full)" if full else "")
+finally:
+    db.close()
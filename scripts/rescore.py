@@ -0,0 +1,136 @@
+import argparse
+import json
+import multiprocessing
+import os
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from app.crud import bulk_upsert_predictions_stmt, latest_windows_stmt, prediction_values
+from app.config import settings
+from app.predict import predict_burnout_batch, registry
+
+import logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(processName)s %(message)s")
+logger = logging.getLogger(__name__)
+
+# Re-score every user's latest assessment with the selected model, e.g. after a
+# model change or a data fix:
+#
+#   PYTHONPATH=. python scripts/rescore.py --model random_forest --version 1 --workers 4
+#
+# Users are split into --workers contiguous user_id ranges, one process each.
+# Each process streams its users' 7-day windows through a server-side cursor,
+# scores --chunk-size users with one vectorized call and upserts their
+# predictions (new model_version, predicted_at = now) before reading the next
+# chunk. After every committed chunk it records the last user_id in
+# --checkpoint-dir, so an interrupted run picks up where each range stopped
+# when started again with the same model and worker count (--restart ignores
+# checkpoints). Web workers' dashboard caches are not invalidated; they catch up
+# once their entries expire (DASHBOARD_CACHE_TTL_SECONDS).
+
+
+def shard_bounds(shards: int) -> List[Tuple[Optional[str], Optional[str]]]:
+    """(after, until] user_id ranges splitting uuid4 ids evenly; the outer bounds are open."""
+    cuts = [format(i * 16 ** 8 // shards, "08x") for i in range(1, shards)]
+    return list(zip([None] + cuts, cuts + [None]))
+
+
+def checkpoint_path(directory: str, tag: str, shard: int, shards: int) -> str:
+    return os.path.join(directory, f"rescore-{tag.replace('@', '-')}-{shard + 1}-of-{shards}.json")
+
+
+def load_checkpoint(path: str) -> dict:
+    if not os.path.exists(path):
+        return {"last_user_id": None, "scored": 0, "done": False}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_checkpoint(path: str, checkpoint: dict) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, path)
+
+
+def rescore_shard(shard: int, shards: int, args) -> int:
+    """Re-score one user_id range; returns the users scored in this range, resumed runs included."""
+    # Imported here so each worker process opens its own connection pool
+    from app.dependencies import engine
+
+    # Not loaded until the first chunk is scored
+    entry = registry.entry(args.model, args.version)
+    after, until = shard_bounds(shards)[shard]
+    path = checkpoint_path(args.checkpoint_dir, entry.tag, shard, shards)
+    checkpoint = {"last_user_id": None, "scored": 0, "done": False} if args.restart else load_checkpoint(path)
+    if checkpoint["done"]:
+        logger.info("Range %d/%d already done (%d users)", shard + 1, shards, checkpoint["scored"])
+        return checkpoint["scored"]
+    if checkpoint["last_user_id"] is not None:
+        after = checkpoint["last_user_id"]
+        logger.info("Range %d/%d resuming after user %s", shard + 1, shards, after)
+
+    started = time.perf_counter()
+    scored_now = 0
+    # The cursor lives in its own transaction; writes commit per chunk on a second connection
+    with engine.connect() as reader, engine.connect() as writer:
+        result = reader.execution_options(stream_results=True, max_row_buffer=args.chunk_size).execute(
+            latest_windows_stmt(after, until)
+        )
+        for rows in result.partitions(args.chunk_size):
+            features = np.array([sums for _, _, _, *sums in rows], dtype=np.float64)
+            features /= np.array([[count] for _, _, count, *_ in rows], dtype=np.float64)
+            results = predict_burnout_batch(features, entry.name, entry.version)
+            writer.execute(bulk_upsert_predictions_stmt(), [
+                {"id": str(uuid.uuid4()), **prediction_values(user_id, assessment_id, prediction)}
+                for (user_id, assessment_id, *_), prediction in zip(rows, results)
+            ])
+            writer.commit()
+
+            scored_now += len(rows)
+            checkpoint.update(last_user_id=rows[-1][0], scored=checkpoint["scored"] + len(rows))
+            save_checkpoint(path, checkpoint)
+            logger.info("Range %d/%d: %d users re-scored (%.0f users/s)", shard + 1, shards,
+                        checkpoint["scored"], scored_now / (time.perf_counter() - started))
+    checkpoint["done"] = True
+    save_checkpoint(path, checkpoint)
+    return checkpoint["scored"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Re-score every user's latest assessment with one model.")
+    parser.add_argument("--model", help="registered model name (default: settings.MODEL_NAME)")
+    parser.add_argument("--version", help="registered model version (default: settings.MODEL_VERSION)")
+    parser.add_argument("--workers", type=int, default=1, help="processes, each re-scoring one user_id range")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="users scored and written per batch")
+    parser.add_argument("--checkpoint-dir", default="rescore_checkpoints")
+    parser.add_argument("--restart", action="store_true", help="ignore checkpoints from an earlier run")
+    args = parser.parse_args()
+
+    args.model, args.version = args.model or settings.MODEL_NAME, args.version or settings.MODEL_VERSION
+    entry = registry.entry(args.model, args.version)
+    os.makedirs(args.checkpoint_dir, exist_ok=True)
+    logger.info("Re-scoring latest predictions with %s in %d range(s)", entry.tag, args.workers)
+
+    started = time.perf_counter()
+    if args.workers == 1:
+        total = rescore_shard(0, 1, args)
+    else:
+        total = 0
+        with ProcessPoolExecutor(args.workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            futures = [pool.submit(rescore_shard, shard, args.workers, args) for shard in range(args.workers)]
+            for future in as_completed(futures):
+                total += future.result()
+    logger.info("Re-scored %d users with %s in %.1fs", total, entry.tag, time.perf_counter() - started)
+    if settings.DASHBOARD_CACHE:
+        # Caches live in the web workers, out of this process's reach
+        logger.warning("Running workers may serve cached dashboards (and 304s) with the previous predictions "
+                       "for up to %ss", settings.DASHBOARD_CACHE_TTL_SECONDS)
+
+
+if __name__ == "__main__":
+    main()
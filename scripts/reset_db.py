@@ -1,18 +1,16 @@
-from fastapi import FastAPI
-from app.routers import users, assessments, dashboard
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import text
 from app.dependencies import Base, engine
+import app.models  # noqa: F401
 
 import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# ⚠️ ONLY for development — drop and recreate all tables
-logger.warning("Dropping and recreating all tables")
+# ⚠️ ONLY for development — drop all tables and rebuild them from the migrations
+logger.warning("Dropping all tables and re-running migrations")
 Base.metadata.drop_all(bind=engine)
-Base.metadata.create_all(bind=engine)
-
-app = FastAPI()
-
-app.include_router(users.router)
-app.include_router(assessments.router)
-app.include_router(dashboard.router)
+with engine.begin() as conn:
+    conn.execute(text("DROP TABLE IF EXISTS alembic_version"))
+command.upgrade(Config("alembic.ini"), "head")
@@ -0,0 +1,226 @@
+import argparse
+import csv
+import io
+import os
+import time
+import uuid
+from datetime import date, datetime, timedelta
+
+import numpy as np
+from sqlalchemy import text
+
+from app.auth import hash_password
+from app.crud import rebuild_rolling_summaries
+from app.dependencies import SessionLocal, engine
+from app.predict import active_model, predict_burnout_batch
+
+import logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Synthetic users with months of daily assessments, streamed in with COPY.
+#
+#   PYTHONPATH=. python scripts/seed_data.py --users 20000 --days 180 --predictions --summaries
+#
+# Each user follows a profile drawn from the simulated weekly averages (and, for
+# a share of users, drifts towards a second one over the period). Daily answers
+# are that profile plus noise, with some days skipped. Rows are generated and
+# copied one chunk of users at a time, so memory stays bounded by --chunk-size.
+# All seeded users share the password given by --password.
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+PROFILES_CSV = os.path.join(BASE_DIR, "..", "model", "data", "simulated_weekly_burnout.csv")
+
+COLUMNS = {
+    "users": ("id", "email", "password_hash", "full_name", "created_at", "is_active", "is_admin"),
+    "assessments": ("id", "user_id", "date", "tired_score", "capable_score", "meaningful_score", "submitted_at"),
+    "predictions": ("id", "user_id", "assessment_id", "burnout_risk", "label", "confidence",
+                    "model_version", "predicted_at"),
+    "audit_logs": ("id", "user_id", "action", "details", "timestamp"),
+}
+
+
+def load_profiles(path: str = PROFILES_CSV) -> np.ndarray:
+    """(N, 3) weekly means of tired, capable and meaningful answers."""
+    with open(path) as f:
+        rows = [(row["avg_tired"], row["avg_capable"], row["avg_meaningful"]) for row in csv.DictReader(f)]
+    return np.asarray(rows, dtype=np.float64)
+
+
+def generate_scores(rng, profiles: np.ndarray, users: int, days: int, drift_share: float, noise: float):
+    """(users, days, 3) integer answers in 0-6."""
+    start = profiles[rng.integers(len(profiles), size=users)]
+    end = np.where(
+        rng.random((users, 1)) < drift_share, profiles[rng.integers(len(profiles), size=users)], start
+    )
+    t = np.linspace(0, 1, days)[None, :, None]
+    means = start[:, None, :] * (1 - t) + end[:, None, :] * t
+    return np.clip(np.rint(means + rng.normal(0, noise, means.shape)), 0, 6).astype(np.int64)
+
+
+def window_features(scores: np.ndarray, present: np.ndarray):
+    """
+    7-day means ending on each day, and where a prediction applies: the day has
+    an assessment and the window holds all 7 (as in add_assessment_and_prediction).
+    """
+    masked = scores * present[..., None]
+    padded_sums = np.concatenate([np.zeros_like(masked[:, :1]), masked.cumsum(axis=1)], axis=1)
+    padded_counts = np.concatenate([np.zeros_like(present[:, :1], dtype=np.int64), present.cumsum(axis=1)], axis=1)
+    days = scores.shape[1]
+    lo = np.maximum(np.arange(days) - 6, 0)
+    hi = np.arange(days) + 1
+    sums = padded_sums[:, hi] - padded_sums[:, lo]
+    counts = padded_counts[:, hi] - padded_counts[:, lo]
+    return sums / 7, present & (counts >= 7)
+
+
+def copy_rows(cursor, table: str, rows) -> int:
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    buf.seek(0)
+    cursor.copy_expert(f"COPY {table} ({', '.join(COLUMNS[table])}) FROM STDIN WITH (FORMAT csv)", buf)
+    return count
+
+
+def next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def ensure_audit_partitions(first: date, last: date) -> None:
+    """Create the monthly audit_logs partitions the seeded rows fall into, where still possible."""
+    month = first.replace(day=1)
+    with engine.begin() as conn:
+        while month <= last:
+            name, end = f"audit_logs_{month:%Y_%m}", next_month(month)
+            # A month that already has rows in the default partition cannot get its own
+            in_default = not conn.scalar(text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name}) and conn.scalar(
+                text("SELECT EXISTS (SELECT 1 FROM audit_logs_default WHERE timestamp >= :start AND timestamp < :end)"),
+                {"start": month, "end": end},
+            )
+            if in_default:
+                logger.warning("%s has rows in audit_logs_default; seeded rows for it go there too", name)
+            else:
+                conn.execute(text(
+                    f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF audit_logs "
+                    f"FOR VALUES FROM ('{month}') TO ('{end}')"
+                ))
+            month = end
+
+
+def seed_chunk(cursor, rng, profiles, args, first_index: int, users: int, password_hash: str, tag: str):
+    """COPY one chunk of users with their rows (not committed); returns the user ids and row counts."""
+    days = args.days
+    first_day = date.today() - timedelta(days=days - 1)
+    dates = [first_day + timedelta(days=i) for i in range(days)]
+    tz = datetime.now().astimezone().tzinfo
+    midnights = [datetime.combine(day, datetime.min.time(), tz) for day in dates]
+
+    user_ids = [str(uuid.uuid4()) for _ in range(users)]
+    created = [midnights[0] - timedelta(days=int(d)) for d in rng.integers(1, 30, size=users)]
+    counts = {"users": copy_rows(cursor, "users", (
+        (user_id, f"seed-{tag}-{first_index + i:08d}@example.com", password_hash, f"Seed User {first_index + i}",
+         created[i].isoformat(), "t", "f")
+        for i, user_id in enumerate(user_ids)
+    ))}
+
+    scores = generate_scores(rng, profiles, users, days, args.drift_share, args.noise)
+    present = rng.random((users, days)) >= args.skip_rate
+    # Check-ins between 07:00 and 22:00
+    offsets = rng.integers(7 * 3600, 22 * 3600, size=(users, days))
+    u_idx, d_idx = np.nonzero(present)
+    assessment_ids = np.empty(present.shape, dtype=object)
+    assessment_ids[u_idx, d_idx] = [str(uuid.uuid4()) for _ in range(len(u_idx))]
+
+    def submitted(u, d):
+        return (midnights[d] + timedelta(seconds=int(offsets[u, d]))).isoformat()
+
+    counts["assessments"] = copy_rows(cursor, "assessments", (
+        (assessment_ids[u, d], user_ids[u], dates[d], *scores[u, d], submitted(u, d))
+        for u, d in zip(u_idx, d_idx)
+    ))
+
+    if args.predictions:
+        features, scored = window_features(scores, present)
+        p_u, p_d = np.nonzero(scored)
+        results = predict_burnout_batch(features[p_u, p_d]) if len(p_u) else []
+        counts["predictions"] = copy_rows(cursor, "predictions", (
+            (str(uuid.uuid4()), user_ids[u], assessment_ids[u, d], "t" if r["burnout_risk"] else "f",
+             r["label"], r["confidence"], r["model_version"], submitted(u, d))
+            for u, d, r in zip(p_u, p_d, results)
+        ))
+
+    if args.audit:
+        registered = ((str(uuid.uuid4()), user_id, "register_user", f"email=seed-{tag}-{first_index + i:08d}@example.com",
+                       created[i].isoformat()) for i, user_id in enumerate(user_ids))
+        submissions = ((str(uuid.uuid4()), user_ids[u], "submit_assessment", f"assess_id={assessment_ids[u, d]}",
+                        submitted(u, d)) for u, d in zip(u_idx, d_idx))
+        counts["audit_logs"] = copy_rows(cursor, "audit_logs", (row for rows in (registered, submissions) for row in rows))
+    return user_ids, counts
+
+
+def rebuild_summaries(user_ids) -> int:
+    db = SessionLocal()
+    try:
+        rows = rebuild_rolling_summaries(db, user_ids)
+        db.commit()
+        return rows
+    finally:
+        db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Seed synthetic users and assessment histories with COPY.")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--days", type=int, default=90, help="days of history per user, ending today")
+    parser.add_argument("--chunk-size", type=int, default=200_000, help="assessment rows generated per COPY batch")
+    parser.add_argument("--skip-rate", type=float, default=0.1, help="share of days without a check-in")
+    parser.add_argument("--drift-share", type=float, default=0.3, help="share of users drifting to another profile")
+    parser.add_argument("--noise", type=float, default=0.8, help="standard deviation of daily answers around the profile")
+    parser.add_argument("--predictions", action="store_true", help="score every eligible day with the active model")
+    parser.add_argument("--no-audit", dest="audit", action="store_false", help="skip audit_logs rows")
+    parser.add_argument("--summaries", action="store_true", help="rebuild the seeded users' daily_summary_rolling_7d rows")
+    parser.add_argument("--password", default="seedpass1")
+    parser.add_argument("--seed", type=int, default=None, help="random seed for reproducible data")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    profiles = load_profiles()
+    password_hash = hash_password(args.password)
+    tag = uuid.uuid4().hex[:6]
+    per_chunk = max(1, args.chunk_size // args.days)
+    if args.predictions:
+        logger.info("Scoring with %s", active_model().tag)
+    if args.audit:
+        ensure_audit_partitions(date.today() - timedelta(days=args.days + 30), date.today())
+
+    totals = dict.fromkeys([*COLUMNS, "daily_summary_rolling_7d"], 0)
+    started = time.perf_counter()
+    conn = engine.raw_connection()
+    try:
+        cursor = conn.cursor()
+        for first in range(0, args.users, per_chunk):
+            user_ids, counts = seed_chunk(
+                cursor, rng, profiles, args, first, min(per_chunk, args.users - first), password_hash, tag
+            )
+            conn.commit()
+            if args.summaries:
+                counts["daily_summary_rolling_7d"] = rebuild_summaries(user_ids)
+            for table, count in counts.items():
+                totals[table] += count
+            logger.info("%d/%d users, %d assessments (%.0f rows/s)", min(first + per_chunk, args.users), args.users,
+                        totals["assessments"], sum(totals.values()) / (time.perf_counter() - started))
+        for table in totals:
+            cursor.execute(f"ANALYZE {table}")
+        conn.commit()
+    finally:
+        conn.close()
+    logger.info("Seeded %s in %.1fs (users are seed-%s-*@example.com)",
+                ", ".join(f"{count} {table}" for table, count in totals.items()), time.perf_counter() - started, tag)
+
+
+if __name__ == "__main__":
+    main()
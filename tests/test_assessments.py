@@ -1,5 +1,10 @@
+from datetime import date, timedelta
+
 import pytest
-from app.models import User
+from sqlalchemy import event
+
+from app.crud import rebuild_rolling_summaries
+from app.models import Assessment, DailySummaryRolling7D, Prediction, User
 
 @pytest.fixture
 def test_user(client):  # use client so dependency override works
@@ -64,3 +69,94 @@ def test_prediction_threshold_consistency(auth_headers, client):
         }, headers=auth_headers)
         assert response.status_code == 200
         assert "burnout_risk" in response.json()
+
+def test_bulk_import_backfills_history_and_predicts(auth_headers, client, db):
+    today = date.today()
+    payload = {"assessments": [
+        {"date": str(today - timedelta(days=i)), "tired_score": 5, "capable_score": 1, "meaningful_score": 1}
+        for i in range(1, 11)
+    ]}
+    response = client.post("/assessments/bulk", json=payload, headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json() == {"inserted": 10, "users": 1, "predictions": 1}
+
+    assert db.query(Assessment).count() == 10
+    prediction = db.query(Prediction).one()
+    assert prediction.assessment.date == today - timedelta(days=1)
+    assert prediction.label in ["Low", "Moderate", "High"]
+
+def test_bulk_import_upserts_same_day_rows(auth_headers, client, db):
+    today = date.today()
+    rows = [
+        {"date": str(today - timedelta(days=i)), "tired_score": 5, "capable_score": 1, "meaningful_score": 1}
+        for i in range(1, 8)
+    ]
+    assert client.post("/assessments/bulk", json={"assessments": rows}, headers=auth_headers).status_code == 200
+    existing = db.query(Assessment).filter_by(date=today - timedelta(days=1)).one()
+
+    # Re-import yesterday twice: the last row wins and updates the stored assessment and its prediction
+    rows = [dict(rows[0], tired_score=2), dict(rows[0], tired_score=1)]
+    response = client.post("/assessments/bulk", json={"assessments": rows}, headers=auth_headers)
+    assert response.json() == {"inserted": 1, "users": 1, "predictions": 1}
+
+    db.expire_all()
+    assert db.query(Assessment).count() == 7
+    assert db.query(Assessment).filter_by(id=existing.id).one().tired_score == 1
+    assert db.query(Prediction).one().assessment_id == existing.id
+
+def test_bulk_import_for_other_users_requires_admin(auth_headers, client):
+    response = client.post("/assessments/bulk", json={"assessments": [
+        {"date": "2025-01-01", "tired_score": 1, "capable_score": 1, "meaningful_score": 1, "user_id": "someone-else"}
+    ]}, headers=auth_headers)
+    assert response.status_code == 403
+
+def test_bulk_import_rejects_future_dates(auth_headers, client):
+    response = client.post("/assessments/bulk", json={"assessments": [
+        {"date": str(date.today() + timedelta(days=1)), "tired_score": 1, "capable_score": 1, "meaningful_score": 1}
+    ]}, headers=auth_headers)
+    assert response.status_code == 422
+
+def test_rolling_summary_is_maintained_incrementally(auth_headers, client, db):
+    user = db.query(User).filter_by(email="test@example.com").one()
+    today = date.today()
+    for i in range(1, 7):
+        db.add(Assessment(user_id=user.id, date=today - timedelta(days=i),
+                          tired_score=1, capable_score=2, meaningful_score=3))
+    db.commit()
+
+    first = client.post("/assessments/", json={"tired_score": 4, "capable_score": 4, "meaningful_score": 4},
+                        headers=auth_headers)
+    second = client.post("/assessments/", json={"tired_score": 2, "capable_score": 2, "meaningful_score": 2},
+                         headers=auth_headers)
+    assert first.json()["burnout_risk"] is None
+    assert second.json()["burnout_risk"] in [True, False]
+
+    # The second submission replaced today's assessment, so the summary moved by the difference
+    db.expire_all()
+    assert db.query(Assessment).filter_by(date=today).one().tired_score == 2
+    summary = db.query(DailySummaryRolling7D).one()
+    assert summary.summary_date == today
+    assert (summary.assessment_count, summary.sum_tired, summary.sum_capable, summary.sum_meaningful) == (7, 8, 14, 20)
+    assert summary.avg_tired_last_7_days == 8 / 7
+    assert summary.features_json["avg_meaningful"] == 20 / 7
+
+    assert rebuild_rolling_summaries(db) == 7
+    db.commit()
+    rebuilt = db.query(DailySummaryRolling7D).filter_by(summary_date=today).one()
+    assert (rebuilt.assessment_count, rebuilt.sum_tired, rebuilt.avg_capable_last_7_days) == (7, 8, 14 / 7)
+
+def test_submit_commits_once(auth_headers, client, db):
+    commits = []
+    def count_commit(conn):
+        commits.append(conn)
+
+    engine = db.get_bind()
+    event.listen(engine, "commit", count_commit)
+    try:
+        response = client.post("/assessments/", json={
+            "tired_score": 3, "capable_score": 2, "meaningful_score": 4
+        }, headers=auth_headers)
+    finally:
+        event.remove(engine, "commit", count_commit)
+    assert response.status_code == 200
+    assert len(commits) == 1
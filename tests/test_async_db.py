@@ -0,0 +1,104 @@
+from datetime import date, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.aio.routers import users, assessments, dashboard, predictions
+from app.dependencies import async_database_url, get_async_db, get_async_engine
+from app.models import Assessment, User
+from tests.conftest import SQLALCHEMY_TEST_URL
+
+
+@pytest.fixture
+def async_client(db):
+    # NullPool: TestClient runs each request on its own event loop
+    engine = create_async_engine(async_database_url(SQLALCHEMY_TEST_URL), poolclass=NullPool)
+    sessions = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+    async def override_get_async_db():
+        async with sessions() as session:
+            yield session
+
+    app = FastAPI()
+    for module in (users, assessments, dashboard, predictions):
+        app.include_router(module.router)
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_async_engine] = lambda: engine
+    with TestClient(app) as client:
+        yield client
+
+
+def _login(client, email="async@example.com", password="secret-pass"):
+    response = client.post("/users/register", json={"email": email, "password": password, "full_name": "Async"})
+    assert response.status_code == 200
+    response = client.post("/users/login", data={"username": email, "password": password})
+    assert response.status_code == 200
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def test_async_register_login_and_profile(async_client):
+    headers = _login(async_client)
+    response = async_client.put("/users/profile", json={"full_name": "Renamed"}, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["full_name"] == "Renamed"
+
+    response = async_client.post("/users/login", data={"username": "async@example.com", "password": "wrong"})
+    assert response.status_code == 401
+
+
+def test_async_submit_predicts_after_seven_days(async_client, db):
+    headers = _login(async_client)
+    user = db.query(User).filter_by(email="async@example.com").one()
+    today = date.today()
+    for i in range(1, 7):
+        db.add(Assessment(user_id=user.id, tired_score=3, capable_score=3, meaningful_score=3,
+                          date=today - timedelta(days=i)))
+    db.commit()
+
+    payload = {"tired_score": 3, "capable_score": 3, "meaningful_score": 3}
+    response = async_client.post("/assessments/", json=payload, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["burnout_risk"] is None
+
+    response = async_client.post("/assessments/", json=payload, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["confidence"] is not None
+
+    response = async_client.get("/dashboard/", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["today_prediction"]["confidence"] > 0
+    assert response.json()["recent_predictions"] == []
+
+
+def test_async_export_streams_history(async_client, db):
+    headers = _login(async_client)
+    user = db.query(User).filter_by(email="async@example.com").one()
+    for i in range(3):
+        db.add(Assessment(user_id=user.id, tired_score=i, capable_score=3, meaningful_score=3,
+                          date=date.today() - timedelta(days=i)))
+    db.commit()
+
+    response = async_client.get("/assessments/export", params={"format": "ndjson"}, headers=headers)
+
+    assert response.status_code == 200
+    assert [line.count('"tired_score"') for line in response.text.splitlines()] == [1, 1, 1]
+
+
+def test_async_history_pages(async_client, db):
+    headers = _login(async_client)
+    user = db.query(User).filter_by(email="async@example.com").one()
+    for i in range(3):
+        db.add(Assessment(user_id=user.id, tired_score=i, capable_score=3, meaningful_score=3,
+                          date=date.today() - timedelta(days=i)))
+    db.commit()
+
+    first = async_client.get("/assessments/", params={"limit": 2}, headers=headers).json()
+    second = async_client.get("/assessments/", params={"limit": 2, "cursor": first["next_cursor"]},
+                              headers=headers).json()
+
+    assert [item["tired_score"] for item in first["items"] + second["items"]] == [0, 1, 2]
+    assert second["next_cursor"] is None
+    assert async_client.get("/predictions/", headers=headers).json() == {"items": [], "next_cursor": None}
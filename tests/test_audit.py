@@ -0,0 +1,64 @@
+import pytest
+from sqlalchemy import select
+from app.audit import AuditBuffer
+from app.models import AuditLog, User
+
+
+@pytest.fixture
+def test_user(client):
+    response = client.post("/users/register", json={
+        "email": "audit@example.com",
+        "password": "testpass",
+        "full_name": "Audit User"
+    })
+    assert response.status_code == 200
+    return response.json()
+
+
+def _entries(user_id, n):
+    return [{"user_id": user_id, "action": "test_action", "details": f"n={i}"} for i in range(n)]
+
+
+def test_buffer_flushes_in_batches_and_on_close(client, db, test_user):
+    buffer = AuditBuffer(db.get_bind(), max_entries=100, batch_size=3, flush_interval_ms=60000)
+    assert buffer.enqueue(_entries(test_user["id"], 7)) == 7
+    buffer.close()
+
+    logged = db.scalars(select(AuditLog).where(AuditLog.action == "test_action")).all()
+    assert sorted(entry.details for entry in logged) == [f"n={i}" for i in range(7)]
+    stats = buffer.stats()
+    assert stats["written"] == 7
+    assert stats["flushes"] == 3
+    assert stats["buffered"] == 0
+
+
+def test_buffer_is_bounded_and_counts_drops(client, db, test_user):
+    buffer = AuditBuffer(db.get_bind(), max_entries=2, batch_size=100, flush_interval_ms=60000)
+    assert buffer.enqueue(_entries(test_user["id"], 5)) == 2
+    stats = buffer.stats()
+    assert (stats["dropped"], stats["backpressure_waits"], stats["buffered"]) == (3, 3, 2)
+    buffer.close()
+    assert buffer.stats()["written"] == 2
+
+
+def test_log_action_defers_to_commit_in_unit_of_work(client, db, test_user, monkeypatch):
+    from app import crud
+    from app.dependencies import unit_of_work
+
+    buffer = AuditBuffer(db.get_bind(), batch_size=100, flush_interval_ms=60000)
+    monkeypatch.setattr(crud, "audit_buffer", buffer)
+    monkeypatch.setattr("app.audit.audit_buffer", buffer)
+
+    user = db.get(User, test_user["id"])
+    try:
+        with unit_of_work(db):
+            crud.log_action(db, user.id, "rolled_back")
+            raise RuntimeError
+    except RuntimeError:
+        pass
+    with unit_of_work(db):
+        crud.log_action(db, user.id, "committed")
+        assert buffer.stats()["enqueued"] == 0
+    assert buffer.stats()["enqueued"] == 1
+    buffer.close()
+    assert db.scalars(select(AuditLog.action).where(AuditLog.action.in_(["committed", "rolled_back"]))).all() == ["committed"]
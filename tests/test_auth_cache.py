@@ -0,0 +1,80 @@
+import time
+
+import pytest
+from sqlalchemy import event
+
+from app.cache import PrincipalCache, TTLCache
+from app.models import User
+from tests.conftest import engine, make_admin
+
+
+def test_ttl_cache_evicts_least_recently_used_and_expired():
+    cache = TTLCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    cache.set("d", 4, expires_at=time.monotonic() - 1)
+    assert cache.get("d") is None
+    assert cache.stats() == {"hits": 2, "misses": 2, "size": 1}
+
+
+@pytest.fixture
+def principal_cache(mocker):
+    cache = PrincipalCache()
+    mocker.patch("app.auth.principal_cache", cache)
+    mocker.patch("app.cache.principal_cache", cache)
+    return cache
+
+
+def _count_user_selects():
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        if statement.lstrip().startswith("SELECT") and "FROM users" in statement:
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    return statements, lambda: event.remove(engine, "before_cursor_execute", record)
+
+
+def test_cached_principal_skips_user_lookup(client, auth_headers, principal_cache):
+    assert client.get("/dashboard/", headers=auth_headers).status_code == 200
+    statements, stop = _count_user_selects()
+    try:
+        assert client.get("/dashboard/", headers=auth_headers).status_code == 200
+    finally:
+        stop()
+    assert statements == []
+    assert principal_cache.stats()["users"]["hits"] == 1
+
+
+def test_profile_update_invalidates_cached_user(client, auth_headers, principal_cache):
+    client.get("/dashboard/", headers=auth_headers)
+    response = client.put("/users/profile", json={"full_name": "Renamed"}, headers=auth_headers)
+    assert response.status_code == 200
+    assert principal_cache.users.stats()["size"] == 0
+
+
+def test_tokens_sharing_a_signature_are_distinct(principal_cache):
+    principal_cache.remember_token("header.payload-a.sig", "user-a", None)
+    assert principal_cache.subject("header.payload-b.sig") is None
+
+
+def test_admin_deactivation_drops_cached_principal(client, db, auth_headers, principal_cache):
+    client.post("/users/register", json={"email": "other@example.com", "password": "otherpass", "full_name": "Other"})
+    token = client.post("/users/login", data={"username": "other@example.com", "password": "otherpass"})
+    other_headers = {"Authorization": f"Bearer {token.json()['access_token']}"}
+    assert client.get("/dashboard/", headers=other_headers).status_code == 200
+    other = db.query(User).filter_by(email="other@example.com").one()
+
+    assert client.post(f"/admin/users/{other.id}/deactivate", headers=auth_headers).status_code == 403
+    make_admin(db)
+    response = client.post(f"/admin/users/{other.id}/deactivate", headers=auth_headers)
+
+    assert response.json() == {"id": other.id, "is_active": False}
+    assert client.get("/dashboard/", headers=other_headers).status_code == 401
+    assert client.post("/admin/users/missing/deactivate", headers=auth_headers).status_code == 404
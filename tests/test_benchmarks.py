@@ -0,0 +1,22 @@
+from benchmarks.harness import Case, compare, measure
+
+
+def _run(median):
+    return {"results": {"fast": {"median": median}, "new": {"median": 1.0}}}
+
+
+def test_compare_flags_slowdowns_over_threshold():
+    rows = compare(_run(1.3), {"results": {"fast": {"median": 1.0}, "gone": {"median": 1.0}}}, threshold=0.2)
+
+    assert [row["name"] for row in rows] == ["fast"]
+    assert rows[0]["regression"]
+    assert not compare(_run(1.1), {"results": {"fast": {"median": 1.0}}}, threshold=0.2)[0]["regression"]
+
+
+def test_measure_runs_setup_outside_each_timed_call():
+    calls = []
+    result = measure(Case("case", lambda: calls.append("fn"), setup=lambda: calls.append("setup")), rounds=3)
+
+    assert calls == ["setup", "fn"] * 3
+    assert result["number"] == 1 and result["rounds"] == 3
+    assert result["min"] <= result["median"]
@@ -0,0 +1,81 @@
+from datetime import date, timedelta
+
+import pytest
+
+from app.crud import refresh_cohort_stats
+from app.models import Assessment, Prediction, User
+from tests.conftest import make_admin
+
+
+@pytest.fixture
+def admin_headers(db, auth_headers):
+    make_admin(db)
+    return auth_headers
+
+
+@pytest.fixture
+def no_overlap(mocker):
+    # Only rows written after the previous refresh count as new
+    mocker.patch("app.crud.COHORT_REFRESH_OVERLAP", timedelta(0))
+
+
+def _add(db, user_id, day, score, label=None):
+    assessment = Assessment(user_id=user_id, date=day, tired_score=score, capable_score=score, meaningful_score=score)
+    db.add(assessment)
+    db.flush()
+    if label:
+        db.add(Prediction(user_id=user_id, assessment_id=assessment.id, label=label, burnout_risk=label == "High"))
+    db.commit()
+
+
+def _user(db, email):
+    user = User(email=email, password_hash="x", full_name=email)
+    db.add(user)
+    db.commit()
+    return user
+
+
+def test_cohorts_aggregate_days_and_weeks(client, db, admin_headers):
+    monday = date.today() - timedelta(days=date.today().weekday() + 7)
+    first, second = _user(db, "a@example.com"), _user(db, "b@example.com")
+    _add(db, first.id, monday, 2, "Low")
+    _add(db, second.id, monday, 4, "High")
+    _add(db, first.id, monday + timedelta(days=1), 6, "Moderate")
+    _add(db, second.id, monday + timedelta(days=1), 0)
+    assert client.post("/admin/cohorts/refresh", headers=admin_headers).json() == {"days": 2}
+
+    days = client.get("/admin/cohorts", params={"start": monday}, headers=admin_headers).json()
+    assert days["refreshed_at"] is not None
+    assert days["buckets"][0] == {
+        "start": monday.isoformat(), "assessments": 2, "predictions": 2, "low": 1, "moderate": 0, "high": 1,
+        "mean_tired": 3.0, "mean_capable": 3.0, "mean_meaningful": 3.0,
+    }
+    assert days["buckets"][1]["moderate"] == 1 and days["buckets"][1]["predictions"] == 1
+
+    weeks = client.get("/admin/cohorts", params={"bucket": "week", "start": monday + timedelta(days=3)},
+                       headers=admin_headers).json()["buckets"]
+    assert len(weeks) == 1
+    assert weeks[0]["start"] == monday.isoformat()
+    assert (weeks[0]["assessments"], weeks[0]["low"], weeks[0]["moderate"], weeks[0]["high"]) == (4, 1, 1, 1)
+
+
+def test_refresh_only_rewrites_days_with_new_rows(db, no_overlap):
+    user = _user(db, "a@example.com")
+    today = date.today()
+    for i in range(5):
+        _add(db, user.id, today - timedelta(days=i), 3, "Low")
+    assert refresh_cohort_stats(db) == 5
+    assert refresh_cohort_stats(db) == 0
+
+    _add(db, _user(db, "b@example.com").id, today - timedelta(days=2), 5, "High")
+    assert refresh_cohort_stats(db) == 1
+    assert refresh_cohort_stats(db, full=True) == 5
+
+
+def test_cohorts_require_admin_and_bounded_range(client, auth_headers, db):
+    assert client.get("/admin/cohorts", headers=auth_headers).status_code == 403
+
+    make_admin(db)
+    too_long = {"start": date.today() - timedelta(days=400)}
+    assert client.get("/admin/cohorts", params=too_long, headers=auth_headers).status_code == 400
+    assert client.get("/admin/cohorts", headers=auth_headers).json()["buckets"] == []
@@ -26,3 +26,88 @@ def test_dashboard_data(auth_headers, client):
         assert 0 <= prediction["confidence"] <= 1
         assert prediction["label"] in ["Low", "Moderate", "High"]
         assert isinstance(prediction["model_version"], str)
+
+
+def test_dashboard_splits_today_and_recent(auth_headers, client, db):
+    from datetime import datetime, time
+    from app.models import Assessment, Prediction, User
+
+    user = db.query(User).filter_by(email="testuser@example.com").one()
+    today = date.today()
+    for days_ago in range(8):
+        day = today - timedelta(days=days_ago)
+        assessment = Assessment(user_id=user.id, date=day, tired_score=3, capable_score=3, meaningful_score=3)
+        db.add(assessment)
+        db.flush()
+        db.add(Prediction(user_id=user.id, assessment_id=assessment.id, burnout_risk=False, label="Low",
+                          confidence=0.5 + days_ago / 100, model_version="logistic_regression@1",
+                          predicted_at=datetime.combine(day, time(12)).astimezone()))
+    db.commit()
+
+    data = client.get("/dashboard/", headers=auth_headers).json()
+    assert data["today_prediction"]["date"] == today.isoformat()
+    assert [p["date"] for p in data["recent_predictions"]] == [
+        (today - timedelta(days=days_ago)).isoformat() for days_ago in range(1, 6)
+    ]
+
+
+def test_dashboard_conditional_get(auth_headers, client, db, mocker):
+    from sqlalchemy import event
+    from app.cache import PrincipalCache, TTLCache
+    from app.models import Assessment, User
+    from tests.conftest import engine
+
+    cache = TTLCache(max_entries=10)
+    mocker.patch("app.routers.dashboard.dashboard_cache", cache)
+    mocker.patch("app.cache.dashboard_cache", cache)
+    # With the principal cached too, a revalidation never touches the database
+    principals = PrincipalCache()
+    mocker.patch("app.auth.principal_cache", principals)
+    mocker.patch("app.cache.principal_cache", principals)
+
+    first = client.get("/dashboard/", headers=auth_headers)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = client.get("/dashboard/", headers={**auth_headers, "If-None-Match": etag})
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert response.status_code == 304
+    assert statements == []
+
+    # With a full 7-day window on record a submission writes a prediction, invalidating the cache
+    user = db.query(User).filter_by(email="testuser@example.com").one()
+    for days_ago in range(7):
+        db.add(Assessment(user_id=user.id, date=date.today() - timedelta(days=days_ago),
+                          tired_score=3, capable_score=2, meaningful_score=4))
+    db.commit()
+    client.post("/assessments/", json={"tired_score": 3, "capable_score": 2, "meaningful_score": 4},
+                headers=auth_headers)
+    response = client.get("/dashboard/", headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["today_prediction"] is not None
+    assert "last-modified" in response.headers
+
+
+def test_cached_dashboard_rechecks_active_user(auth_headers, client, db, mocker):
+    from app.cache import TTLCache
+    from app.models import User
+
+    cache = TTLCache(max_entries=10)
+    mocker.patch("app.routers.dashboard.dashboard_cache", cache)
+    mocker.patch("app.cache.dashboard_cache", cache)
+    # Only the dashboard entry may be stale here; AUTH_CACHE would mask the recheck
+    mocker.patch("app.auth.principal_cache", None)
+    assert client.get("/dashboard/", headers=auth_headers).status_code == 200
+
+    db.query(User).filter_by(email="testuser@example.com").update({User.is_active: False})
+    db.commit()
+    assert client.get("/dashboard/", headers=auth_headers).status_code == 401
@@ -0,0 +1,71 @@
+import csv
+import gzip
+import io
+import json
+from datetime import date, timedelta
+
+from app.export import ENCODERS, export_columns, history_stmt, stream_export
+from app.models import Assessment, User
+from tests.conftest import engine, make_admin
+
+
+def _seed_history(db, email, days):
+    user = db.query(User).filter_by(email=email).one_or_none() or User(email=email, password_hash="x")
+    db.add(user)
+    db.flush()
+    for i in range(days):
+        db.add(Assessment(user_id=user.id, date=date.today() - timedelta(days=i),
+                          tired_score=i % 7, capable_score=3, meaningful_score=4))
+    db.commit()
+    return user
+
+
+def test_export_csv_of_own_history(client, db, auth_headers):
+    _seed_history(db, "testuser@example.com", 3)
+    _seed_history(db, "other@example.com", 2)
+
+    response = client.get("/assessments/export", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="burnout-history.csv"' in response.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["date"] for row in rows] == [(date.today() - timedelta(days=i)).isoformat() for i in (2, 1, 0)]
+    assert rows[0]["tired_score"] == "2" and rows[0]["label"] == ""
+
+
+def test_export_ndjson_gzip(client, db, auth_headers):
+    _seed_history(db, "testuser@example.com", 2)
+    client.post("/assessments/", json={"tired_score": 5, "capable_score": 1, "meaningful_score": 1},
+                headers=auth_headers)
+
+    response = client.get("/assessments/export", params={"format": "ndjson", "compress": True}, headers=auth_headers)
+
+    assert response.headers["content-type"] == "application/gzip"
+    assert 'filename="burnout-history.ndjson.gz"' in response.headers["content-disposition"]
+    lines = [json.loads(line) for line in gzip.decompress(response.content).splitlines()]
+    assert len(lines) == 2
+    assert lines[-1]["date"] == date.today().isoformat() and lines[-1]["tired_score"] == 5
+
+
+def test_admin_export_covers_all_users(client, db, auth_headers):
+    assert client.get("/admin/export", headers=auth_headers).status_code == 403
+    _seed_history(db, "testuser@example.com", 1)
+    _seed_history(db, "other@example.com", 2)
+    make_admin(db)
+
+    response = client.get("/admin/export", params={"start": date.today() - timedelta(days=1)}, headers=auth_headers)
+
+    assert len(list(csv.DictReader(io.StringIO(response.text)))) == 3
+
+
+def test_stream_export_yields_per_batch(db, mocker):
+    mocker.patch("app.export.EXPORT_BATCH_SIZE", 2)
+    user = _seed_history(db, "batch@example.com", 5)
+    stmt = history_stmt(user.id)
+
+    chunks = list(stream_export(engine, stmt, ENCODERS["csv"](export_columns(stmt)), compress=False))
+
+    # header, three batches of at most 2 rows, empty flush
+    assert len(chunks) == 5
+    assert b"".join(chunks).count(b"\n") == 6
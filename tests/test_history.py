@@ -0,0 +1,86 @@
+from datetime import date, datetime, time, timedelta
+
+from app.models import Assessment, Prediction, User
+from app.query_budget import QueryRecorder
+from tests.conftest import engine
+
+
+def _seed(db, email, days):
+    user = db.query(User).filter_by(email=email).one_or_none() or User(email=email, password_hash="x")
+    db.add(user)
+    db.flush()
+    for i in range(days):
+        assessment = Assessment(user_id=user.id, date=date.today() - timedelta(days=i),
+                                tired_score=i % 7, capable_score=3, meaningful_score=4)
+        db.add(assessment)
+        db.flush()
+        db.add(Prediction(user_id=user.id, assessment_id=assessment.id, burnout_risk=False, label="Low",
+                          confidence=0.9, model_version="test", predicted_at=datetime.combine(assessment.date, time(12)).astimezone()))
+    db.commit()
+    return user
+
+
+def _walk(client, path, headers, **params):
+    pages, cursor = [], None
+    while True:
+        response = client.get(path, params={**params, **({"cursor": cursor} if cursor else {})}, headers=headers)
+        assert response.status_code == 200
+        body = response.json()
+        pages.append(body["items"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+def test_assessment_pages_cover_history_newest_first(client, db, auth_headers):
+    _seed(db, "testuser@example.com", 12)
+    _seed(db, "other@example.com", 3)
+
+    pages = _walk(client, "/assessments/", auth_headers, limit=5)
+
+    assert [len(page) for page in pages] == [5, 5, 2]
+    dates = [item["date"] for page in pages for item in page]
+    assert dates == [(date.today() - timedelta(days=i)).isoformat() for i in range(12)]
+    assert pages[0][1]["tired_score"] == 1
+
+
+def test_assessment_date_range(client, db, auth_headers):
+    _seed(db, "testuser@example.com", 10)
+    start, end = date.today() - timedelta(days=6), date.today() - timedelta(days=2)
+
+    pages = _walk(client, "/assessments/", auth_headers, limit=2, start=start, end=end)
+
+    assert [item["date"] for page in pages for item in page] == [
+        (date.today() - timedelta(days=i)).isoformat() for i in range(2, 7)
+    ]
+
+
+def test_prediction_pages(client, db, auth_headers):
+    _seed(db, "testuser@example.com", 7)
+
+    pages = _walk(client, "/predictions/", auth_headers, limit=3)
+
+    items = [item for page in pages for item in page]
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert len({item["id"] for item in items}) == 7
+    assert items == sorted(items, key=lambda item: item["predicted_at"], reverse=True)
+
+    pages = _walk(client, "/predictions/", auth_headers, start=date.today() - timedelta(days=2))
+    assert len(pages[0]) == 3
+
+
+def test_bad_cursor_and_limit(client, auth_headers):
+    assert client.get("/assessments/", params={"cursor": "not-a-cursor"}, headers=auth_headers).status_code == 400
+    assert client.get("/predictions/", params={"cursor": "W10"}, headers=auth_headers).status_code == 400
+    assert client.get("/assessments/", params={"limit": 0}, headers=auth_headers).status_code == 422
+
+
+def test_deep_page_budget(client, db, auth_headers):
+    _seed(db, "testuser@example.com", 30)
+    cursor = client.get("/assessments/", params={"limit": 25}, headers=auth_headers).json()["next_cursor"]
+
+    with QueryRecorder(engine) as queries:
+        response = client.get("/assessments/", params={"limit": 25, "cursor": cursor}, headers=auth_headers)
+    assert len(response.json()["items"]) == 5
+    # user, page
+    queries.assert_budget(max_statements=2)
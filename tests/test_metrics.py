@@ -0,0 +1,75 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.dependencies import engine as app_engine, get_db
+from app.metrics import Histogram, LabeledHistogram, MetricsMiddleware, MetricsRegistry, instrument_engine
+from app.pooling import pool_metrics
+from app.routers import dashboard, metrics, users
+from tests.conftest import engine
+
+
+@pytest.fixture
+def metrics_client(db):
+    # METRICS is off by default, so build an app with the middleware and route mounted
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+    for module in (users, dashboard, metrics):
+        app.include_router(module.router)
+
+    def override_get_db():
+        yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    remove = instrument_engine(engine)
+    try:
+        yield TestClient(app)
+    finally:
+        remove()
+
+
+def test_registry_renders_prometheus_text():
+    registry = MetricsRegistry()
+    latency = registry.histogram(LabeledHistogram("latency_seconds", "Latency", [0.1, 1], ["route"]))
+    latency.labels("/a").observe(0.05)
+    latency.labels("/a").observe(2)
+    registry.histogram(Histogram("empty_seconds", "Nothing yet", [1]))
+    registry.collector(lambda: [("queue_depth", "gauge", "Depth", [({"queue": 'q"1'}, 3)])])
+
+    lines = registry.render().splitlines()
+    assert "# TYPE latency_seconds histogram" in lines
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 2' in lines
+    assert 'latency_seconds_count{route="/a"} 2' in lines
+    assert 'empty_seconds_bucket{le="+Inf"} 0' in lines
+    assert 'queue_depth{queue="q\\"1"} 3' in lines
+
+
+def _sample(body, prefix):
+    return next((float(line.split()[-1]) for line in body.splitlines() if line.startswith(prefix)), 0.0)
+
+
+def test_metrics_endpoint_reports_routes_and_queries(metrics_client, auth_headers):
+    queries = 'http_request_db_queries_sum{method="GET",route="/dashboard/"}'
+    before = _sample(metrics_client.get("/metrics").text, queries)
+    metrics_client.get("/dashboard/", headers=auth_headers)
+
+    body = metrics_client.get("/metrics").text
+    assert 'http_request_duration_seconds_count{method="GET",route="/dashboard/",status="200"}' in body
+    assert _sample(body, queries) >= before + 1
+    assert 'password_hash_duration_seconds_count{operation="hash"}' in body
+
+
+def test_metrics_token_is_required_when_set(metrics_client, mocker):
+    mocker.patch.object(settings, "METRICS_TOKEN", "scrape-secret")
+
+    assert metrics_client.get("/metrics").status_code == 401
+    assert metrics_client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+    assert metrics_client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"}).status_code == 200
+
+
+def test_pool_metrics_collector():
+    registry = MetricsRegistry()
+    registry.collector(pool_metrics(lambda: {"sync": app_engine.pool}))
+    assert 'db_pool_checked_out{pool="sync"}' in registry.render()
@@ -0,0 +1,63 @@
+from datetime import date
+
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from sqlalchemy import text
+
+from app.dependencies import Base
+from tests.conftest import SQLALCHEMY_TEST_URL, engine
+
+
+def _reset():
+    Base.metadata.drop_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE IF EXISTS alembic_version"))
+
+
+@pytest.fixture
+def alembic_config():
+    _reset()
+    config = Config("alembic.ini")
+    config.set_main_option("sqlalchemy.url", SQLALCHEMY_TEST_URL)
+    yield config
+    _reset()
+
+
+def test_migrations_match_models(alembic_config):
+    command.upgrade(alembic_config, "head")
+    with engine.connect() as conn:
+        # Partitions are not part of the models
+        context = MigrationContext.configure(conn, opts={
+            "include_object": lambda obj, name, type_, reflected, compare_to:
+                not (type_ == "table" and reflected and name.startswith("audit_logs_")),
+        })
+        assert compare_metadata(context, Base.metadata) == []
+
+
+def test_upgrade_from_baseline_backfills_and_partitions_audit_logs(alembic_config):
+    command.upgrade(alembic_config, "0001")
+    today = date.today()
+    earlier = date(today.year - 1, today.month, 1)
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO users (id, email, password_hash) VALUES ('u', 'u@x.com', 'h')"))
+        conn.execute(text("""
+            INSERT INTO assessments (id, user_id, date, tired_score, capable_score, meaningful_score, submitted_at)
+            VALUES ('old', 'u', :day, 1, 1, 1, now() - interval '1 hour'), ('new', 'u', :day, 5, 5, 5, now())
+        """), {"day": today})
+        conn.execute(text("INSERT INTO predictions (id, assessment_id) VALUES ('p', 'old'), ('p2', 'new')"))
+        conn.execute(text("INSERT INTO daily_summary_rolling_7d (id, user_id, avg_tired_last_7_days) "
+                          "VALUES ('s', 'u', 3.0)"))
+        conn.execute(text("INSERT INTO audit_logs (id, user_id, action, timestamp) VALUES "
+                          "('a1', 'u', 'login', now()), ('a2', 'u', 'login', :earlier)"), {"earlier": earlier})
+
+    command.upgrade(alembic_config, "head")
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT id FROM assessments")).scalars().all() == ["new"]
+        assert conn.execute(text("SELECT id, user_id FROM predictions")).all() == [("p2", "u")]
+        assert conn.execute(text("SELECT is_admin FROM users")).scalars().all() == [False]
+        assert conn.execute(text("SELECT count(*) FROM daily_summary_rolling_7d")).scalar() == 0
+        rows = conn.execute(text("SELECT tableoid::regclass::text, id FROM audit_logs ORDER BY id")).all()
+        assert rows == [(f"audit_logs_{today:%Y_%m}", "a1"), (f"audit_logs_{earlier:%Y_%m}", "a2")]
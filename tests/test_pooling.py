@@ -0,0 +1,30 @@
+import pytest
+from sqlalchemy import create_engine, exc
+
+from app.pooling import InstrumentedQueuePool
+from tests.conftest import SQLALCHEMY_TEST_URL, make_admin
+
+
+def test_pool_counts_checkouts_and_timeouts():
+    engine = create_engine(SQLALCHEMY_TEST_URL, poolclass=InstrumentedQueuePool,
+                           pool_size=1, max_overflow=0, pool_timeout=0.05)
+    waits = engine.pool.wait.snapshot()["count"]
+    try:
+        with engine.connect():
+            assert engine.pool.stats()["checked_out"] == 1
+            with pytest.raises(exc.TimeoutError):
+                engine.connect()
+        stats = engine.pool.stats()
+        assert (stats["checkouts"], stats["timeouts"], stats["checked_out"]) == (1, 1, 0)
+        assert stats["wait_seconds"]["count"] == waits + 1
+    finally:
+        engine.dispose()
+
+
+def test_pool_stats_require_admin(client, db, auth_headers):
+    assert client.get("/admin/pool", headers=auth_headers).status_code == 403
+
+    make_admin(db)
+    response = client.get("/admin/pool", headers=auth_headers)
+    assert response.status_code == 200
+    assert {"size", "checked_out", "overflow", "timeouts", "wait_seconds"} <= set(response.json()["sync"])
@@ -0,0 +1,152 @@
+import os
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from app import predict
+from app.model_registry import _measure
+from tests.conftest import make_admin
+
+# Every 7-day mean of integer 0-6 scores, plus a few off-lattice rows
+GRID = np.arange(43) / 7.0
+LATTICE = np.stack(np.meshgrid(GRID, GRID, GRID, indexing="ij"), axis=-1).reshape(-1, 3)
+OFF_LATTICE = np.array([[3.05, 2.5, 4.1], [0.0, 6.0, 6.0], [6.0, 0.0, 0.0], [2.333, 4.9, 1.01]])
+
+
+def _artifacts():
+    reg = predict.registry
+    return (
+        reg.artifact(predict.SCALER_FILE),
+        reg.artifact("logistic_regression_model.pkl"),
+        reg.artifact(predict.LABEL_ENCODER_FILE),
+    )
+
+
+def _engine():
+    return predict.registry.get("logistic_regression", "1").model
+
+
+def _sklearn_predict(X):
+    scaler, lr, label_enc = _artifacts()
+    scaled = scaler.transform(X)
+    labels = label_enc.inverse_transform(lr.predict(scaled))
+    return labels, lr.predict_proba(scaled)
+
+
+@pytest.mark.parametrize("X", [LATTICE, OFF_LATTICE])
+def test_engine_matches_sklearn_exactly(X):
+    ref_labels, ref_proba = _sklearn_predict(X)
+
+    engine = predict.LogisticRegressionEngine(*_artifacts())
+    proba = engine.predict_proba(X)
+    labels, confidences = engine.predict(X)
+
+    np.testing.assert_array_equal(proba, ref_proba)
+    np.testing.assert_array_equal(labels, ref_labels)
+    np.testing.assert_array_equal(confidences, ref_proba.max(axis=1))
+
+
+def test_single_row_and_batch_agree():
+    batch = predict.predict_burnout_batch(OFF_LATTICE)
+    singles = [predict.predict_burnout(*row) for row in OFF_LATTICE]
+    assert batch == singles
+    for result in singles:
+        assert result["label"] in ["Low", "Moderate", "High"]
+        assert result["burnout_risk"] == (result["label"] == "High")
+        assert isinstance(result["confidence"], float)
+
+
+def test_lookup_table_matches_live_scoring(tmp_path):
+    table = predict.PredictionTable.load_or_build(_engine(), str(tmp_path), key="test")
+    assert isinstance(table.records, np.memmap)
+
+    labels, confidences = _engine().predict(LATTICE)
+    for row, label, conf in zip(LATTICE[::211], labels[::211], confidences[::211]):
+        assert table.lookup(*row) == (label, conf)
+    for row in OFF_LATTICE[[0, 3]]:
+        assert table.lookup(*row) is None
+
+
+def test_batch_uses_table_with_live_fallback(monkeypatch):
+    X = np.vstack([LATTICE[::997], OFF_LATTICE])
+    expected = predict.predict_burnout_batch(X)
+
+    monkeypatch.setattr(_engine(), "table", predict.PredictionTable.build(_engine()))
+    assert predict.predict_burnout_batch(X) == expected
+    assert [predict.predict_burnout(*row) for row in X] == expected
+
+
+@pytest.mark.parametrize("name", ["random_forest", "xgboost"])
+def test_tree_models_match_sklearn(name):
+    entry = predict.registry.get(name, "1")
+    model = predict.registry.artifact(f"{name}_model.pkl")
+    _, _, label_enc = _artifacts()
+
+    results = predict.predict_burnout_batch(OFF_LATTICE, model=name, version="1")
+
+    proba = model.predict_proba(OFF_LATTICE)
+    assert [r["label"] for r in results] == list(label_enc.inverse_transform(model.predict(OFF_LATTICE)))
+    assert [r["confidence"] for r in results] == list(proba.max(axis=1))
+    assert {r["model_version"] for r in results} == {entry.tag}
+
+
+def test_registry_loads_lazily_and_reports_stats():
+    reg = predict.ModelRegistry(predict.MODEL_DIR)
+    predict_entry = predict.registry.entry("logistic_regression", "1")
+    reg.register("logistic_regression", "1", predict_entry.artifacts, predict_entry.builder)
+
+    assert reg.stats()[0]["loaded"] is False
+    assert reg.artifact_stats() == {}
+
+    entry = reg.get("logistic_regression", "1")
+    stats = reg.stats()[0]
+    assert entry.tag == "logistic_regression@1"
+    assert stats["loaded"] is True
+    assert stats["load_seconds"] > 0
+    assert stats["memory_bytes"] > 0
+    assert stats["artifact_bytes"] == sum(os.path.getsize(path) for path in reg.paths(entry))
+    assert set(reg.artifact_stats()) == set(predict_entry.artifacts)
+    assert not tracemalloc.is_tracing()
+    with pytest.raises(KeyError):
+        reg.get("logistic_regression", "2")
+
+
+def test_batcher_coalesces_concurrent_requests():
+    from app.batching import InferenceBatcher
+
+    batcher = InferenceBatcher(max_batch_size=8, max_wait_ms=20)
+    rows = [tuple(row) for row in LATTICE[::4001]]
+    try:
+        with ThreadPoolExecutor(max_workers=len(rows)) as pool:
+            results = list(pool.map(lambda row: batcher.predict(*row), rows))
+    finally:
+        batcher.close()
+
+    assert results == [predict.predict_burnout(*row) for row in rows]
+    stats = batcher.stats()
+    assert stats["batch_size"]["sum"] == len(rows)
+    assert stats["batch_size"]["count"] < len(rows)
+    assert stats["queue_wait_seconds"]["count"] == len(rows)
+
+
+def test_model_stats_require_admin(client, db, auth_headers):
+    assert client.get("/admin/models", headers=auth_headers).status_code == 403
+    make_admin(db)
+
+    response = client.get("/admin/models", headers=auth_headers)
+    assert response.status_code == 200
+    assert {(m["name"], m["version"]) for m in response.json()} >= {("logistic_regression", "1")}
+
+
+def test_overlapping_loads_share_tracing():
+    def load():
+        time.sleep(0.02)
+        return bytearray(1 << 20)
+
+    with ThreadPoolExecutor(4) as pool:
+        results = list(pool.map(lambda _: _measure(load, []), range(4)))
+
+    assert all(stats.memory_bytes >= 1 << 20 for _, stats in results)
+    assert not tracemalloc.is_tracing()
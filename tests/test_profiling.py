@@ -0,0 +1,60 @@
+import time
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.profiling import ProfilingMiddleware, install
+
+
+def _spin(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def slow_dependency():
+    _spin(0.02)
+    return 1
+
+
+def _profiled_app(directory, **options):
+    app = FastAPI()
+
+    @app.get("/work")
+    def work(value: int = Depends(slow_dependency)):
+        _spin(0.05)
+        return {"value": value}
+
+    install(app)
+    app.add_middleware(ProfilingMiddleware, directory=str(directory), interval_ms=1, **options)
+    return TestClient(app)
+
+
+def test_selected_request_writes_folded_stacks(tmp_path):
+    client = _profiled_app(tmp_path, token="letmein")
+
+    response = client.get("/work", headers={"X-Profile": "letmein"})
+
+    assert response.json() == {"value": 1}
+    name = response.headers["x-profile-id"]
+    lines = (tmp_path / f"{name}.folded").read_text().splitlines()
+    stacks = [line.rsplit(" ", 1)[0] for line in lines]
+    assert all(int(line.rsplit(" ", 1)[1]) > 0 for line in lines)
+    assert any(stack.startswith("work (") and "_spin" in stack for stack in stacks)
+    assert any(stack.startswith("slow_dependency (") for stack in stacks)
+
+
+def test_unselected_requests_are_not_profiled(tmp_path):
+    client = _profiled_app(tmp_path, token="letmein")
+
+    assert "x-profile-id" not in client.get("/work").headers
+    assert "x-profile-id" not in client.get("/work", headers={"X-Profile": "wrong"}).headers
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_sample_rate_selects_requests(tmp_path):
+    client = _profiled_app(tmp_path, sample_rate=1.0)
+
+    response = client.get("/work")
+
+    assert (tmp_path / f"{response.headers['x-profile-id']}.folded").exists()
@@ -0,0 +1,65 @@
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import select, text
+
+from app.models import User
+from app.query_budget import QueryRecorder
+from tests.conftest import engine
+
+SCORES = {"tired_score": 3, "capable_score": 2, "meaningful_score": 4}
+
+
+def test_recorder_flags_repeated_statements(db):
+    with QueryRecorder(engine) as queries:
+        for i in range(3):
+            db.execute(text("SELECT :i"), {"i": i})
+        db.execute(select(User))
+
+    assert queries.count == 4
+    assert queries.repeated() == {"SELECT %(i)s": 3}
+    with pytest.raises(AssertionError, match="possible N\\+1: 3x SELECT"):
+        queries.assert_budget(max_statements=10)
+    queries.assert_budget(max_statements=4, max_repeats=3)
+
+
+def test_login_budget(client, auth_headers):
+    with QueryRecorder(engine) as queries:
+        client.post("/users/login", data={"username": "testuser@example.com", "password": "testpass"})
+    # user, last_login, audit
+    queries.assert_budget(max_statements=3)
+
+
+def test_submit_assessment_budget(client, auth_headers):
+    with QueryRecorder(engine) as queries:
+        assert client.post("/assessments/", json=SCORES, headers=auth_headers).status_code == 200
+    # user, summary lookup, window sums, summary insert, upsert, summary update, audit
+    queries.assert_budget(max_statements=7)
+
+    with QueryRecorder(engine) as queries:
+        client.post("/assessments/", json=SCORES, headers=auth_headers)
+    # Today's summary exists now, so the resubmission only applies the delta
+    queries.assert_budget(max_statements=5)
+
+
+def test_bulk_import_budget_does_not_grow_with_rows(client, auth_headers):
+    today = date.today()
+    rows = [{**SCORES, "date": (today - timedelta(days=i)).isoformat()} for i in range(30)]
+    with QueryRecorder(engine) as queries:
+        assert client.post("/assessments/bulk", json={"assessments": rows}, headers=auth_headers).status_code == 200
+    # user, upsert, summary clear + fill, summaries, prediction upsert, audit
+    queries.assert_budget(max_statements=7)
+
+
+def test_dashboard_budget(client, auth_headers):
+    client.post("/assessments/", json=SCORES, headers=auth_headers)
+    with QueryRecorder(engine) as queries:
+        assert client.get("/dashboard/", headers=auth_headers).status_code == 200
+    # user, predictions
+    queries.assert_budget(max_statements=2)
+
+
+def test_profile_update_budget(client, auth_headers):
+    with QueryRecorder(engine) as queries:
+        client.put("/users/profile", json={"full_name": "Renamed"}, headers=auth_headers)
+    queries.assert_budget(max_statements=3)
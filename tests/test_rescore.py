@@ -0,0 +1,55 @@
+import argparse
+from datetime import date, timedelta
+
+from app.models import Assessment, Prediction, User
+from scripts.rescore import load_checkpoint, rescore_shard, save_checkpoint, shard_bounds
+
+
+def _args(tmp_path, **overrides):
+    options = dict(model="random_forest", version="1", chunk_size=2, checkpoint_dir=str(tmp_path), restart=False)
+    return argparse.Namespace(**{**options, **overrides})
+
+
+def _user_with_history(db, user_id, days):
+    db.add(User(id=user_id, email=f"{user_id}@example.com", password_hash="x"))
+    for i in range(days):
+        db.add(Assessment(user_id=user_id, date=date.today() - timedelta(days=i),
+                          tired_score=5, capable_score=1, meaningful_score=1))
+    db.commit()
+
+
+def test_shard_bounds_cover_every_id():
+    assert shard_bounds(1) == [(None, None)]
+    assert shard_bounds(4) == [(None, "40000000"), ("40000000", "80000000"), ("80000000", "c0000000"), ("c0000000", None)]
+
+
+def test_rescore_writes_latest_predictions_and_resumes(db, tmp_path):
+    for user_id in ("a", "b", "c"):
+        _user_with_history(db, user_id, 8)
+    _user_with_history(db, "short", 3)
+
+    assert rescore_shard(0, 1, _args(tmp_path)) == 3
+    predictions = db.query(Prediction).order_by(Prediction.user_id).all()
+    assert [p.user_id for p in predictions] == ["a", "b", "c"]
+    assert {p.model_version for p in predictions} == {"random_forest@1"}
+    latest = {a.id for a in db.query(Assessment).filter(Assessment.date == date.today())}
+    assert {p.assessment_id for p in predictions} <= latest
+
+    checkpoint = load_checkpoint(tmp_path / "rescore-random_forest-1-1-of-1.json")
+    assert checkpoint == {"last_user_id": "c", "scored": 3, "done": True}
+    # A finished range is skipped; --restart re-scores it in place
+    assert rescore_shard(0, 1, _args(tmp_path)) == 3
+    assert rescore_shard(0, 1, _args(tmp_path, restart=True, model="xgboost")) == 3
+    db.expire_all()
+    assert db.query(Prediction).count() == 3
+    assert {p.model_version for p in db.query(Prediction)} == {"xgboost@1"}
+
+
+def test_rescore_resumes_after_checkpointed_user(db, tmp_path):
+    for user_id in ("a", "b", "c"):
+        _user_with_history(db, user_id, 7)
+    save_checkpoint(str(tmp_path / "rescore-random_forest-1-1-of-1.json"),
+                    {"last_user_id": "a", "scored": 1, "done": False})
+
+    assert rescore_shard(0, 1, _args(tmp_path)) == 3
+    assert [p.user_id for p in db.query(Prediction).order_by(Prediction.user_id)] == ["b", "c"]
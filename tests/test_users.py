@@ -1,3 +1,7 @@
+from app.hashing import PasswordHasher, build_context
+from app.models import User
+
+
 def test_register_user(client):
     response = client.post("/users/register", json={
         "email": "testuser@example.com",
@@ -64,3 +68,45 @@ def test_password_recover(client, mocker):
     })
     assert response.status_code == 200
     assert response.json()["msg"] == "Password reset email sent"
+
+def test_login_rehashes_outdated_password(client, db, mocker):
+    weak = PasswordHasher(time_cost=1, memory_cost=1024, parallelism=1)
+    client.post("/users/register", json={
+        "email": "testuser@example.com",
+        "password": "TestPassword123!",
+        "full_name": "Test User"
+    })
+    user = db.query(User).filter_by(email="testuser@example.com").one()
+    user.password_hash = weak.hash("TestPassword123!")
+    db.commit()
+    old_hash = user.password_hash
+
+    # Restore the configured parameters; the weak hash now needs an update
+    mocker.patch("app.routers.users.password_hasher", PasswordHasher())
+    response = client.post("/users/login", data={
+        "username": "testuser@example.com",
+        "password": "TestPassword123!"
+    })
+    assert response.status_code == 200
+    db.refresh(user)
+    assert user.password_hash != old_hash
+    assert "m=65536,t=3,p=4" in user.password_hash
+
+def test_password_hash_pool():
+    hasher = PasswordHasher(time_cost=1, memory_cost=1024, parallelism=1, workers=1)
+    try:
+        hashed = hasher.hash("TestPassword123!")
+        assert hasher.verify_and_update("TestPassword123!", hashed) == (True, None)
+        assert hasher.verify_and_update("wrong", hashed) == (False, None)
+        assert hasher.verify("TestPassword123!", hashed) is True
+    finally:
+        hasher.close()
+
+def test_plain_verify_skips_rehash(mocker):
+    outdated = build_context(1, 1024, 1).hash("TestPassword123!")
+    hasher = PasswordHasher(time_cost=1, memory_cost=2048, parallelism=1)
+    rehash = mocker.spy(hasher.context, "hash")
+
+    assert hasher.verify("TestPassword123!", outdated) is True
+    rehash.assert_not_called()
+    assert hasher.verify_and_update("TestPassword123!", outdated)[1] is not None